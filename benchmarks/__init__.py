@@ -0,0 +1,14 @@
+"""
+.. moduleauthor:: Dave Faulkmore <https://mastodon.social/@msftcangoblowme>
+
+Benchmarks of the hot paths. Offline, against a generated Sphinx source folder
+
+- :py:mod:`benchmarks.generate` -- synthetic ToC and document files
+
+- :py:mod:`benchmarks.run` -- time each hot path. Save and compare JSON results
+
+.. code-block:: shell
+
+   python -m benchmarks --docs 10000 --depth 4 --fan-out 10 -o results.json
+
+"""
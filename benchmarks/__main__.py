@@ -0,0 +1,126 @@
+"""
+.. moduleauthor:: Dave Faulkmore <https://mastodon.social/@msftcangoblowme>
+
+Entrypoint ``python -m benchmarks``
+
+.. code-block:: shell
+
+   python -m benchmarks --docs 10000 --glob-ratio 0.05 -o after.json \
+   --compare before.json
+
+"""
+
+from __future__ import annotations
+
+import json
+import tempfile
+from pathlib import Path
+
+import click
+
+from sphinx_external_toc_strict.parsing_shared import FILE_FORMATS
+
+from .run import (
+    compare_results,
+    load_results,
+    run_benchmarks,
+)
+
+
+@click.command(context_settings={"help_option_names": ["-h", "--help"]})
+@click.option("--docs", default=1000, show_default=True, help="Document count")
+@click.option("--depth", default=3, show_default=True, help="Maximum depth")
+@click.option(
+    "--fan-out",
+    default=10,
+    show_default=True,
+    help="Maximum child documents per document",
+)
+@click.option(
+    "--glob-ratio", default=0.0, show_default=True, help="Glob items per file item"
+)
+@click.option(
+    "--url-ratio", default=0.0, show_default=True, help="Url items per file item"
+)
+@click.option(
+    "--ref-ratio", default=0.0, show_default=True, help="Ref items per file item"
+)
+@click.option(
+    "-f",
+    "--file-format",
+    type=click.Choice(list(FILE_FORMATS)),
+    default=list(FILE_FORMATS)[0],
+    show_default=True,
+    help="ToC file format",
+)
+@click.option(
+    "--suffix",
+    type=click.Choice([".rst", ".md"]),
+    default=".rst",
+    show_default=True,
+    help="Document file suffix",
+)
+@click.option(
+    "--orphans", default=0, show_default=True, help="Document files not in the ToC"
+)
+@click.option("--repeat", default=3, show_default=True, help="Runs per hot path")
+@click.option("--seed", default=0, show_default=True, help="Random seed")
+@click.option(
+    "--srcdir",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=None,
+    help="Generate Sphinx source folder here and keep it. Default temporary",
+)
+@click.option(
+    "-o",
+    "--output",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Save results as JSON",
+)
+@click.option(
+    "--compare",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    default=None,
+    help="Results JSON of an earlier run",
+)
+def main(srcdir, output, compare, **kwargs):
+    """Benchmark parse, dump, exclude, diff, and insert toctrees hot paths
+
+    :param srcdir: Sphinx source folder. None for a temporary folder
+    :type srcdir: pathlib.Path | None
+    :param output: results JSON file path
+    :type output: pathlib.Path | None
+    :param compare: earlier results JSON file path
+    :type compare: pathlib.Path | None
+    :param kwargs: forwarded to run_benchmarks
+    :type kwargs: typing.Any
+    """
+    if srcdir is None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            results = run_benchmarks(tmp_dir, **kwargs)
+    else:
+        results = run_benchmarks(srcdir, **kwargs)
+
+    for name, summary in results["benchmarks"].items():
+        click.echo(
+            f"{name:<16}{summary['min'] * 1000:>12.2f} ms"
+            f"{summary['median'] * 1000:>12.2f} ms"
+        )
+
+    if compare is not None:
+        click.echo(f"compared to {compare}")
+        rows = compare_results(load_results(compare), results)
+        for name, (_, _, ratio) in rows.items():
+            click.echo(f"{name:<16}{ratio:>12.2f}x")
+    else:  # pragma: no cover
+        pass
+
+    if output is not None:
+        output.write_text(json.dumps(results, indent=2), encoding="utf8")
+    else:  # pragma: no cover
+        pass
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,227 @@
+"""
+.. moduleauthor:: Dave Faulkmore <https://mastodon.social/@msftcangoblowme>
+
+Generate a synthetic site map and the Sphinx source folder it describes
+
+Documents are added breadth first. Each document, above the maximum depth,
+gets one toctree with up to ``fan_out`` child documents. Child documents of
+``d0`` are in folder ``d0/``.
+
+Besides file items, a toctree gets glob, url, and ref items. Each ratio is
+the chance, per file item, of also adding an item of that kind. A glob
+item, e.g. ``d0/g1/*``, matches :py:data:`GLOB_FILES` documents which are
+not in the site map.
+
+.. py:data:: __all__
+   :type: tuple[str, str, str, str]
+   :value: ("GLOB_FILES", "ROOT_DOCNAME", "generate_site_map", "write_project")
+
+   Module exports
+
+.. py:data:: GLOB_FILES
+   :type: int
+   :value: 2
+
+   Document files written per glob item
+
+.. py:data:: ROOT_DOCNAME
+   :type: str
+   :value: "index"
+
+   Root document docname
+
+"""
+
+from __future__ import annotations
+
+import random
+from collections import deque
+from pathlib import Path
+
+from sphinx_external_toc_strict.api import (
+    Document,
+    FileItem,
+    GlobItem,
+    RefItem,
+    SiteMap,
+    TocTree,
+    UrlItem,
+)
+from sphinx_external_toc_strict.parsing_shared import FILE_FORMATS
+from sphinx_external_toc_strict.parsing_strictyaml import dump_yaml
+
+__all__ = (
+    "GLOB_FILES",
+    "ROOT_DOCNAME",
+    "generate_site_map",
+    "write_project",
+)
+
+GLOB_FILES = 2
+ROOT_DOCNAME = "index"
+
+_CONF_TEMPLATE = """\
+extensions = {extensions!r}
+external_toc_path = "_toc.yml"
+external_toc_exclude_missing = True
+intersphinx_mapping = {{}}
+source_suffix = {{{suffix!r}: {parser!r}}}
+"""
+
+
+def generate_site_map(
+    docs=1000,
+    depth=3,
+    fan_out=10,
+    glob_ratio=0.0,
+    url_ratio=0.0,
+    ref_ratio=0.0,
+    file_format="default",
+    seed=0,
+):
+    """Generate a site map. Same arguments, same site map
+
+    :param docs: Default 1000. Document count, including the root document
+    :type docs: int
+    :param depth: Default 3. Maximum depth. Root document is depth 0
+    :type depth: int
+    :param fan_out: Default 10. Maximum child documents per document
+    :type fan_out: int
+    :param glob_ratio: Default 0.0. Glob items per file item
+    :type glob_ratio: float
+    :param url_ratio: Default 0.0. Url items per file item
+    :type url_ratio: float
+    :param ref_ratio: Default 0.0. Ref items per file item
+    :type ref_ratio: float
+    :param file_format: Default "default". ToC file format
+    :type file_format: str
+    :param seed: Default 0. Random seed for choosing the extra items
+    :type seed: int
+    :returns:
+
+       Site map. Fewer than ``docs`` documents, if ``depth`` and ``fan_out``
+       do not allow that many
+
+    :rtype: sphinx_external_toc_strict.api.SiteMap
+    :raises:
+
+       - :py:exc:`ValueError` -- unsupported file format or docs less than 1
+
+    """
+    if file_format not in FILE_FORMATS:
+        msg_exc = f"Unsupported file format {file_format!r}"
+        raise ValueError(msg_exc)
+    elif docs < 1:
+        msg_exc = f"Expecting at least one document got {docs!r}"
+        raise ValueError(msg_exc)
+    else:  # pragma: no cover
+        pass
+
+    rng = random.Random(seed)
+    titlesonly = FILE_FORMATS[file_format].toc_defaults.get("titlesonly", False)
+    root = Document(ROOT_DOCNAME)
+    # a ToC file without format key is parsed as file format None
+    site_map = SiteMap(
+        root, file_format=None if file_format == "default" else file_format
+    )
+    count = 1
+    glob_count = 0
+    extra_count = 0
+    # Each entry: (document, folder, depth)
+    queue = deque([(root, "", 0)])
+    while queue and count < docs:
+        doc, folder, level = queue.popleft()
+        if level >= depth:
+            continue
+        else:  # pragma: no cover
+            pass
+
+        items = []
+        for idx in range(min(fan_out, docs - count)):
+            docname = f"{folder}d{idx}"
+            child = Document(docname)
+            site_map[docname] = child
+            queue.append((child, f"{docname}/", level + 1))
+            items.append(FileItem(docname))
+            count += 1
+            if rng.random() < glob_ratio:
+                items.append(GlobItem(f"{folder}g{glob_count}/*"))
+                glob_count += 1
+            else:  # pragma: no cover
+                pass
+            if rng.random() < url_ratio:
+                url = f"https://example.com/{extra_count}"
+                items.append(UrlItem(url, f"Url {extra_count}"))
+                extra_count += 1
+            else:  # pragma: no cover
+                pass
+            if rng.random() < ref_ratio:
+                items.append(RefItem(f"ref-{extra_count}", f"Ref {extra_count}"))
+                extra_count += 1
+            else:  # pragma: no cover
+                pass
+        doc.subtrees.append(TocTree(items, titlesonly=titlesonly))
+        # set again, so the site map indexes the toctree's globs
+        site_map[doc.docname] = doc
+
+    return site_map
+
+
+def write_project(site_map, srcdir, suffix=".rst", orphans=0):
+    """Write ``_toc.yml``, ``conf.py``, and document files
+
+    :param site_map: generated site map
+    :type site_map: sphinx_external_toc_strict.api.SiteMap
+    :param srcdir: Sphinx source folder. Created if need be
+    :type srcdir: str | pathlib.Path
+    :param suffix: Default ".rst". Document file suffix, ".rst" or ".md"
+    :type suffix: str
+    :param orphans:
+
+       Default 0. Document files written which are not in the ToC. Excluded
+       by option ``external_toc_exclude_missing``
+
+    :type orphans: int
+    :returns: document files written, including glob matched and orphans
+    :rtype: int
+    :raises:
+
+       - :py:exc:`ValueError` -- unsupported suffix
+
+    """
+    if suffix == ".rst":
+        extensions = ["sphinx_external_toc_strict", "sphinx.ext.intersphinx"]
+        parser = "restructuredtext"
+        heading = "{title}\n{underline}\n"
+    elif suffix == ".md":
+        extensions = [
+            "sphinx_external_toc_strict",
+            "sphinx.ext.intersphinx",
+            "myst_parser",
+        ]
+        parser = "markdown"
+        heading = "# {title}\n"
+    else:
+        msg_exc = f"Expecting suffix .rst or .md got {suffix!r}"
+        raise ValueError(msg_exc)
+
+    path_srcdir = Path(srcdir)
+    path_srcdir.mkdir(parents=True, exist_ok=True)
+    path_srcdir.joinpath("_toc.yml").write_text(dump_yaml(site_map), encoding="utf8")
+    conf = _CONF_TEMPLATE.format(extensions=extensions, suffix=suffix, parser=parser)
+    path_srcdir.joinpath("conf.py").write_text(conf, encoding="utf8")
+
+    docnames = list(site_map)
+    for glob in sorted(site_map.globs()):
+        folder = glob[: -len("/*")]
+        docnames.extend(f"{folder}/p{idx}" for idx in range(GLOB_FILES))
+    docnames.extend(f"orphan{idx}" for idx in range(orphans))
+
+    for docname in docnames:
+        path_doc = path_srcdir.joinpath(f"{docname}{suffix}")
+        path_doc.parent.mkdir(parents=True, exist_ok=True)
+        title = docname.rsplit("/", 1)[-1]
+        contents = heading.format(title=title, underline="=" * len(title))
+        path_doc.write_text(contents, encoding="utf8")
+
+    return len(docnames)
@@ -0,0 +1,339 @@
+"""
+.. moduleauthor:: Dave Faulkmore <https://mastodon.social/@msftcangoblowme>
+
+Time the hot paths against a generated Sphinx source folder
+
+- ``parse`` -- :py:func:`~sphinx_external_toc_strict.parsing_strictyaml.parse_toc_yaml`
+
+- ``create_toc_dict`` -- :py:func:`~sphinx_external_toc_strict.parsing_shared.create_toc_dict`
+
+- ``dump_yaml`` -- :py:func:`~sphinx_external_toc_strict.parsing_strictyaml.dump_yaml`
+
+- ``new_excluded`` -- :py:meth:`~sphinx_external_toc_strict.api.SiteMap.new_excluded`
+
+- ``manifest_tree`` -- :py:func:`~sphinx_external_toc_strict.manifest.manifest_tree`,
+  over every file of the source folder
+
+- ``insert_toctrees`` -- :py:func:`~sphinx_external_toc_strict.events.insert_toctrees`,
+  once per document with toctrees. Uses a Sphinx app. intersphinx has no
+  inventories, so nothing is downloaded
+
+Each is run ``repeat`` times. Both the fastest and the median run are kept.
+
+.. py:data:: __all__
+   :type: tuple[str, str, str, str]
+   :value: ("BENCHMARKS", "compare_results", "load_results", "run_benchmarks")
+
+   Module exports
+
+.. py:data:: BENCHMARKS
+   :type: tuple[str, str, str, str, str, str, str]
+   :value: ("parse", "create_toc_dict", "dump_yaml", "new_excluded", \
+   "manifest_tree", "get_changed", "insert_toctrees")
+
+   Timed hot paths
+
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import pickle
+import platform
+import statistics
+import time
+from pathlib import Path
+
+import sphinx
+from docutils import nodes
+from sphinx.application import Sphinx
+from sphinx.util.docutils import (
+    docutils_namespace,
+    new_document,
+)
+
+from sphinx_external_toc_strict.events import (
+    add_changed_toctrees,
+    insert_toctrees,
+)
+from sphinx_external_toc_strict.manifest import manifest_tree
+from sphinx_external_toc_strict.parsing_shared import create_toc_dict
+from sphinx_external_toc_strict.parsing_strictyaml import (
+    dump_yaml,
+    parse_toc_yaml,
+)
+from sphinx_external_toc_strict.stats import ParseStats
+
+from .generate import (
+    generate_site_map,
+    write_project,
+)
+
+__all__ = (
+    "BENCHMARKS",
+    "compare_results",
+    "load_results",
+    "run_benchmarks",
+)
+
+BENCHMARKS = (
+    "parse",
+    "create_toc_dict",
+    "dump_yaml",
+    "new_excluded",
+    "manifest_tree",
+    "get_changed",
+    "insert_toctrees",
+)
+
+
+def _summarize(seconds):
+    """Fastest and median run
+
+    :param seconds: wall time of each run
+    :type seconds: list[float]
+    :returns: summary of the runs
+    :rtype: dict[str, typing.Any]
+
+    :meta private:
+    """
+    ret = {
+        "min": min(seconds),
+        "median": statistics.median(seconds),
+        "runs": seconds,
+    }
+
+    return ret
+
+
+def _time_calls(func, repeat, setup=None):
+    """Time a callable. Setup, if any, is not timed
+
+    :param func: callable. Passed the setup return value, if there is setup
+    :type func: collections.abc.Callable[..., typing.Any]
+    :param repeat: run count
+    :type repeat: int
+    :param setup: Default None. Called before each run
+    :type setup: collections.abc.Callable[[], typing.Any] | None
+    :returns: wall time of each run
+    :rtype: list[float]
+
+    :meta private:
+    """
+    ret = []
+    for _ in range(repeat):
+        args = () if setup is None else (setup(),)
+        time_start = time.perf_counter()
+        func(*args)
+        ret.append(time.perf_counter() - time_start)
+
+    return ret
+
+
+def _time_insert_toctrees(srcdir, suffix, repeat):
+    """Time inserting the toctrees of every document, which has toctrees
+
+    :param srcdir: generated Sphinx source folder
+    :type srcdir: pathlib.Path
+    :param suffix: document file suffix
+    :type suffix: str
+    :param repeat: run count
+    :type repeat: int
+    :returns: wall time of each run
+    :rtype: list[float]
+
+    :meta private:
+    """
+    build_dir = srcdir / "_build"
+    with docutils_namespace():
+        app = Sphinx(
+            srcdir,
+            srcdir,
+            build_dir / "html",
+            build_dir / "doctrees",
+            "html",
+            status=None,
+            warning=io.StringIO(),
+            freshenv=True,
+        )
+        env = app.env
+        env.find_files(app.config, app.builder)
+        # moves site map from config to env
+        add_changed_toctrees(app, env, set(), set(), set())
+        docnames = [
+            docname for docname, doc in env.external_site_map.items() if doc.subtrees
+        ]
+
+        def _setup():
+            """Blank doctrees. insert_toctrees modifies them."""
+            doctrees = []
+            for docname in docnames:
+                doctree = new_document(str(srcdir / f"{docname}{suffix}"))
+                doctree.append(nodes.section())
+                doctrees.append((docname, doctree))
+            return doctrees
+
+        def _insert(doctrees):
+            """Insert the toctrees of each document."""
+            for docname, doctree in doctrees:
+                env.prepare_settings(docname)
+                insert_toctrees(app, doctree)
+
+        ret = _time_calls(_insert, repeat, setup=_setup)
+
+    return ret
+
+
+def run_benchmarks(
+    srcdir,
+    docs=1000,
+    depth=3,
+    fan_out=10,
+    glob_ratio=0.0,
+    url_ratio=0.0,
+    ref_ratio=0.0,
+    file_format="default",
+    suffix=".rst",
+    orphans=0,
+    repeat=3,
+    seed=0,
+):
+    """Generate a Sphinx source folder, then time each hot path
+
+    :param srcdir: Sphinx source folder to generate. Should be empty
+    :type srcdir: str | pathlib.Path
+    :param docs: Default 1000. Document count
+    :type docs: int
+    :param depth: Default 3. Maximum depth
+    :type depth: int
+    :param fan_out: Default 10. Maximum child documents per document
+    :type fan_out: int
+    :param glob_ratio: Default 0.0. Glob items per file item
+    :type glob_ratio: float
+    :param url_ratio: Default 0.0. Url items per file item
+    :type url_ratio: float
+    :param ref_ratio: Default 0.0. Ref items per file item
+    :type ref_ratio: float
+    :param file_format: Default "default". ToC file format
+    :type file_format: str
+    :param suffix: Default ".rst". Document file suffix
+    :type suffix: str
+    :param orphans: Default 0. Document files not in the ToC
+    :type orphans: int
+    :param repeat: Default 3. Runs per hot path
+    :type repeat: int
+    :param seed: Default 0. Random seed
+    :type seed: int
+    :returns: JSON serializable results
+    :rtype: dict[str, typing.Any]
+    """
+    path_srcdir = Path(srcdir)
+    params = {
+        "docs": docs,
+        "depth": depth,
+        "fan_out": fan_out,
+        "glob_ratio": glob_ratio,
+        "url_ratio": url_ratio,
+        "ref_ratio": ref_ratio,
+        "file_format": file_format,
+        "suffix": suffix,
+        "orphans": orphans,
+        "repeat": repeat,
+        "seed": seed,
+    }
+    site_map = generate_site_map(
+        docs=docs,
+        depth=depth,
+        fan_out=fan_out,
+        glob_ratio=glob_ratio,
+        url_ratio=url_ratio,
+        ref_ratio=ref_ratio,
+        file_format=file_format,
+        seed=seed,
+    )
+    files = write_project(site_map, path_srcdir, suffix=suffix, orphans=orphans)
+    path_toc = path_srcdir / "_toc.yml"
+
+    stats = ParseStats()
+    parse_toc_yaml(path_toc, stats=stats)
+
+    times = {}
+    times["parse"] = _time_calls(lambda: parse_toc_yaml(path_toc), repeat)
+    times["create_toc_dict"] = _time_calls(lambda: create_toc_dict(site_map), repeat)
+    times["dump_yaml"] = _time_calls(lambda: dump_yaml(site_map), repeat)
+    times["new_excluded"] = _time_calls(
+        lambda: site_map.new_excluded(path_srcdir, [suffix], ["_build"]),
+        repeat,
+    )
+    manifest = sorted(
+        path.relative_to(path_srcdir).as_posix()
+        for path in path_srcdir.rglob("*")
+        if path.is_file()
+    )
+    times["manifest_tree"] = _time_calls(lambda: manifest_tree(manifest), repeat)
+    # unchanged ToC. Previous site map unpickled from the env, with fingerprints
+    site_map_previous = pickle.loads(pickle.dumps(site_map))
+    times["get_changed"] = _time_calls(
+        lambda site_map_current: site_map_current.get_changed(site_map_previous),
+        repeat,
+        setup=lambda: parse_toc_yaml(path_toc),
+    )
+    times["insert_toctrees"] = _time_insert_toctrees(path_srcdir, suffix, repeat)
+
+    ret = {
+        "params": params,
+        "environment": {
+            "python": platform.python_version(),
+            "sphinx": sphinx.__display_version__,
+        },
+        "files": files,
+        "parse_stats": stats.as_json(),
+        "benchmarks": {name: _summarize(times[name]) for name in BENCHMARKS},
+    }
+
+    return ret
+
+
+def load_results(path):
+    """Load saved results
+
+    :param path: results JSON file
+    :type path: str | pathlib.Path
+    :returns: results
+    :rtype: dict[str, typing.Any]
+    """
+    with Path(path).open(encoding="utf8") as f:
+        ret = json.load(f)
+
+    return ret
+
+
+def compare_results(baseline, results):
+    """Compare fastest runs. A ratio above 1.0 is a slowdown
+
+    Hot paths missing from either results are skipped.
+
+    :param baseline: results of an earlier run
+    :type baseline: dict[str, typing.Any]
+    :param results: results of this run
+    :type results: dict[str, typing.Any]
+    :returns: hot path --> (baseline seconds, seconds, ratio)
+    :rtype: dict[str, tuple[float, float, float]]
+    """
+    before = baseline["benchmarks"]
+    after = results["benchmarks"]
+    ret = {}
+    for name in BENCHMARKS:
+        if name in before and name in after:
+            seconds_before = before[name]["min"]
+            seconds_after = after[name]["min"]
+            if seconds_before > 0:
+                ratio = seconds_after / seconds_before
+            else:  # pragma: no cover
+                ratio = float("inf")
+            ret[name] = (seconds_before, seconds_after, ratio)
+        else:  # pragma: no cover
+            pass
+
+    return ret
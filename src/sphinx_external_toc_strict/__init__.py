@@ -27,6 +27,10 @@ def setup(app):
         InsertToctrees,
         TableofContents,
         add_changed_toctrees,
+        build_glob_table,
+        build_ref_table,
+        build_toctree_templates,
+        clear_read_tables,
         ensure_index_file,
         parse_toc_to_env,
     )
@@ -34,12 +38,21 @@ def setup(app):
     # variables
     app.add_config_value("external_toc_path", "_toc.yml", "env")
     app.add_config_value("external_toc_exclude_missing", False, "env")
+    app.add_config_value("external_toc_cache_dir", None, "")
+    app.add_config_value("external_toc_manifest", None, "env")
+    app.add_config_value("external_toc_loader", "strictyaml", "")
+    app.add_config_value("external_toc_profile", False, "")
 
     # Note: this needs to occur after merge_source_suffix event (priority 800)
     # this cannot be a builder-inited event, since if we change the master_doc
     # it will always mark the config as changed in the env setup and re-build everything
     app.connect("config-inited", parse_toc_to_env, priority=900)
     app.connect("env-get-outdated", add_changed_toctrees)
+    app.connect("env-before-read-docs", build_glob_table)
+    # refs resolved before toctree templates use them
+    app.connect("env-before-read-docs", build_ref_table)
+    app.connect("env-before-read-docs", build_toctree_templates)
+    app.connect("env-updated", clear_read_tables)
     app.add_directive("tableofcontents", TableofContents)
     app.add_transform(InsertToctrees)
     app.connect("build-finished", ensure_index_file)
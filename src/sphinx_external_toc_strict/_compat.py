@@ -23,13 +23,25 @@ dataclasses.dataclass is not a valid type. Create a Protocol?
    Reinventing the wheel. :pypi_org:`attrs` has built-in validators.
    Evidently dataclasses doesn't
 
+.. py:data:: ENV_VALIDATE_TRUSTED
+   :type: str
+   :value: "SPHINX_EXTERNAL_TOC_STRICT_VALIDATE_TRUSTED"
+
+   Debug switch. Environment variable. Set to ``1`` and
+   :py:func:`trusted_construction` no longer skips validation. Also
+   validators are run one by one, rather than the compiled check. Read
+   once, on import
+
 """
 
 from __future__ import annotations
 
 import dataclasses as dc
+import os
 import re
 import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import (
     Any,
     Callable,
@@ -88,16 +100,98 @@ def field(**kwargs: Any) -> Any:
 field.__doc__ = dc.field.__doc__
 
 
-def validate_fields(inst: DataclassProtocol) -> None:
-    """Validate the fields of a dataclass,
-    according to `validator` functions set in the field metadata.
+ENV_VALIDATE_TRUSTED = "SPHINX_EXTERNAL_TOC_STRICT_VALIDATE_TRUSTED"
 
-    This function should be called in the `__post_init__` of the dataclass.
+# True within trusted_construction. Instances are not validated
+_is_trusted: ContextVar[bool] = ContextVar("_is_trusted", default=False)
+
+# dataclass --> compiled check. None if a validator cannot be compiled
+_compiled_checks: dict[type, Callable[[Any], bool] | None] = {}
+
+
+def _is_debug_validate() -> bool:
+    """Check debug switch, environment variable :py:data:`ENV_VALIDATE_TRUSTED`.
+
+    :returns: True if every instance should run every validator
+    :rtype: bool
+    :meta private:
+    """
+    return os.environ.get(ENV_VALIDATE_TRUSTED, "") not in ("", "0")
+
+
+# Per instance, reading the environment costs more than the compiled check
+_debug_validate = _is_debug_validate()
+
+
+@contextmanager
+def trusted_construction() -> Any:
+    """Within this context, dataclass instances skip field validation.
+
+    For bulk construction from already valid data. e.g. site map created
+    from a folder tree. Context local; other threads and async tasks
+    still validate.
+
+    Debug switch, set environment variable :py:data:`ENV_VALIDATE_TRUSTED`
+    to ``1``, before import, and instances are validated anyway.
+
+    :returns: context manager
+    :rtype: collections.abc.Iterator[None]
+    """
+    if _debug_validate:
+        yield
+    else:
+        token = _is_trusted.set(True)
+        try:
+            yield
+        finally:
+            _is_trusted.reset(token)
+
+
+def _compile_check(cls: type) -> Callable[[Any], bool] | None:
+    """From the field validators, compile one check function for a dataclass.
+
+    Each validator provides a ``source`` function, which writes its
+    check as a Python expression. The expressions are joined into one
+    function. No closure calls or :py:func:`dataclasses.fields` lookup
+    per instance.
+
+    :param cls: dataclasses decorated class
+    :type cls: type
+    :returns:
+
+       check function. Returns True if instance is valid. None if any
+       validator does not provide source
+
+    :rtype: collections.abc.Callable[[typing.Any], bool] | None
+    :meta private:
+    """
+    namespace: dict[str, Any] = {}
+    exprs = []
+    for field in dc.fields(cls):
+        if "validator" not in field.metadata:
+            continue
+        validators = field.metadata["validator"]
+        if not isinstance(validators, list):
+            validators = [validators]
+        for validator in validators:
+            source = getattr(validator, "source", None)
+            if source is None:
+                return None
+            exprs.append(source(f"inst.{field.name}", namespace))
+
+    body = " and ".join(f"({expr})" for expr in exprs) if exprs else "True"
+    code = f"def _check(inst):\n    return {body}\n"
+    exec(compile(code, f"<validate {cls.__qualname__}>", "exec"), namespace)
+
+    return cast(Callable[[Any], bool], namespace["_check"])
+
+
+def _validate_fields_each(inst: DataclassProtocol) -> None:
+    """Run each field validator, one by one.
 
-    The validator function should take as input (inst, field, value) and
-    raise an exception if the value is invalid.
     :param inst: A dataclasses decorated class instance
     :type inst: DataclassProtocol
+    :meta private:
     """
     for field in dc.fields(inst):
         if "validator" not in field.metadata:
@@ -109,6 +203,51 @@ def validate_fields(inst: DataclassProtocol) -> None:
             field.metadata["validator"](inst, field, getattr(inst, field.name))
 
 
+def validate_fields(inst: DataclassProtocol) -> None:
+    """Validate the fields of a dataclass,
+    according to `validator` functions set in the field metadata.
+
+    This function should be called in the `__post_init__` of the dataclass.
+
+    The validator function should take as input (inst, field, value) and
+    raise an exception if the value is invalid.
+
+    Validators are compiled, once per class, into one check. Only when
+    the check fails, are the validators run one by one, to raise the
+    exception. Within :py:func:`trusted_construction`, skipped entirely
+
+    :param inst: A dataclasses decorated class instance
+    :type inst: DataclassProtocol
+    """
+    if _is_trusted.get():
+        return
+    elif _debug_validate:
+        _validate_fields_each(inst)
+        return
+    else:  # pragma: no cover
+        pass
+
+    cls = type(inst)
+    try:
+        check = _compiled_checks[cls]
+    except KeyError:
+        check = _compiled_checks[cls] = _compile_check(cls)
+
+    if check is not None:
+        try:
+            is_valid = check(inst)
+        except Exception:
+            is_valid = False
+        if is_valid:
+            return
+        else:  # pragma: no cover
+            pass
+    else:  # pragma: no cover
+        pass
+
+    _validate_fields_each(inst)
+
+
 # https://github.com/python/mypy/issues/12155
 UnionAB = Union[Any, Sequence[Any]]
 ValidatorType = Callable[[Any, dc.Field[Any], UnionAB], None]
@@ -137,6 +276,14 @@ def instance_of(type_: UnionAB) -> ValidatorType:
             )
             raise TypeError(msg_exc)
 
+    def _source(value: str, namespace: dict[str, Any]) -> str:
+        """Check as a Python expression. See :py:func:`_compile_check`."""
+        name = f"_v{len(namespace)}"
+        namespace[name] = type_
+        return f"isinstance({value}, {name})"
+
+    setattr(_validator, "source", _source)
+
     return cast(
         Callable[[Any, dc.Field[Any], Union[Any, Sequence[Any]]], None], _validator
     )
@@ -199,6 +346,14 @@ def matches_re(regex: str | Pattern[str], flags: int = 0) -> ValidatorType:
                 f"'{attr.name}' must match regex {pattern!r} ({value!r} doesn't)"
             )
 
+    def _source(value: str, namespace: dict[str, Any]) -> str:
+        """Check as a Python expression. See :py:func:`_compile_check`."""
+        name = f"_v{len(namespace)}"
+        namespace[name] = match_func
+        return f"{name}({value}) is not None"
+
+    setattr(_validator, "source", _source)
+
     return cast(
         Callable[[Any, dc.Field[Any], Union[Any, Sequence[Any]]], None], _validator
     )
@@ -232,6 +387,17 @@ def optional(validator: ValidatorType) -> ValidatorType:
 
         validator(inst, attr, value)
 
+    source = getattr(validator, "source", None)
+    if source is not None:
+
+        def _source(value: str, namespace: dict[str, Any]) -> str:
+            """Check as a Python expression. See :py:func:`_compile_check`."""
+            return f"{value} is None or ({source(value, namespace)})"
+
+        setattr(_validator, "source", _source)
+    else:  # pragma: no cover
+        pass
+
     return cast(
         Callable[[Any, dc.Field[Any], Union[Any, Sequence[Any]]], None], _validator
     )
@@ -266,6 +432,29 @@ def deep_iterable(
         for member in value:
             member_validator(inst, attr, member)
 
+    member_source = getattr(member_validator, "source", None)
+    if iterable_validator is None:
+        iterable_source = None
+    else:
+        iterable_source = getattr(iterable_validator, "source", None)
+    is_iterable_compilable = iterable_validator is None or iterable_source is not None
+    if member_source is not None and is_iterable_compilable:
+
+        def _source(value: str, namespace: dict[str, Any]) -> str:
+            """Check as a Python expression. See :py:func:`_compile_check`."""
+            member = f"_m{len(namespace)}"
+            namespace[member] = None
+            expr = f"all({member_source(member, namespace)} for {member} in {value})"
+            if iterable_source is not None:
+                expr = f"({iterable_source(value, namespace)}) and {expr}"
+            else:  # pragma: no cover
+                pass
+            return expr
+
+        setattr(_validator, "source", _source)
+    else:  # pragma: no cover
+        pass
+
     return cast(
         Callable[[Any, dc.Field[Any], Union[Any, Sequence[Any]]], None], _validator
     )
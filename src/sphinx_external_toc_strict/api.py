@@ -33,25 +33,40 @@ Whitespace is significant. The empty lines must not include whitespace.
 
 Even if using markdown, the root index file **must be** ``index.rst``
 
+For bulk construction from already valid data, skip field validation
+with context manager,
+:py:func:`~sphinx_external_toc_strict._compat.trusted_construction`.
+Also importable from this module.
+
+.. py:data:: __all__
+   :type: tuple[str, str, str, str, str, str, str, str]
+   :value: ("FileItem", "GlobItem", "UrlItem", "RefItem", "TocTree", \
+   "Document", "SiteMap", "trusted_construction")
+
+   Module exports
+
 """
 
 from __future__ import annotations
 
-import glob
+import hashlib
+import json
+import os
+import re
+import time
 from dataclasses import (
-    asdict,
     dataclass,
+    fields,
+    is_dataclass,
 )
-from pathlib import Path
 from typing import (
     Any,
     Union,
 )
 
 from sphinx.util.matching import (
-    Matcher,
+    _translate_pattern,
     patfilter,
-    patmatch,
 )
 
 from ._compat import (
@@ -61,6 +76,7 @@ from ._compat import (
     instance_of,
     matches_re,
     optional,
+    trusted_construction,
     validate_fields,
 )
 from .constants import (
@@ -68,6 +84,12 @@ from .constants import (
     use_cases,
 )
 from .filename_suffix import stem_natural
+from .manifest import manifest_source_files
+from .matching import (
+    PrefixMatcher,
+    SortedDocnames,
+    expand_globs,
+)
 from .sphinx_node import query_intersphinx
 
 try:
@@ -75,6 +97,20 @@ try:
 except (ModuleNotFoundError, ImportError):  # pragma: no cover
     from typing import MutableMapping
 
+__all__ = (
+    "FileItem",
+    "GlobItem",
+    "UrlItem",
+    "RefItem",
+    "TocTree",
+    "Document",
+    "SiteMap",
+    "trusted_construction",
+)
+
+# Folder mtime within this many ns of a walk is not trusted by the next walk
+_RACY_NS = 2_000_000_000
+
 
 class FileItem(str):
     """A document path in a toctree list.
@@ -276,6 +312,14 @@ class TocTree:
         """
         return [str(item) for item in self.items if isinstance(item, GlobItem)]
 
+    def refs(self):
+        """Get list of intersphinx ref items included in this ToC tree
+
+        :return: ref items
+        :rtype: list[sphinx_external_toc_strict.api.RefItem]
+        """
+        return [item for item in self.items if isinstance(item, RefItem)]
+
 
 @dataclass(**DC_SLOTS)
 class Document:
@@ -325,6 +369,235 @@ class Document:
         """
         return [name for tree in self.subtrees for name in tree.globs()]
 
+    def child_refs(self):
+        """Return all children intersphinx refs.
+
+        :return: child ref items
+        :rtype: list[sphinx_external_toc_strict.api.RefItem]
+        """
+        return [item for tree in self.subtrees for item in tree.refs()]
+
+
+def _document_digest(doc):
+    """Structural hash of one document. Its own fields and toctree items,
+    not the documents those items refer to
+
+    :param doc: a document
+    :type doc: sphinx_external_toc_strict.api.Document
+    :returns: digest
+    :rtype: bytes
+
+    :meta private:
+    """
+    parts = [doc.docname, repr(doc.title)]
+    for tree in doc.subtrees:
+        parts.append(
+            f"toctree {tree.caption!r} {tree.hidden} {tree.maxdepth} "
+            f"{tree.numbered!r} {tree.reversed} {tree.titlesonly}"
+        )
+        for item in tree.items:
+            if isinstance(item, UrlItem):
+                parts.append(f"url {item.url} {item.title!r}")
+            elif isinstance(item, RefItem):
+                parts.append(f"ref {item.ref_id} {item.title!r}")
+            else:
+                # FileItem and GlobItem are str. Type distinguishes them
+                parts.append(f"{type(item).__name__} {item}")
+    ret = hashlib.blake2b("\0".join(parts).encode("utf8"), digest_size=16).digest()
+
+    return ret
+
+
+def _to_json(obj):
+    """Plain JSON data of a dataclass instance. Like
+    :py:func:`dataclasses.asdict`, without deep copying every value
+
+    :param obj: Document, TocTree, toctree item, or plain value
+    :type obj: typing.Any
+    :returns: plain dict, list, str, or scalar
+    :rtype: typing.Any
+
+    :meta private:
+    """
+    if is_dataclass(obj):
+        ret = {
+            field_.name: _to_json(getattr(obj, field_.name)) for field_ in fields(obj)
+        }
+    elif isinstance(obj, str):
+        # FileItem and GlobItem are str subclasses
+        ret = str(obj)
+    elif isinstance(obj, (list, tuple)):
+        ret = [_to_json(item) for item in obj]
+    elif isinstance(obj, dict):
+        ret = {key: _to_json(value) for key, value in obj.items()}
+    else:
+        ret = obj
+
+    return ret
+
+
+def _compile_globs(globs):
+    """Compile globs into one regex. Same matching as
+    :py:func:`sphinx.util.matching.patmatch`
+
+    :param globs: glob patterns
+    :type globs: collections.abc.Iterable[str]
+    :returns: compiled regex. Without globs, matches nothing
+    :rtype: re.Pattern[str]
+
+    :meta private:
+    """
+    pats = [f"(?:{_translate_pattern(pat)})" for pat in sorted(globs)]
+    if pats:
+        ret = re.compile("|".join(pats))
+    else:
+        ret = re.compile("(?!)")
+
+    return ret
+
+
+def _list_folder(folder, prefix, suffixes, is_excluded):
+    """List a folder's document files and subfolders. Hidden and excluded
+    entries are skipped
+
+    :param folder: folder path
+    :type folder: str
+    :param prefix: folder relative posix path, ending with ``/``. Root is empty
+    :type prefix: str
+    :param suffixes: document file suffixes
+    :type suffixes: collections.abc.Sequence[str]
+    :param is_excluded: relative posix path --> True if excluded
+    :type is_excluded: collections.abc.Callable[[str], bool]
+    :returns: document file names and subfolder names, in listing order
+    :rtype: tuple[tuple[str, ...], tuple[str, ...]]
+    :raises:
+
+       - :py:exc:`OSError` -- folder unreadable, vanished, or symlink loop
+
+    :meta private:
+    """
+    with os.scandir(folder) as it:
+        entries = list(it)
+
+    file_names = []
+    folder_names = []
+    for entry in entries:
+        name = entry.name
+        if name.startswith("."):
+            continue
+        else:  # pragma: no cover
+            pass
+        posix = f"{prefix}{name}"
+        try:
+            is_dir = entry.is_dir()
+        except OSError:  # pragma: no cover
+            is_dir = False
+        if is_dir:
+            if not is_excluded(posix):
+                folder_names.append(name)
+            else:  # pragma: no cover
+                pass
+        elif (
+            any(name.endswith(suffix) for suffix in suffixes)
+            and entry.is_file()
+            and not is_excluded(posix)
+        ):
+            file_names.append(name)
+        else:  # pragma: no cover
+            pass
+
+    ret = (tuple(file_names), tuple(folder_names))
+
+    return ret
+
+
+def _walk_source_files(srcdir, suffixes, is_excluded, snapshot=None):
+    """One walk of the source folder, for files of every suffix
+
+    Same files, same order, as a recursive :py:func:`glob.iglob` per suffix:
+    hidden files and folders skipped, folder symlinks followed, folder
+    files before subfolders. Excluded folders are not descended into
+
+    With a snapshot, a folder whose mtime is unchanged is not listed
+    again. Adding, removing, or renaming an entry changes the mtime of the
+    folder containing it. Editing a file does not
+
+    :param srcdir: source folder
+    :type srcdir: str | pathlib.Path
+    :param suffixes: document file suffixes
+    :type suffixes: collections.abc.Sequence[str]
+    :param is_excluded: relative posix path --> True if excluded
+    :type is_excluded: collections.abc.Callable[[str], bool]
+    :param snapshot:
+
+       Default None. Folder relative posix path --> mtime, file names, and
+       subfolder names. From an earlier walk with the same suffixes and
+       exclude patterns. Updated in place
+
+    :type snapshot: dict[str, tuple[int | None, tuple[str, ...], tuple[str, ...]]] | None
+    :returns:
+
+       Not excluded files' relative posix path and suffix. Grouped by suffix,
+       in suffixes order
+
+    :rtype: list[tuple[str, str]]
+
+    :meta private:
+    """
+    # folder modified this close to the walk, may be modified again within
+    # the same mtime tick. Not trusted next walk
+    time_racy = time.time_ns() - _RACY_NS
+    visited = set()
+    found = {suffix: [] for suffix in suffixes}
+    # Each entry: (folder path, relative posix prefix)
+    stack = [(os.fspath(srcdir), "")]
+    while stack:
+        folder, prefix = stack.pop()
+        try:
+            if snapshot is None:
+                file_names, folder_names = _list_folder(
+                    folder, prefix, suffixes, is_excluded
+                )
+            else:
+                mtime = os.stat(folder).st_mtime_ns
+                entry = snapshot.get(prefix)
+                if entry is not None and entry[0] == mtime:
+                    _, file_names, folder_names = entry
+                else:
+                    file_names, folder_names = _list_folder(
+                        folder, prefix, suffixes, is_excluded
+                    )
+                    mtime_stored = mtime if mtime < time_racy else None
+                    snapshot[prefix] = (mtime_stored, file_names, folder_names)
+                visited.add(prefix)
+        except OSError:
+            # unreadable, vanished, or symlink loop. glob skips these too
+            continue
+
+        for name in file_names:
+            for suffix in found:
+                if name.endswith(suffix):
+                    found[suffix].append(f"{prefix}{name}")
+                else:  # pragma: no cover
+                    pass
+
+        # depth first. Subfolders visited in listing order
+        stack.extend(
+            (os.path.join(folder, name), f"{prefix}{name}/")
+            for name in reversed(folder_names)
+        )
+
+    if snapshot is not None:
+        # folders removed, or no longer walked
+        for prefix in set(snapshot).difference(visited):
+            del snapshot[prefix]
+    else:  # pragma: no cover
+        pass
+
+    ret = [(posix, suffix) for suffix, paths in found.items() for posix in paths]
+
+    return ret
+
 
 class SiteMap(MutableMapping[str, Union[Document, Any]]):
     """A mapping of documents to their toctrees (or None if terminal)
@@ -348,13 +621,64 @@ class SiteMap(MutableMapping[str, Union[Document, Any]]):
         file_format: str | None = None,
     ) -> None:
         """Class constructor."""
-        self._docs: dict[str, Document] = {}
+        # docname --> Document. Subclasses may store documents differently
+        self._docs: MutableMapping[str, Document] = self._create_storage()
+        # docname --> child globs. Only documents with globs
+        self._globs: dict[str, tuple[str, ...]] = {}
+        # compiled on first match_globs. None when globs change
+        self._glob_matcher: re.Pattern[str] | None = None
+        # child docname --> first parent docname. Other parents, if any, in extra
+        self._parents: MutableMapping[str, str] = self._create_parent_index()
+        self._parents_extra: dict[str, list[str]] = {}
+        # computed on first fingerprints. None when documents change
+        self._fingerprints: (
+            tuple[tuple[str, ...], dict[str, tuple[bytes, bytes]]] | None
+        ) = None
+        # source suffixes and Sphinx docname --> docname. None when docnames change
+        self._docname_index: tuple[tuple[str, ...], dict[str, str]] | None = None
+        # docnames sorted, for folder queries. None when docnames change
+        self._sorted_docnames: SortedDocnames | None = None
         self[root.docname] = root
         self._root: Document = root
         self._meta: dict[str, Any] = meta or {}
         # bypasses property setter. Could be unsupported or mistaken file format
         self._file_format = file_format
 
+    def _create_storage(self):
+        """Create the docname to Document storage. A dict
+
+        :returns: empty storage
+        :rtype: collections.abc.MutableMapping[str, sphinx_external_toc_strict.api.Document]
+
+        :meta private:
+        """
+        return {}
+
+    def _create_parent_index(self):
+        """Create the child docname to parent docname index. A dict
+
+        :returns: empty index
+        :rtype: collections.abc.MutableMapping[str, str]
+
+        :meta private:
+        """
+        return {}
+
+    @classmethod
+    def from_site_map(cls, site_map):
+        """Copy of a site map. e.g. into another site map class
+
+        :param site_map: site map to copy
+        :type site_map: sphinx_external_toc_strict.api.SiteMap
+        :returns: site map of this class, with the same documents
+        :rtype: typing.Self
+        """
+        ret = cls(site_map.root, meta=site_map.meta, file_format=site_map.file_format)
+        for docname, doc in site_map.items():
+            ret[docname] = doc
+
+        return ret
+
     @property
     def root(self):
         """Return the root document of the ToC tree.
@@ -413,23 +737,42 @@ class SiteMap(MutableMapping[str, Union[Document, Any]]):
     def globs(self):
         """All globs present across all toctrees
 
+        From an index updated when a document is set or deleted. After
+        changing a document's toctrees in place, set the document again
+
         :returns: set of all globs present across all toctrees
         :rtype: set[str]
         """
-        return {glob for item in self._docs.values() for glob in item.child_globs()}
+        return {glob for globs in self._globs.values() for glob in globs}
 
     def match_globs(self, posix_no_suffix):
         """Within sitemap, check file relative path matches one of the globs.
 
+        All globs are compiled into one regex, once. Cost per file does not
+        grow with the document count
+
         :param posix_no_suffix: relative path without suffix to a file within the sitemap
         :type posix_no_suffix: str
         :returns: True if matches one of the globs
         :rtype: bool
         """
-        ret = any(patmatch(posix_no_suffix, pat) for pat in self.globs())
+        matcher = self._glob_matcher
+        if matcher is None:
+            matcher = self._glob_matcher = _compile_globs(self.globs())
+        else:  # pragma: no cover
+            pass
+        ret = matcher.match(posix_no_suffix) is not None
+
         return ret
 
-    def new_excluded(self, srcdir, cfg_source_suffix, cfg_exclude_patterns):
+    def new_excluded(
+        self,
+        srcdir,
+        cfg_source_suffix,
+        cfg_exclude_patterns,
+        snapshot=None,
+        manifest=None,
+    ):
         """Inspect the files in the site. Create a list of excluded files
 
         - not in sitemap (with or w/o extension)
@@ -442,44 +785,132 @@ class SiteMap(MutableMapping[str, Union[Document, Any]]):
         :type cfg_source_suffix: collections.abc.Sequence[str]
         :param cfg_exclude_patterns: glob patterns of documents to exclude
         :type cfg_exclude_patterns: collections.abc.Sequence[str]
+        :param snapshot:
+
+           Default None. Folder listings of an earlier call, with the same
+           suffixes and exclude patterns. Folders with unchanged mtime are
+           not listed again. Updated in place. Start with an empty dict
+
+        :type snapshot: dict[str, tuple[int | None, tuple[str, ...], tuple[str, ...]]] | None
+        :param manifest:
+
+           Default None. Source files' relative posix paths, e.g. from
+           :py:func:`~sphinx_external_toc_strict.manifest.read_manifest`.
+           Used instead of walking ``srcdir``. No filesystem I/O
+
+        :type manifest: collections.abc.Iterable[str] | None
         :returns: list of documents to exclude
         :rtype: collections.abc.Sequence[str]
         """
         new_excluded = []
-        already_excluded = Matcher(cfg_exclude_patterns)
-        for suffix in cfg_source_suffix:
-            # recurse files in source directory, with this suffix, note
-            # we do not use `Path.glob` here, since it does not ignore hidden files:
-            # https://stackoverflow.com/questions/49862648/why-do-glob-glob-and-pathlib-path-glob-treat-hidden-files-differently
-            for path_str in glob.iglob(
-                str(Path(srcdir) / "**" / f"*{suffix}"), recursive=True
-            ):
-                path = Path(path_str)
-                if not path.is_file():  # pragma: no cover
+        already_excluded = PrefixMatcher(cfg_exclude_patterns)
+        if manifest is not None:
+            source_files = manifest_source_files(
+                manifest, list(cfg_source_suffix), already_excluded.match_prefix
+            )
+        else:
+            # One walk for all suffixes. Hidden files ignored, like glob. Already
+            # excluded folders are pruned, so only the file path itself is
+            # checked against exclude patterns
+            source_files = _walk_source_files(
+                srcdir, list(cfg_source_suffix), already_excluded, snapshot=snapshot
+            )
+        # files can be stored with or without suffixes
+        not_in_site_map = []
+        for posix, suffix in source_files:
+            posix_no_suffix = posix[: -len(suffix)]
+            if not (posix in self or posix_no_suffix in self):
+                not_in_site_map.append((posix, posix_no_suffix))
+            else:  # pragma: no cover
+                pass
+
+        # don't exclude docnames matching globs. Each glob narrowed to
+        # files starting with its literal prefix
+        glob_matched = set()
+        if not_in_site_map:
+            candidates = SortedDocnames(
+                posix_no_suffix for _, posix_no_suffix in not_in_site_map
+            )
+            for docnames in expand_globs(self.globs(), candidates).values():
+                glob_matched.update(docnames)
+        else:  # pragma: no cover
+            pass
+        for posix, posix_no_suffix in not_in_site_map:
+            if posix_no_suffix not in glob_matched:
+                new_excluded.append(posix)
+            else:  # pragma: no cover
+                pass
+
+        return new_excluded
+
+    def docname_index(self, source_suffix):
+        """Sphinx docname --> site map docname. Built once, then cached
+
+        Sphinx docnames have no suffix. Site map docnames may, e.g. in a
+        site mixing ``.rst`` and ``.md``. A docname is its own entry. A
+        docname ending with a source suffix is also an entry without
+        it, unless already taken. Earlier source suffixes first
+
+        Setting a new document or deleting a document clears the cache
+
+        :param source_suffix: Sphinx config ``source_suffix``
+        :type source_suffix: collections.abc.Iterable[str]
+        :returns: Sphinx docname --> site map docname
+        :rtype: dict[str, str]
+        """
+        suffixes = tuple(source_suffix)
+        cached = self._docname_index
+        if cached is not None and cached[0] == suffixes:
+            ret = cached[1]
+        else:
+            ret = {docname: docname for docname in self._docs}
+            for suffix in suffixes:
+                if not suffix:
                     continue
                 else:  # pragma: no cover
                     pass
-                posix = path.relative_to(srcdir).as_posix()
-                posix_no_suffix = posix[: -len(suffix)]
-                components = posix.split("/")
-                if not (
-                    # files can be stored with or without suffixes
-                    posix in self
-                    or posix_no_suffix in self
-                    # ignore anything already excluded, we have to check against
-                    # the file path and all its sub-directory paths
-                    or any(
-                        already_excluded("/".join(components[: i + 1]))
-                        for i in range(len(components))
-                    )
-                    # don't exclude docnames matching globs
-                    or self.match_globs(posix_no_suffix)
-                ):
-                    new_excluded.append(posix)
-                else:  # pragma: no cover
-                    pass
+                len_suffix = len(suffix)
+                for docname in self._docs:
+                    if docname.endswith(suffix) and len(docname) > len_suffix:
+                        ret.setdefault(docname[:-len_suffix], docname)
+                    else:  # pragma: no cover
+                        pass
+            self._docname_index = (suffixes, ret)
 
-        return new_excluded
+        return ret
+
+    def get_by_docname(self, docname, source_suffix):
+        """Get the document of a Sphinx docname. One lookup
+
+        :param docname: Sphinx docname. No suffix
+        :type docname: str
+        :param source_suffix: Sphinx config ``source_suffix``
+        :type source_suffix: collections.abc.Iterable[str]
+        :returns: document. None if not in the site map
+        :rtype: sphinx_external_toc_strict.api.Document | None
+        """
+        key = self.docname_index(source_suffix).get(docname)
+        ret = None if key is None else self[key]
+
+        return ret
+
+    def docnames_under(self, folder):
+        """Docnames within a folder, at any depth. Sorted docnames built
+        once, then cached. A query is two bisects
+
+        :param folder: relative posix path. Empty str for all docnames
+        :type folder: str
+        :returns: sorted docnames
+        :rtype: tuple[str, ...]
+        """
+        sorted_docnames = self._sorted_docnames
+        if sorted_docnames is None:
+            sorted_docnames = self._sorted_docnames = SortedDocnames(self._docs)
+        else:  # pragma: no cover
+            pass
+        ret = sorted_docnames.under(folder)
+
+        return ret
 
     def __getitem__(self, docname):
         """Enable retrieving a document by name using the indexing operator.
@@ -500,7 +931,37 @@ class SiteMap(MutableMapping[str, Union[Document, Any]]):
         :type item: sphinx_external_toc_strict.api.Document
         """
         assert item.docname == docname
+        item_previous = self._docs.get(docname)
+        if item_previous is not None:
+            self._unlink_children(docname, item_previous)
+        else:
+            self._docname_index = None
+            self._sorted_docnames = None
         self._docs[docname] = item
+        self._index_document(docname, item)
+
+    def _index_document(self, docname, item):
+        """Add a document to the parent index and glob index
+
+        :param docname: document name
+        :type docname: str
+        :param item: document instance
+        :type item: sphinx_external_toc_strict.api.Document
+
+        :meta private:
+        """
+        self._link_children(docname, item)
+        self._fingerprints = None
+        globs = tuple(item.child_globs())
+        globs_previous = self._globs.pop(docname, ())
+        if globs:
+            self._globs[docname] = globs
+        else:  # pragma: no cover
+            pass
+        if globs != globs_previous:
+            self._glob_matcher = None
+        else:  # pragma: no cover
+            pass
 
     def __delitem__(self, docname):
         """Enable removing a document by name.
@@ -509,7 +970,81 @@ class SiteMap(MutableMapping[str, Union[Document, Any]]):
         :type docname: str
         """
         assert docname != self._root.docname, "cannot delete root doc item"
-        del self._docs[docname]
+        self._unlink_children(docname, self._docs.pop(docname))
+        self._fingerprints = None
+        self._docname_index = None
+        self._sorted_docnames = None
+        if self._globs.pop(docname, None) is not None:
+            self._glob_matcher = None
+        else:  # pragma: no cover
+            pass
+
+    def __getstate__(self):
+        """Pickle without the compiled glob matcher. Recompiled when needed.
+        With fingerprints, so the next build compares against them
+
+        :returns: instance state
+        :rtype: dict[str, typing.Any]
+        """
+        state = self.__dict__.copy()
+        state["_glob_matcher"] = None
+        state["_docname_index"] = None
+        state["_sorted_docnames"] = None
+        if self._fingerprints is None:
+            # not cached on this instance. Its documents may yet be edited in place
+            state["_fingerprints"] = self._compute_fingerprints()
+        else:  # pragma: no cover
+            pass
+
+        return state
+
+    def __setstate__(self, state):
+        """Unpickle. A pickle without a glob index gets one
+
+        :param state: instance state
+        :type state: dict[str, typing.Any]
+        """
+        self.__dict__.update(state)
+        if "_globs" not in state:
+            self._globs = {}
+            for docname, doc in self._docs.items():
+                globs = tuple(doc.child_globs())
+                if globs:
+                    self._globs[docname] = globs
+                else:  # pragma: no cover
+                    pass
+        else:  # pragma: no cover
+            pass
+        self._glob_matcher = None
+        if "_parents" not in state:
+            self._parents = self._create_parent_index()
+            self._parents_extra = {}
+            for docname, doc in self._docs.items():
+                self._link_children(docname, doc)
+        else:  # pragma: no cover
+            pass
+        if "_fingerprints" not in state:
+            self._fingerprints = None
+        else:  # pragma: no cover
+            pass
+        if "_docname_index" not in state:
+            self._docname_index = None
+        else:  # pragma: no cover
+            pass
+        if "_sorted_docnames" not in state:
+            self._sorted_docnames = None
+        else:  # pragma: no cover
+            pass
+
+    def __contains__(self, docname):
+        """Whether a document is in the site map. Without retrieving it
+
+        :param docname: document name
+        :type docname: typing.Any
+        :returns: True if in the site map
+        :rtype: bool
+        """
+        return docname in self._docs
 
     def __iter__(self):
         """Enable iterating the names of the documents the site map is composed
@@ -561,12 +1096,8 @@ class SiteMap(MutableMapping[str, Union[Document, Any]]):
         :returns: json dict
         :rtype: dict[str, typing.Any]
         """
-        doc_dict = {
-            k: asdict(self._docs[k]) if self._docs[k] else self._docs[k]
-            for k in sorted(self._docs)
-        }
-
-        doc_dict = SiteMap._replace_items(doc_dict)
+        # keys may be shared FileItem. Plain str keys
+        doc_dict = {str(k): _to_json(self._docs[k]) for k in sorted(self._docs)}
         data = {
             "root": self.root.docname,
             "documents": doc_dict,
@@ -579,9 +1110,249 @@ class SiteMap(MutableMapping[str, Union[Document, Any]]):
 
         return data
 
+    def iter_json(self):
+        """Stream JSON of the site map, one document at a time
+
+        Same output as ``json.dumps(site_map.as_json())``. Never holds
+        more than one document's JSON data
+
+        :returns: JSON text chunks
+        :rtype: collections.abc.Iterator[str]
+        """
+        # same options as json.dumps defaults
+        encode = json.JSONEncoder().encode
+        yield f'{{"root": {encode(str(self.root.docname))}, "documents": {{'
+        separator = ""
+        for docname in sorted(self._docs):
+            doc_json = encode(_to_json(self._docs[docname]))
+            yield f"{separator}{encode(str(docname))}: {doc_json}"
+            separator = ", "
+        yield f'}}, "meta": {encode(self.meta)}'
+        if self.file_format:
+            yield f', "file_format": {encode(self.file_format)}'
+        else:  # pragma: no cover
+            pass
+        yield "}"
+
+    def dump_json(self, fp):
+        """Write JSON of the site map to a file object. Streamed
+
+        Same output as ``json.dump(site_map.as_json(), fp)``
+
+        :param fp: text file object, e.g. :py:data:`sys.stdout`
+        :type fp: typing.TextIO
+        """
+        for chunk in self.iter_json():
+            fp.write(chunk)
+
+    def _link_children(self, docname, doc):
+        """Add a document's child files to the parent index
+
+        :param docname: parent document name
+        :type docname: str
+        :param doc: parent document
+        :type doc: sphinx_external_toc_strict.api.Document
+
+        :meta private:
+        """
+        for child in doc.child_files():
+            parent = self._parents.get(child)
+            if parent is None:
+                self._parents[child] = docname
+            elif parent != docname:
+                # listed by more than one document. Rare
+                self._parents_extra.setdefault(child, []).append(docname)
+            else:  # pragma: no cover
+                pass
+
+    def _unlink_children(self, docname, doc):
+        """Remove a document's child files from the parent index
+
+        :param docname: parent document name
+        :type docname: str
+        :param doc: parent document, as it was when set
+        :type doc: sphinx_external_toc_strict.api.Document
+
+        :meta private:
+        """
+        for child in doc.child_files():
+            extra = self._parents_extra.get(child)
+            if self._parents.get(child) == docname:
+                if extra:
+                    # next parent, in the order set, takes over
+                    self._parents[child] = extra.pop(0)
+                else:
+                    del self._parents[child]
+            elif extra and docname in extra:
+                extra.remove(docname)
+            else:  # pragma: no cover
+                pass
+            if extra is not None and not extra:
+                del self._parents_extra[child]
+            else:  # pragma: no cover
+                pass
+
+    def parent_of(self, docname):
+        """Get the document whose toctree lists this document. O(1)
+
+        A document listed by more than one document, the first one set.
+        A document changed in place, e.g. its subtrees, is not noticed. Set
+        it again, ``site_map[docname] = doc``
+
+        :param docname: document name
+        :type docname: str
+        :returns: parent docname. None for root and documents not in any toctree
+        :rtype: str | None
+        :raises:
+
+           - :py:exc:`KeyError` -- docname not in site map
+
+        """
+        if docname not in self._docs:
+            raise KeyError(docname)
+        else:  # pragma: no cover
+            pass
+        ret = self._parents.get(docname)
+
+        return ret
+
+    def ancestors_of(self, docname):
+        """Get parent, grandparent, and so on up to the root. O(depth)
+
+        :param docname: document name
+        :type docname: str
+        :returns: ancestor docnames. Nearest first. Root is last
+        :rtype: list[str]
+        :raises:
+
+           - :py:exc:`KeyError` -- docname not in site map
+
+        """
+        ret = []
+        seen = {docname}
+        parent = self.parent_of(docname)
+        # cycle guard. A document never is its own ancestor
+        while parent is not None and parent not in seen:
+            ret.append(parent)
+            seen.add(parent)
+            parent = self._parents.get(parent)
+
+        return ret
+
+    def walk(self):
+        """Documents in ToC order, depth first from the root. Not recursive
+
+        Each document is yielded once, under the first document listing it.
+        Documents not reachable from the root are not yielded
+
+        :returns: depth, parent docname, and document. Root depth is 0
+        :rtype: collections.abc.Iterator[tuple[int, str | None, sphinx_external_toc_strict.api.Document]]
+        """
+        docs = self._docs
+        root_docname = self._root.docname
+        seen = {root_docname}
+        stack = [(0, None, root_docname)]
+        while stack:
+            depth, parent, docname = stack.pop()
+            doc = docs[docname]
+            yield depth, parent, doc
+            children = []
+            for child in doc.child_files():
+                if child in docs and child not in seen:
+                    seen.add(child)
+                    children.append((depth + 1, docname, child))
+                else:  # pragma: no cover
+                    pass
+            # reversed, so first child is popped first
+            stack.extend(reversed(children))
+
+    def fingerprints(self):
+        """Structural fingerprint of each document, and of its branch
+
+        A document's own digest covers its docname, title, and toctrees.
+        Its branch digest rolls up its own digest and the branch digests of
+        its child documents. Equal branch digests, unchanged branch.
+
+        Computed once, then cached. Setting or deleting a document clears
+        the cache. A document changed in place, e.g. its title, is not
+        noticed. Set it again, ``site_map[docname] = doc``
+
+        :returns:
+
+           Starting docnames, root then documents not reachable from root.
+           And docname --> own digest and branch digest
+
+        :rtype: tuple[tuple[str, ...], dict[str, tuple[bytes, bytes]]]
+        """
+        if self._fingerprints is None:
+            self._fingerprints = self._compute_fingerprints()
+        else:  # pragma: no cover
+            pass
+
+        return self._fingerprints
+
+    def _compute_fingerprints(self):
+        """Compute each document's own digest and branch digest
+
+        :returns:
+
+           Starting docnames, root then documents not reachable from root.
+           And docname --> own digest and branch digest
+
+        :rtype: tuple[tuple[str, ...], dict[str, tuple[bytes, bytes]]]
+
+        :meta private:
+        """
+        docs = self._docs
+        own = {docname: _document_digest(doc) for docname, doc in docs.items()}
+        # breadth first from root, then from each document not yet reached
+        children = {}
+        order = []
+        starts = []
+        for start in [self._root.docname] + list(docs):
+            if start in children:
+                continue
+            else:  # pragma: no cover
+                pass
+            starts.append(start)
+            children[start] = ()
+            queue = [start]
+            for docname in queue:
+                child_names = docs[docname].child_files()
+                children[docname] = child_names
+                for child_name in child_names:
+                    if child_name in docs and child_name not in children:
+                        children[child_name] = ()
+                        queue.append(child_name)
+                    else:  # pragma: no cover
+                        pass
+            order.extend(queue)
+
+        # children before parents. Iterative, so a deep ToC is fine
+        digests = {}
+        for docname in reversed(order):
+            hasher = hashlib.blake2b(own[docname], digest_size=16)
+            for child_name in children[docname]:
+                if child_name in digests:
+                    hasher.update(digests[child_name][1])
+                elif child_name in own:
+                    # cycle or reached earlier from elsewhere. Own digest only
+                    hasher.update(own[child_name])
+                else:
+                    # not in site map
+                    hasher.update(child_name.encode("utf8"))
+            digests[docname] = (own[docname], hasher.digest())
+
+        ret = (tuple(starts), digests)
+
+        return ret
+
     def get_changed(self, previous):
         """Compare this sitemap to another and return a list of changed documents
 
+        Branches with an unchanged fingerprint are skipped, not compared
+        document by document
+
         :param previous: SiteMap to compare against
         :type previous: sphinx_external_toc_strict.api.SiteMap
         :returns: set[str]
@@ -593,15 +1364,31 @@ class SiteMap(MutableMapping[str, Union[Document, Any]]):
            mixing .rst and .md, the file extensions are necessary
 
         """
+        starts, digests = self.fingerprints()
+        _, digests_previous = previous.fingerprints()
         changed_docs = set()
-        # check if the root document has changed
-        if self.root != previous.root:
-            changed_docs.add(self.root.docname)
-        for name, doc in self._docs.items():
-            if name not in previous:
-                changed_docs.add(name)
+        visited = set()
+        stack = list(reversed(starts))
+        while stack:
+            docname = stack.pop()
+            if docname in visited:
+                continue
+            else:  # pragma: no cover
+                pass
+            visited.add(docname)
+            own, branch = digests[docname]
+            own_previous, branch_previous = digests_previous.get(docname, (None, None))
+            if branch == branch_previous:
+                # whole branch unchanged
                 continue
-            prev_doc = previous[name]
-            if prev_doc != doc:
-                changed_docs.add(name)
+            elif own != own_previous:
+                changed_docs.add(docname)
+            else:  # pragma: no cover
+                pass
+            stack.extend(
+                child
+                for child in reversed(self._docs[docname].child_files())
+                if child in self._docs
+            )
+
         return changed_docs
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import re
 import sys
 from collections.abc import (
+    Callable,
     Iterable,
     Sequence,
 )
@@ -9,9 +11,12 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import (
     Any,
+    TextIO,
     Union,
 )
 
+from sphinx.application import Sphinx
+
 from ._compat import (
     DC_SLOTS,
     deep_iterable,
@@ -19,6 +24,7 @@ from ._compat import (
     instance_of,
     matches_re,
     optional,
+    trusted_construction,
 )
 from .constants import URL_PATTERN
 
@@ -42,6 +48,13 @@ if sys.version_info >= (3, 11):
 else:
     from typing_extensions import Self
 
+if sys.version_info >= (3, 8):  # pragma: no cover
+    from typing import Final
+else:  # pragma: no cover
+    from typing_extensions import Final
+
+__all__: Final[tuple[str, str, str, str, str, str, str, str]]
+
 class FileItem(str):
     def render(
         self,
@@ -62,11 +75,19 @@ class UrlItem:
     def __post_init__(self) -> None: ...
     def render(self) -> Generator[tuple[str, str], None, None]: ...
 
+@dataclass(**DC_SLOTS)
+class RefItem:
+    ref_id: str = field(validator=[instance_of(str)])
+    title: str | None = field(default=None, validator=optional(instance_of(str)))
+
+    def __post_init__(self) -> None: ...
+    def render(self, app: Sphinx) -> Generator[tuple[str, str], None, None]: ...
+
 @dataclass(**DC_SLOTS)
 class TocTree:
-    items: list[GlobItem | FileItem | UrlItem] = field(
+    items: list[GlobItem | FileItem | UrlItem | RefItem] = field(
         validator=deep_iterable(
-            instance_of((GlobItem, FileItem, UrlItem)), instance_of(list)
+            instance_of((GlobItem, FileItem, UrlItem, RefItem)), instance_of(list)
         )
     )
     caption: str | None = field(
@@ -83,6 +104,7 @@ class TocTree:
     def __post_init__(self) -> None: ...
     def files(self) -> list[str]: ...
     def globs(self) -> list[str]: ...
+    def refs(self) -> list[RefItem]: ...
 
 @dataclass(**DC_SLOTS)
 class Document:
@@ -96,6 +118,28 @@ class Document:
     def __post_init__(self) -> None: ...
     def child_files(self) -> list[str]: ...
     def child_globs(self) -> list[str]: ...
+    def child_refs(self) -> list[RefItem]: ...
+
+def _document_digest(doc: Document) -> bytes: ...
+def _to_json(obj: Any) -> Any: ...
+def _compile_globs(globs: Iterable[str]) -> re.Pattern[str]: ...
+
+_RACY_NS: Final[int]
+
+def _list_folder(
+    folder: str,
+    prefix: str,
+    suffixes: Sequence[str],
+    is_excluded: Callable[[str], bool],
+) -> tuple[tuple[str, ...], tuple[str, ...]]: ...
+def _walk_source_files(
+    srcdir: str | Path,
+    suffixes: Sequence[str],
+    is_excluded: Callable[[str], bool],
+    snapshot: (
+        dict[str, tuple[int | None, tuple[str, ...], tuple[str, ...]]] | None
+    ) = None,
+) -> list[tuple[str, str]]: ...
 
 class SiteMap(MutableMapping[str, Union[Document, Any]]):
     def __init__(
@@ -119,13 +163,45 @@ class SiteMap(MutableMapping[str, Union[Document, Any]]):
         srcdir: str | Path,
         cfg_source_suffix: Sequence[str],
         cfg_exclude_patterns: Sequence[str],
+        snapshot: (
+            dict[str, tuple[int | None, tuple[str, ...], tuple[str, ...]]] | None
+        ) = None,
+        manifest: Iterable[str] | None = None,
     ) -> Sequence[str]: ...
+    def docname_index(self, source_suffix: Iterable[str]) -> dict[str, str]: ...
+    def get_by_docname(
+        self,
+        docname: str,
+        source_suffix: Iterable[str],
+    ) -> Document | None: ...
+    def docnames_under(self, folder: str) -> tuple[str, ...]: ...
     def __getitem__(self, docname: str) -> Document: ...
     def __setitem__(self, docname: str, item: Document) -> None: ...
     def __delitem__(self, docname: str) -> None: ...
+    def __contains__(self, docname: object) -> bool: ...
+    def __getstate__(self) -> dict[str, Any]: ...
+    def __setstate__(self, state: dict[str, Any]) -> None: ...
     def __iter__(self) -> Iterator[str]: ...
     def __len__(self) -> int: ...
     @staticmethod
     def _replace_items(d: dict[str, Any]) -> dict[str, Any]: ...
     def as_json(self) -> dict[str, Any]: ...
+    def iter_json(self) -> Iterator[str]: ...
+    def dump_json(self, fp: TextIO) -> None: ...
+    def _index_document(self, docname: str, item: Document) -> None: ...
+    def _create_storage(self) -> MutableMapping[str, Document]: ...
+    def _create_parent_index(self) -> MutableMapping[str, str]: ...
+    @classmethod
+    def from_site_map(cls, site_map: SiteMap) -> Self: ...
+    def _link_children(self, docname: str, doc: Document) -> None: ...
+    def _unlink_children(self, docname: str, doc: Document) -> None: ...
+    def parent_of(self, docname: str) -> str | None: ...
+    def ancestors_of(self, docname: str) -> list[str]: ...
+    def walk(self) -> Iterator[tuple[int, str | None, Document]]: ...
+    def fingerprints(
+        self,
+    ) -> tuple[tuple[str, ...], dict[str, tuple[bytes, bytes]]]: ...
+    def _compute_fingerprints(
+        self,
+    ) -> tuple[tuple[str, ...], dict[str, tuple[bytes, bytes]]]: ...
     def get_changed(self, previous: Self) -> set[str]: ...
@@ -0,0 +1,399 @@
+"""
+.. moduleauthor:: Dave Faulkmore <https://mastodon.social/@msftcangoblowme>
+
+On-disk cache of parsed site maps
+
+Parsing a large ``_toc.yml`` is slow. strictyaml loads the entire file
+and then every option scalar has its type fixed. When the ToC file is
+unchanged, that work is wasted.
+
+A parsed :py:class:`~sphinx_external_toc_strict.api.SiteMap` is pickled
+into a cache folder. The cache entry is keyed by the ToC file content
+hash, the file encoding, the loader, and this package's version. Edit
+the ToC file, parse with other settings, or upgrade this package and the
+cache entry is ignored.
+
+One cache entry is kept per ToC file. Storing a new entry removes the
+stale entries of that ToC file.
+
+A ToC file which includes fragments, ``include:``, depends on those
+fragment files. The cache entry records each dependency's path and
+cache key. An edited fragment invalidates the cache entries of every
+ToC file which includes it.
+
+Option ``external_toc_exclude_missing`` lists every source folder. The
+folder listings are also cached, one snapshot per source folder. A folder
+whose mtime is unchanged is not listed again. The snapshot is keyed by
+``source_suffix``, ``exclude_patterns``, and this package's version.
+
+.. py:data:: __all__
+   :type: tuple[str, str, str, str, str, str, str, str, str]
+   :value: ("toc_cache_key", "cache_entry_path", "load_cache_entry", \
+   "load_site_map", "store_site_map", "dir_snapshot_key", \
+   "dir_snapshot_path", "load_dir_snapshot", "store_dir_snapshot")
+
+   Module exports
+
+.. py:data:: CACHE_SUFFIX
+   :type: str
+   :value: ".pickle"
+
+   Cache entry file suffix
+
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+
+from ._version import __version__
+
+__all__ = (
+    "toc_cache_key",
+    "cache_entry_path",
+    "load_cache_entry",
+    "load_site_map",
+    "store_site_map",
+    "dir_snapshot_key",
+    "dir_snapshot_path",
+    "load_dir_snapshot",
+    "store_dir_snapshot",
+)
+
+CACHE_SUFFIX = ".pickle"
+
+
+def toc_cache_key(contents, encoding="utf8", loader="strictyaml"):
+    """Hash ToC file contents, parse settings, and package version into a
+    cache key.
+
+    :param contents: ToC file raw contents
+    :type contents: bytes
+    :param encoding: Default "utf8". ToC file character encoding
+    :type encoding: str
+    :param loader: Default "strictyaml". ToC file loader
+    :type loader: str
+    :returns: hex digest
+    :rtype: str
+    """
+    hasher = hashlib.sha256()
+    for setting in (__version__, encoding, loader):
+        hasher.update(setting.encode("utf8"))
+        hasher.update(b"\0")
+    hasher.update(contents)
+    ret = hasher.hexdigest()
+
+    return ret
+
+
+def _path_prefix(path):
+    """Cache entry file name prefix. Identifies the ToC file.
+
+    :param path: ToC file path
+    :type path: str | pathlib.Path
+    :returns: file name prefix
+    :rtype: str
+    :meta private:
+    """
+    path_abs = Path(path).resolve().as_posix()
+    path_hash = hashlib.sha256(path_abs.encode("utf8")).hexdigest()[:16]
+    ret = f"toc-{path_hash}-"
+
+    return ret
+
+
+def cache_entry_path(cache_dir, path, key):
+    """Get the cache entry file path.
+
+    :param cache_dir: cache folder
+    :type cache_dir: str | pathlib.Path
+    :param path: ToC file path
+    :type path: str | pathlib.Path
+    :param key: cache key. From :py:func:`toc_cache_key`
+    :type key: str
+    :returns: cache entry file path
+    :rtype: pathlib.Path
+    """
+    ret = Path(cache_dir).joinpath(f"{_path_prefix(path)}{key}{CACHE_SUFFIX}")
+
+    return ret
+
+
+def _is_depends_current(depends, encoding="utf8", loader="strictyaml"):
+    """Check dependency files are unchanged
+
+    :param depends: dependency file path and cache key pairs
+    :type depends: collections.abc.Sequence[tuple[str, str]]
+    :param encoding: Default "utf8". ToC file character encoding
+    :type encoding: str
+    :param loader: Default "strictyaml". ToC file loader
+    :type loader: str
+    :returns: True if all dependencies' contents are unchanged
+    :rtype: bool
+    :meta private:
+    """
+    for dep_path, dep_key in depends:
+        try:
+            contents = Path(dep_path).read_bytes()
+        except OSError:
+            return False
+        if toc_cache_key(contents, encoding=encoding, loader=loader) != dep_key:
+            return False
+        else:  # pragma: no cover
+            pass
+
+    return True
+
+
+def load_cache_entry(cache_dir, path, key, encoding="utf8", loader="strictyaml"):
+    """Load a site map, and the files it depends on, from the cache.
+
+    An unreadable or corrupt cache entry is removed and treated as a
+    cache miss. A changed dependency is a cache miss.
+
+    :param cache_dir: cache folder
+    :type cache_dir: str | pathlib.Path
+    :param path: ToC file path
+    :type path: str | pathlib.Path
+    :param key: cache key. From :py:func:`toc_cache_key`
+    :type key: str
+    :param encoding: Default "utf8". Same as :py:func:`toc_cache_key`
+    :type encoding: str
+    :param loader: Default "strictyaml". Same as :py:func:`toc_cache_key`
+    :type loader: str
+    :returns:
+
+       site map and dependency file path and cache key pairs. None if
+       cache miss
+
+    :rtype: tuple[sphinx_external_toc_strict.api.SiteMap, tuple[tuple[str, str], ...]] | None
+    """
+    # avoid circular import
+    from .api import SiteMap
+
+    entry = cache_entry_path(cache_dir, path, key)
+    try:
+        with entry.open("rb") as f:
+            ret = pickle.load(f)
+    except FileNotFoundError:
+        ret = None
+    except Exception:
+        # corrupt or created by an incompatible Python. Discard
+        entry.unlink(missing_ok=True)
+        ret = None
+    else:
+        is_entry = (
+            isinstance(ret, tuple)
+            and len(ret) == 2
+            and isinstance(ret[0], SiteMap)
+            and isinstance(ret[1], tuple)
+        )
+        if not is_entry:
+            entry.unlink(missing_ok=True)
+            ret = None
+        elif not _is_depends_current(ret[1], encoding=encoding, loader=loader):
+            ret = None
+        else:  # pragma: no cover
+            pass
+
+    return ret
+
+
+def load_site_map(cache_dir, path, key):
+    """Load a site map from the cache.
+
+    An unreadable or corrupt cache entry is removed and treated as a
+    cache miss.
+
+    :param cache_dir: cache folder
+    :type cache_dir: str | pathlib.Path
+    :param path: ToC file path
+    :type path: str | pathlib.Path
+    :param key: cache key. From :py:func:`toc_cache_key`
+    :type key: str
+    :returns: site map or None if cache miss
+    :rtype: sphinx_external_toc_strict.api.SiteMap | None
+    """
+    t_entry = load_cache_entry(cache_dir, path, key)
+    ret = None if t_entry is None else t_entry[0]
+
+    return ret
+
+
+def store_site_map(cache_dir, path, key, site_map, depends=()):
+    """Store a site map into the cache. Replaces the ToC file's stale entries.
+
+    The cache is best effort. Failing to write a cache entry is not an error.
+
+    :param cache_dir: cache folder. Created if does not exist
+    :type cache_dir: str | pathlib.Path
+    :param path: ToC file path
+    :type path: str | pathlib.Path
+    :param key: cache key. From :py:func:`toc_cache_key`
+    :type key: str
+    :param site_map: parsed site map
+    :type site_map: sphinx_external_toc_strict.api.SiteMap
+    :param depends:
+
+       Default empty tuple. Included fragment files' path and cache key pairs
+
+    :type depends: collections.abc.Sequence[tuple[str, str]]
+    :returns: True if the cache entry was written
+    :rtype: bool
+    """
+    entry = cache_entry_path(cache_dir, path, key)
+    prefix = _path_prefix(path)
+    try:
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        # write then rename. A concurrent build never reads a partial entry
+        fd, tmp_name = tempfile.mkstemp(
+            dir=entry.parent,
+            prefix=prefix,
+            suffix=".tmp",
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                t_entry = (site_map, tuple(depends))
+                pickle.dump(t_entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, entry)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+    except OSError:
+        ret = False
+    else:
+        # remove this ToC file's stale entries
+        for stale in entry.parent.glob(f"{prefix}*{CACHE_SUFFIX}"):
+            if stale != entry:
+                stale.unlink(missing_ok=True)
+            else:  # pragma: no cover
+                pass
+        ret = True
+
+    return ret
+
+
+def dir_snapshot_key(suffixes, exclude_patterns):
+    """Hash source suffixes, exclude patterns, and package version.
+
+    Folder listings depend on both. Either changes, snapshot is stale.
+
+    :param suffixes: source file suffixes e.g. ``.rst``
+    :type suffixes: collections.abc.Iterable[str]
+    :param exclude_patterns: glob patterns of documents to exclude
+    :type exclude_patterns: collections.abc.Iterable[str]
+    :returns: hex digest
+    :rtype: str
+    """
+    hasher = hashlib.sha256()
+    hasher.update(__version__.encode("utf8"))
+    for items in (suffixes, exclude_patterns):
+        hasher.update(b"\1")
+        for item in items:
+            hasher.update(b"\0")
+            hasher.update(item.encode("utf8"))
+    ret = hasher.hexdigest()
+
+    return ret
+
+
+def dir_snapshot_path(cache_dir, srcdir):
+    """Get the folder snapshot file path. One per source folder.
+
+    :param cache_dir: cache folder
+    :type cache_dir: str | pathlib.Path
+    :param srcdir: Sphinx source folder
+    :type srcdir: str | pathlib.Path
+    :returns: folder snapshot file path
+    :rtype: pathlib.Path
+    """
+    path_abs = Path(srcdir).resolve().as_posix()
+    path_hash = hashlib.sha256(path_abs.encode("utf8")).hexdigest()[:16]
+    ret = Path(cache_dir).joinpath(f"dirs-{path_hash}{CACHE_SUFFIX}")
+
+    return ret
+
+
+def load_dir_snapshot(cache_dir, srcdir, key):
+    """Load folder listings of the previous build.
+
+    Unreadable, corrupt, or stale snapshot is a cache miss. Then an empty
+    snapshot is returned, so every folder is listed.
+
+    :param cache_dir: cache folder
+    :type cache_dir: str | pathlib.Path
+    :param srcdir: Sphinx source folder
+    :type srcdir: str | pathlib.Path
+    :param key: cache key. From :py:func:`dir_snapshot_key`
+    :type key: str
+    :returns:
+
+       relative folder path --> mtime_ns, file names, folder names. Pass
+       to :py:meth:`SiteMap.new_excluded <sphinx_external_toc_strict.api.SiteMap.new_excluded>`
+
+    :rtype: dict[str, tuple[int | None, tuple[str, ...], tuple[str, ...]]]
+    """
+    entry = dir_snapshot_path(cache_dir, srcdir)
+    try:
+        with entry.open("rb") as f:
+            t_entry = pickle.load(f)
+    except FileNotFoundError:
+        ret = {}
+    except Exception:
+        # corrupt or created by an incompatible Python. Discard
+        entry.unlink(missing_ok=True)
+        ret = {}
+    else:
+        is_current = (
+            isinstance(t_entry, tuple)
+            and len(t_entry) == 2
+            and t_entry[0] == key
+            and isinstance(t_entry[1], dict)
+        )
+        ret = t_entry[1] if is_current else {}
+
+    return ret
+
+
+def store_dir_snapshot(cache_dir, srcdir, key, snapshot):
+    """Store folder listings for the next build.
+
+    The cache is best effort. Failing to write the snapshot is not an error.
+
+    :param cache_dir: cache folder. Created if does not exist
+    :type cache_dir: str | pathlib.Path
+    :param srcdir: Sphinx source folder
+    :type srcdir: str | pathlib.Path
+    :param key: cache key. From :py:func:`dir_snapshot_key`
+    :type key: str
+    :param snapshot: relative folder path --> mtime_ns, file names, folder names
+    :type snapshot: dict[str, tuple[int | None, tuple[str, ...], tuple[str, ...]]]
+    :returns: True if the snapshot was written
+    :rtype: bool
+    """
+    entry = dir_snapshot_path(cache_dir, srcdir)
+    try:
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        # write then rename. A concurrent build never reads a partial snapshot
+        fd, tmp_name = tempfile.mkstemp(
+            dir=entry.parent,
+            prefix="dirs-",
+            suffix=".tmp",
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump((key, snapshot), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, entry)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+    except OSError:
+        ret = False
+    else:
+        ret = True
+
+    return ret
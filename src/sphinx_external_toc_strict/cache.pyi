@@ -0,0 +1,65 @@
+import sys
+from collections.abc import (
+    Iterable,
+    Sequence,
+)
+from pathlib import Path
+
+from .api import SiteMap
+
+if sys.version_info >= (3, 8):  # pragma: no cover
+    from typing import Final
+else:  # pragma: no cover
+    from typing_extensions import Final
+
+__all__: Final[tuple[str, str, str, str, str, str, str, str, str]]
+
+CACHE_SUFFIX: Final[str]
+
+def toc_cache_key(
+    contents: bytes,
+    encoding: str = "utf8",
+    loader: str = "strictyaml",
+) -> str: ...
+def _path_prefix(path: str | Path) -> str: ...
+def cache_entry_path(cache_dir: str | Path, path: str | Path, key: str) -> Path: ...
+def _is_depends_current(
+    depends: Sequence[tuple[str, str]],
+    encoding: str = "utf8",
+    loader: str = "strictyaml",
+) -> bool: ...
+def load_cache_entry(
+    cache_dir: str | Path,
+    path: str | Path,
+    key: str,
+    encoding: str = "utf8",
+    loader: str = "strictyaml",
+) -> tuple[SiteMap, tuple[tuple[str, str], ...]] | None: ...
+def load_site_map(
+    cache_dir: str | Path,
+    path: str | Path,
+    key: str,
+) -> SiteMap | None: ...
+def store_site_map(
+    cache_dir: str | Path,
+    path: str | Path,
+    key: str,
+    site_map: SiteMap,
+    depends: Sequence[tuple[str, str]] = (),
+) -> bool: ...
+def dir_snapshot_key(
+    suffixes: Iterable[str],
+    exclude_patterns: Iterable[str],
+) -> str: ...
+def dir_snapshot_path(cache_dir: str | Path, srcdir: str | Path) -> Path: ...
+def load_dir_snapshot(
+    cache_dir: str | Path,
+    srcdir: str | Path,
+    key: str,
+) -> dict[str, tuple[int | None, tuple[str, ...], tuple[str, ...]]]: ...
+def store_dir_snapshot(
+    cache_dir: str | Path,
+    srcdir: str | Path,
+    key: str,
+    snapshot: dict[str, tuple[int | None, tuple[str, ...], tuple[str, ...]]],
+) -> bool: ...
@@ -15,6 +15,8 @@ sphinx-etoc-strict [command] --help
 
 commands:
 
+- check_refs
+
 - create_site
 
 - create_toc
@@ -32,12 +34,18 @@ from pathlib import Path
 import click
 
 from .constants import __version_app
+from .inventory import (
+    inventory_name,
+    load_inventory,
+    resolve_ref,
+)
+from .manifest import read_manifest
 from .parsing_shared import FILE_FORMATS
 from .parsing_strictyaml import (
     dump_yaml,
-    load_yaml,
     parse_toc_yaml,
 )
+from .stats import ParseStats
 from .tools_strictyaml import (
     create_site_from_toc,
     create_site_map_from_path,
@@ -61,18 +69,49 @@ def main():
         path_type=Path,
     ),
 )
-def parse_toc(toc_file):
+@click.option(
+    "-p",
+    "--profile",
+    is_flag=True,
+    help="Print per phase wall time and counts to stderr",
+)
+@click.option(
+    "-j",
+    "--json",
+    "is_json",
+    is_flag=True,
+    help="Print site map as JSON, streamed, rather than YAML",
+)
+def parse_toc(toc_file, profile, is_json):
     """Parse a ToC file to a site-map YAML
 
     :param toc_file: Absolute path to toc file. File name convention: ``_toc.yml ``
     :type toc_file: pathlib.Path
+    :param profile: Default False. True to print parse stats to stderr
+    :type profile: bool
+    :param is_json:
+
+       Default False. True to print the site map as JSON. Same as
+       :py:meth:`SiteMap.as_json <sphinx_external_toc_strict.api.SiteMap.as_json>`
+
+    :type is_json: bool
     """
-    yml = load_yaml(toc_file)
-    site_map = parse_toc_yaml(yml)
-    # out_json = site_map.as_json()
-    yml_2 = dump_yaml(site_map)
-    # click.echo(yaml.dump(data, sort_keys=False, default_flow_style=False))
-    click.echo(yml_2)
+    # from the path, so include fragments resolve
+    stats = ParseStats() if profile else None
+    site_map = parse_toc_yaml(toc_file, stats=stats)
+    if stats is not None:
+        click.echo(stats.format(), err=True)
+    else:  # pragma: no cover
+        pass
+    if is_json:
+        # one document at a time. Not the whole site map as a dict
+        for chunk in site_map.iter_json():
+            click.echo(chunk, nl=False)
+        click.echo()
+    else:
+        yml_2 = dump_yaml(site_map)
+        # click.echo(yaml.dump(data, sort_keys=False, default_flow_style=False))
+        click.echo(yml_2)
 
 
 @main.command("to-project")
@@ -199,7 +238,24 @@ def create_site(toc_file, path, extension, overwrite):
     show_default=True,
     help="The key-mappings to use.",
 )
-def create_toc(site_dir, extension, index, skip_match, guess_titles, file_format):
+@click.option(
+    "-m",
+    "--manifest",
+    default=None,
+    help=(
+        "File listing source files, one per line, relative to SITE_DIR. "
+        "Used instead of walking SITE_DIR. - to read from stdin"
+    ),
+)
+def create_toc(
+    site_dir,
+    extension,
+    index,
+    skip_match,
+    guess_titles,
+    file_format,
+    manifest,
+):
     """Create a ToC file from a project directory
 
     :param site_dir: Base folder documentation. Coding convention ``docs/`` or ``doc/``
@@ -228,13 +284,28 @@ def create_toc(site_dir, extension, index, skip_match, guess_titles, file_format
        Supported use cases: ``default``, ``jb-book``, or ``jb-article``
 
     :type file_format: str
+    :param manifest:
+
+       Default None. Manifest file path, ``-`` for stdin. Lists source
+       files relative to ``site_dir``. None to walk ``site_dir``
+
+    :type manifest: str | None
     """
+    if manifest is not None:
+        try:
+            paths = read_manifest(manifest)
+        except (OSError, ValueError) as exc:
+            raise click.BadParameter(str(exc), param_hint="--manifest") from exc
+    else:
+        paths = None
+
     site_map = create_site_map_from_path(
         site_dir,
         suffixes=extension,
         default_index=index,
         ignore_matches=skip_match,
         file_format=file_format,
+        manifest=paths,
     )
     # May raise NotADirectoryError or FileNotFoundError
     site_map_guess_titles(site_map, index, is_guess=guess_titles)
@@ -293,3 +364,108 @@ def migrate_toc(toc_file, format, output):
         click.secho(f"Written to: {path_out!s}", fg="green")
     else:
         click.echo(content)
+
+
+@main.command("check-refs")
+@click.argument(
+    "toc_file",
+    type=click.Path(
+        exists=True,
+        file_okay=True,
+        path_type=Path,
+    ),
+)
+@click.option(
+    "-i",
+    "--inventory",
+    "inventories",
+    multiple=True,
+    help=(
+        "Local objects.inv file. NAME=PATH to name the inventory, otherwise "
+        "from the file name, objects-NAME.inv (use multiple times). Default "
+        "objects*.inv files beside TOC_FILE"
+    ),
+)
+@click.option(
+    "-c",
+    "--cache-dir",
+    type=click.Path(
+        file_okay=False,
+        dir_okay=True,
+        path_type=Path,
+    ),
+    default=None,
+    help="Folder to keep decoded inventory indexes. Unchanged, not decoded again",
+)
+def check_refs(toc_file, inventories, cache_dir):
+    """Check every ref in a ToC file resolves. Local inventories only.
+    No Sphinx app, no network
+
+    Unresolved refs are printed, one per line, ``docname: ref_id``.
+    Exit code 1 if any ref is unresolved
+
+    :param toc_file: Absolute path to toc file. File name convention: ``_toc.yml ``
+    :type toc_file: pathlib.Path
+    :param inventories:
+
+       ``objects.inv`` file paths. ``NAME=PATH`` names the inventory. Empty,
+       ``objects*.inv`` files in the ToC file's folder
+
+    :type inventories: collections.abc.Sequence[str]
+    :param cache_dir: Default None. Folder to keep decoded inventory indexes
+    :type cache_dir: pathlib.Path | None
+    """
+    if inventories:
+        t_invs = []
+        for spec in inventories:
+            name, sep, path_str = spec.partition("=")
+            if not sep:
+                path_str = spec
+                name = inventory_name(path_str)
+            else:  # pragma: no cover
+                pass
+            t_invs.append((name, Path(path_str)))
+    else:
+        t_invs = [
+            (inventory_name(path), path)
+            for path in sorted(toc_file.parent.glob("objects*.inv"))
+        ]
+    if not t_invs:
+        msg_err = f"No objects*.inv files in {toc_file.parent!s}. Provide --inventory"
+        raise click.UsageError(msg_err)
+    else:  # pragma: no cover
+        pass
+
+    loaded = []
+    for name, path in t_invs:
+        try:
+            loaded.append(load_inventory(path, name=name, cache_dir=cache_dir))
+        except (OSError, ValueError) as exc:
+            raise click.BadParameter(str(exc), param_hint="--inventory") from exc
+
+    site_map = parse_toc_yaml(toc_file)
+    # ref_id --> resolved. Same ref in many toctrees resolved once
+    resolved = {}
+    ref_count = 0
+    unresolved = []
+    for docname, doc in site_map.items():
+        for entry in doc.child_refs():
+            ref_count += 1
+            ref_id = entry.ref_id
+            if ref_id not in resolved:
+                resolved[ref_id] = resolve_ref(loaded, ref_id)
+            else:  # pragma: no cover
+                pass
+            if resolved[ref_id] is None:
+                unresolved.append(f"{docname}: {ref_id}")
+            else:  # pragma: no cover
+                pass
+
+    for line in unresolved:
+        click.echo(line)
+    msg_info = f"{ref_count!s} ref(s) checked, {len(unresolved)!s} unresolved"
+    click.echo(msg_info, err=True)
+    if unresolved:
+        raise SystemExit(1)
+    else:  # pragma: no cover
+        pass
@@ -1,7 +1,8 @@
+from collections.abc import Sequence
 from pathlib import Path
 
 def main() -> None: ...
-def parse_toc(toc_file: Path) -> None: ...
+def parse_toc(toc_file: Path, profile: bool) -> None: ...
 def create_site(
     toc_file: Path,
     path: Path,
@@ -21,3 +22,8 @@ def migrate_toc(
     format: str,
     output: Path,
 ) -> None: ...
+def check_refs(
+    toc_file: Path,
+    inventories: Sequence[str],
+    cache_dir: Path | None,
+) -> None: ...
@@ -0,0 +1,661 @@
+"""
+.. moduleauthor:: Dave Faulkmore <https://mastodon.social/@msftcangoblowme>
+
+Compact site map. Documents stored in array columns, for very large sites
+
+A :py:class:`~sphinx_external_toc_strict.api.SiteMap` keeps a
+:py:class:`~sphinx_external_toc_strict.api.Document` per document, each
+holding a list of :py:class:`~sphinx_external_toc_strict.api.TocTree`,
+each holding a list of items. Hundreds of bytes per document.
+
+:py:class:`CompactSiteMap` stores the same data in flat
+:py:class:`array.array` columns. Docnames, titles, captions, and item
+targets are stored once, in a string table. Columns hold string ids.
+Each distinct combination of toctree options is stored once. Pickles to
+a small blob.
+
+Documents and toctrees are views, created on demand. Changing a
+document in place does not change the site map. Set it again,
+``site_map[docname] = doc``
+
+.. code-block:: python
+
+   from sphinx_external_toc_strict.parsing_strictyaml import parse_toc_yaml
+
+   site_map = parse_toc_yaml("docs/_toc.yml", compact=True)
+
+.. py:data:: __all__
+   :type: tuple[str, str]
+   :value: ("CompactSiteMap", "DocumentColumns")
+
+   Module exports
+
+"""
+
+from __future__ import annotations
+
+from array import array
+
+from ._compat import trusted_construction
+from .api import (
+    Document,
+    FileItem,
+    GlobItem,
+    RefItem,
+    SiteMap,
+    TocTree,
+    UrlItem,
+)
+
+try:
+    from collections.abc import MutableMapping
+except (ModuleNotFoundError, ImportError):  # pragma: no cover
+    from typing import MutableMapping
+
+__all__ = (
+    "CompactSiteMap",
+    "DocumentColumns",
+)
+
+# array typecode of string, document row, toctree, and item ids
+_ID = "i"
+# No string, e.g. no title. Or deleted document row
+_NONE = -1
+# Garbage toctrees and items tolerated before the columns are rebuilt
+_COMPACT_MIN = 256
+
+# item kind column values
+_KIND_FILE = 0
+_KIND_GLOB = 1
+_KIND_URL = 2
+_KIND_REF = 3
+
+
+def _option_key(options):
+    """toctree options lookup key. ``numbered`` True and 1 are distinct
+
+    :param options: hidden, maxdepth, numbered, reversed, and titlesonly
+    :type options: tuple[bool, int, bool | int, bool, bool]
+    :returns: lookup key
+    :rtype: tuple[typing.Any, ...]
+
+    :meta private:
+    """
+    ret = options + (isinstance(options[2], bool),)
+
+    return ret
+
+
+class DocumentColumns(MutableMapping):
+    """docname --> Document. Stored in array columns
+
+    Replacing or deleting a document leaves its toctrees and items
+    behind, as garbage. Once garbage outnumbers live entries, the columns
+    are rebuilt. The string table only grows; string ids never change
+    """
+
+    def __init__(self):
+        """Class constructor."""
+        # string id --> str. And str --> string id
+        self._strings = []
+        self._string_ids = {}
+        # string id --> document row. _NONE if not a document
+        self._rows = array(_ID)
+        # document row columns. Name _NONE if deleted
+        self._doc_name = array(_ID)
+        self._doc_title = array(_ID)
+        self._doc_tree_start = array(_ID)
+        self._doc_tree_stop = array(_ID)
+        # toctree columns
+        self._tree_caption = array(_ID)
+        self._tree_options = array(_ID)
+        self._tree_item_start = array(_ID)
+        self._tree_item_stop = array(_ID)
+        # item columns
+        self._item_kind = array("b")
+        self._item_target = array(_ID)
+        self._item_title = array(_ID)
+        # option id --> (hidden, maxdepth, numbered, reversed, titlesonly)
+        self._options = []
+        self._option_ids = {}
+        # live documents, toctrees, and items. The rest is garbage
+        self._doc_count = 0
+        self._tree_count = 0
+        self._item_count = 0
+
+    def _intern(self, val):
+        """String id of a str. Added to the string table if new
+
+        :param val: str. None for no string
+        :type val: str | None
+        :returns: string id. :py:data:`_NONE` if None
+        :rtype: int
+
+        :meta private:
+        """
+        if val is None:
+            ret = _NONE
+        else:
+            ret = self._string_ids.get(val)
+            if ret is None:
+                # plain str. Not a FileItem
+                val = str(val)
+                ret = len(self._strings)
+                self._strings.append(val)
+                self._string_ids[val] = ret
+                self._rows.append(_NONE)
+            else:  # pragma: no cover
+                pass
+
+        return ret
+
+    def _string(self, sid):
+        """str from string id
+
+        :param sid: string id. :py:data:`_NONE` for None
+        :type sid: int
+        :returns: str or None
+        :rtype: str | None
+
+        :meta private:
+        """
+        ret = None if sid == _NONE else self._strings[sid]
+
+        return ret
+
+    def _row(self, docname):
+        """Document row of a docname
+
+        :param docname: document name
+        :type docname: str
+        :returns: document row
+        :rtype: int
+        :raises:
+
+           - :py:exc:`KeyError` -- not a document
+
+        :meta private:
+        """
+        sid = self._string_ids.get(docname)
+        ret = _NONE if sid is None else self._rows[sid]
+        if ret == _NONE:
+            raise KeyError(docname)
+        else:  # pragma: no cover
+            pass
+
+        return ret
+
+    def _option_id(self, tree):
+        """Option id of a toctree's options. Added if new
+
+        :param tree: toctree
+        :type tree: sphinx_external_toc_strict.api.TocTree
+        :returns: option id
+        :rtype: int
+
+        :meta private:
+        """
+        options = (
+            tree.hidden,
+            tree.maxdepth,
+            tree.numbered,
+            tree.reversed,
+            tree.titlesonly,
+        )
+        key = _option_key(options)
+        ret = self._option_ids.get(key)
+        if ret is None:
+            ret = len(self._options)
+            self._options.append(options)
+            self._option_ids[key] = ret
+        else:  # pragma: no cover
+            pass
+
+        return ret
+
+    def _append_trees(self, doc):
+        """Append a document's toctrees and items to the columns
+
+        :param doc: document
+        :type doc: sphinx_external_toc_strict.api.Document
+        :returns: toctree ids start and stop
+        :rtype: tuple[int, int]
+
+        :meta private:
+        """
+        intern = self._intern
+        start = len(self._tree_caption)
+        item_start_doc = len(self._item_kind)
+        for tree in doc.subtrees:
+            item_start = len(self._item_kind)
+            for item in tree.items:
+                if isinstance(item, FileItem):
+                    kind, target, title = _KIND_FILE, item, None
+                elif isinstance(item, GlobItem):
+                    kind, target, title = _KIND_GLOB, item, None
+                elif isinstance(item, UrlItem):
+                    kind, target, title = _KIND_URL, item.url, item.title
+                else:
+                    kind, target, title = _KIND_REF, item.ref_id, item.title
+                self._item_kind.append(kind)
+                self._item_target.append(intern(target))
+                self._item_title.append(intern(title))
+            self._tree_caption.append(intern(tree.caption))
+            self._tree_options.append(self._option_id(tree))
+            self._tree_item_start.append(item_start)
+            self._tree_item_stop.append(len(self._item_kind))
+        stop = len(self._tree_caption)
+        self._tree_count += stop - start
+        self._item_count += len(self._item_kind) - item_start_doc
+
+        return start, stop
+
+    def _drop_trees(self, row):
+        """A document's toctrees and items become garbage
+
+        :param row: document row
+        :type row: int
+
+        :meta private:
+        """
+        start = self._doc_tree_start[row]
+        stop = self._doc_tree_stop[row]
+        self._tree_count -= stop - start
+        for tree_id in range(start, stop):
+            self._item_count -= (
+                self._tree_item_stop[tree_id] - self._tree_item_start[tree_id]
+            )
+
+    def _garbage(self):
+        """Count of deleted document rows, toctrees, and items
+
+        :returns: garbage count
+        :rtype: int
+
+        :meta private:
+        """
+        ret = (
+            len(self._doc_name)
+            - self._doc_count
+            + len(self._tree_caption)
+            - self._tree_count
+            + len(self._item_kind)
+            - self._item_count
+        )
+
+        return ret
+
+    def _compact(self):
+        """Rebuild the columns without garbage. Document order is kept
+
+        :meta private:
+        """
+        doc_name = array(_ID)
+        doc_title = array(_ID)
+        doc_tree_start = array(_ID)
+        doc_tree_stop = array(_ID)
+        tree_caption = array(_ID)
+        tree_options = array(_ID)
+        tree_item_start = array(_ID)
+        tree_item_stop = array(_ID)
+        item_kind = array("b")
+        item_target = array(_ID)
+        item_title = array(_ID)
+        for row, sid in enumerate(self._doc_name):
+            if sid == _NONE:
+                continue
+            else:  # pragma: no cover
+                pass
+            self._rows[sid] = len(doc_name)
+            doc_name.append(sid)
+            doc_title.append(self._doc_title[row])
+            doc_tree_start.append(len(tree_caption))
+            for tree_id in range(self._doc_tree_start[row], self._doc_tree_stop[row]):
+                tree_caption.append(self._tree_caption[tree_id])
+                tree_options.append(self._tree_options[tree_id])
+                item_start = self._tree_item_start[tree_id]
+                item_stop = self._tree_item_stop[tree_id]
+                tree_item_start.append(len(item_kind))
+                item_kind.extend(self._item_kind[item_start:item_stop])
+                item_target.extend(self._item_target[item_start:item_stop])
+                item_title.extend(self._item_title[item_start:item_stop])
+                tree_item_stop.append(len(item_kind))
+            doc_tree_stop.append(len(tree_caption))
+
+        self._doc_name = doc_name
+        self._doc_title = doc_title
+        self._doc_tree_start = doc_tree_start
+        self._doc_tree_stop = doc_tree_stop
+        self._tree_caption = tree_caption
+        self._tree_options = tree_options
+        self._tree_item_start = tree_item_start
+        self._tree_item_stop = tree_item_stop
+        self._item_kind = item_kind
+        self._item_target = item_target
+        self._item_title = item_title
+
+    def _maybe_compact(self):
+        """Rebuild the columns, once garbage outnumbers live entries
+
+        :meta private:
+        """
+        garbage = self._garbage()
+        live = self._doc_count + self._tree_count + self._item_count
+        if garbage > max(live, _COMPACT_MIN):
+            self._compact()
+        else:  # pragma: no cover
+            pass
+
+    def _item(self, item_id):
+        """toctree item view
+
+        :param item_id: item id
+        :type item_id: int
+        :returns: toctree item
+        :rtype: sphinx_external_toc_strict.api.FileItem | sphinx_external_toc_strict.api.GlobItem | sphinx_external_toc_strict.api.UrlItem | sphinx_external_toc_strict.api.RefItem
+
+        :meta private:
+        """
+        kind = self._item_kind[item_id]
+        target = self._strings[self._item_target[item_id]]
+        if kind == _KIND_FILE:
+            ret = FileItem(target)
+        elif kind == _KIND_GLOB:
+            ret = GlobItem(target)
+        elif kind == _KIND_URL:
+            ret = UrlItem(target, self._string(self._item_title[item_id]))
+        else:
+            ret = RefItem(target, self._string(self._item_title[item_id]))
+
+        return ret
+
+    def __getitem__(self, docname):
+        """Document view. Created on demand
+
+        :param docname: document name
+        :type docname: str
+        :returns: document
+        :rtype: sphinx_external_toc_strict.api.Document
+        :raises:
+
+           - :py:exc:`KeyError` -- not a document
+
+        """
+        row = self._row(docname)
+        subtrees = []
+        # From already validated documents
+        with trusted_construction():
+            for tree_id in range(self._doc_tree_start[row], self._doc_tree_stop[row]):
+                items = [
+                    self._item(item_id)
+                    for item_id in range(
+                        self._tree_item_start[tree_id], self._tree_item_stop[tree_id]
+                    )
+                ]
+                hidden, maxdepth, numbered, reversed_, titlesonly = self._options[
+                    self._tree_options[tree_id]
+                ]
+                tree = TocTree(
+                    items=items,
+                    caption=self._string(self._tree_caption[tree_id]),
+                    hidden=hidden,
+                    maxdepth=maxdepth,
+                    numbered=numbered,
+                    reversed=reversed_,
+                    titlesonly=titlesonly,
+                )
+                subtrees.append(tree)
+            ret = Document(
+                docname=self._strings[self._doc_name[row]],
+                subtrees=subtrees,
+                title=self._string(self._doc_title[row]),
+            )
+
+        return ret
+
+    def __setitem__(self, docname, doc):
+        """Store a document. Replacing a document keeps its position
+
+        :param docname: document name
+        :type docname: str
+        :param doc: document
+        :type doc: sphinx_external_toc_strict.api.Document
+        """
+        sid = self._intern(docname)
+        row = self._rows[sid]
+        start, stop = self._append_trees(doc)
+        if row == _NONE:
+            self._rows[sid] = len(self._doc_name)
+            self._doc_name.append(sid)
+            self._doc_title.append(self._intern(doc.title))
+            self._doc_tree_start.append(start)
+            self._doc_tree_stop.append(stop)
+            self._doc_count += 1
+        else:
+            self._drop_trees(row)
+            self._doc_title[row] = self._intern(doc.title)
+            self._doc_tree_start[row] = start
+            self._doc_tree_stop[row] = stop
+            self._maybe_compact()
+
+    def __delitem__(self, docname):
+        """Remove a document
+
+        :param docname: document name
+        :type docname: str
+        :raises:
+
+           - :py:exc:`KeyError` -- not a document
+
+        """
+        row = self._row(docname)
+        self._drop_trees(row)
+        self._rows[self._doc_name[row]] = _NONE
+        self._doc_name[row] = _NONE
+        self._doc_count -= 1
+        self._maybe_compact()
+
+    def __contains__(self, docname):
+        """Whether a document. Without creating a view
+
+        :param docname: document name
+        :type docname: typing.Any
+        :returns: True if a document
+        :rtype: bool
+        """
+        sid = self._string_ids.get(docname) if isinstance(docname, str) else None
+        ret = sid is not None and self._rows[sid] != _NONE
+
+        return ret
+
+    def __iter__(self):
+        """Document names. Insertion order
+
+        :returns: document name
+        :rtype: collections.abc.Iterator[str]
+        """
+        strings = self._strings
+        for sid in self._doc_name:
+            if sid != _NONE:
+                yield strings[sid]
+            else:  # pragma: no cover
+                pass
+
+    def __len__(self):
+        """Document count
+
+        :returns: number of documents
+        :rtype: int
+        """
+        return self._doc_count
+
+    def __getstate__(self):
+        """Pickle without garbage or lookup tables. Rebuilt on unpickle
+
+        :returns: instance state
+        :rtype: dict[str, typing.Any]
+        """
+        if self._garbage() != 0:
+            self._compact()
+        else:  # pragma: no cover
+            pass
+        state = self.__dict__.copy()
+        del state["_string_ids"]
+        del state["_option_ids"]
+        del state["_rows"]
+
+        return state
+
+    def __setstate__(self, state):
+        """Unpickle. Rebuild the lookup tables
+
+        :param state: instance state
+        :type state: dict[str, typing.Any]
+        """
+        self.__dict__.update(state)
+        self._string_ids = {val: sid for sid, val in enumerate(self._strings)}
+        self._option_ids = {
+            _option_key(options): option_id
+            for option_id, options in enumerate(self._options)
+        }
+        self._rows = array(_ID, [_NONE]) * len(self._strings)
+        for row, sid in enumerate(self._doc_name):
+            self._rows[sid] = row
+
+
+class _ParentColumn(MutableMapping):
+    """child docname --> parent docname. An array indexed by child string id
+
+    Shares the documents' string table
+
+    :meta private:
+    """
+
+    def __init__(self, docs):
+        """Class constructor."""
+        self._docs = docs
+        # child string id --> parent string id. _NONE if no parent
+        self._parent = array(_ID)
+        self._count = 0
+
+    def _sid(self, docname):
+        """String id of a child with a parent
+
+        :param docname: child document name
+        :type docname: str
+        :returns: child string id
+        :rtype: int
+        :raises:
+
+           - :py:exc:`KeyError` -- no parent
+
+        """
+        sid = self._docs._string_ids.get(docname)
+        is_missing = (
+            sid is None or sid >= len(self._parent) or self._parent[sid] == _NONE
+        )
+        if is_missing:
+            raise KeyError(docname)
+        else:  # pragma: no cover
+            pass
+
+        return sid
+
+    def __getitem__(self, docname):
+        """Parent of a child
+
+        :param docname: child document name
+        :type docname: str
+        :returns: parent document name
+        :rtype: str
+        """
+        return self._docs._strings[self._parent[self._sid(docname)]]
+
+    def __setitem__(self, docname, parent):
+        """Set parent of a child
+
+        :param docname: child document name
+        :type docname: str
+        :param parent: parent document name
+        :type parent: str
+        """
+        sid = self._docs._intern(docname)
+        parent_sid = self._docs._intern(parent)
+        shortfall = sid + 1 - len(self._parent)
+        if shortfall > 0:
+            self._parent.extend(array(_ID, [_NONE]) * shortfall)
+        else:  # pragma: no cover
+            pass
+        if self._parent[sid] == _NONE:
+            self._count += 1
+        else:  # pragma: no cover
+            pass
+        self._parent[sid] = parent_sid
+
+    def __delitem__(self, docname):
+        """Remove a child's parent
+
+        :param docname: child document name
+        :type docname: str
+        """
+        self._parent[self._sid(docname)] = _NONE
+        self._count -= 1
+
+    def __iter__(self):
+        """Children with a parent
+
+        :returns: child document name
+        :rtype: collections.abc.Iterator[str]
+        """
+        strings = self._docs._strings
+        for sid, parent_sid in enumerate(self._parent):
+            if parent_sid != _NONE:
+                yield strings[sid]
+            else:  # pragma: no cover
+                pass
+
+    def __len__(self):
+        """Count of children with a parent
+
+        :returns: child count
+        :rtype: int
+        """
+        return self._count
+
+
+class CompactSiteMap(SiteMap):
+    """Site map with documents, and the parent index, stored in array
+    columns. Same interface as
+    :py:class:`~sphinx_external_toc_strict.api.SiteMap`
+
+    Documents are views, created on demand. After changing a document,
+    set it again
+
+    :ivar root: Document root
+    :vartype root: sphinx_external_toc_strict.api.Document
+    :ivar meta: YAML tricks
+    :vartype meta: dict[str, typing.Any] | None
+    :ivar file_format: Supported formats / use cases
+    :vartype file_format: str | None
+    """
+
+    def _create_storage(self):
+        """Create the docname to Document storage. Array columns
+
+        :returns: empty storage
+        :rtype: sphinx_external_toc_strict.compact.DocumentColumns
+
+        :meta private:
+        """
+        return DocumentColumns()
+
+    def _create_parent_index(self):
+        """Create the child docname to parent docname index. Shares the
+        documents' string table
+
+        :returns: empty index
+        :rtype: collections.abc.MutableMapping[str, str]
+
+        :meta private:
+        """
+        return _ParentColumn(self._docs)
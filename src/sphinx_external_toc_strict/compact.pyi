@@ -0,0 +1,71 @@
+import sys
+from collections.abc import Iterator
+from typing import Any
+
+from .api import (
+    Document,
+    FileItem,
+    GlobItem,
+    RefItem,
+    SiteMap,
+    TocTree,
+    UrlItem,
+)
+
+if sys.version_info >= (3, 9):
+    from collections.abc import MutableMapping
+else:
+    from typing import MutableMapping
+
+if sys.version_info >= (3, 8):  # pragma: no cover
+    from typing import Final
+else:  # pragma: no cover
+    from typing_extensions import Final
+
+__all__: Final[tuple[str, str]]
+
+_ID: Final[str]
+_NONE: Final[int]
+_COMPACT_MIN: Final[int]
+_KIND_FILE: Final[int]
+_KIND_GLOB: Final[int]
+_KIND_URL: Final[int]
+_KIND_REF: Final[int]
+
+def _option_key(
+    options: tuple[bool, int, bool | int, bool, bool],
+) -> tuple[Any, ...]: ...
+
+class DocumentColumns(MutableMapping[str, Document]):
+    def __init__(self) -> None: ...
+    def _intern(self, val: str | None) -> int: ...
+    def _string(self, sid: int) -> str | None: ...
+    def _row(self, docname: str) -> int: ...
+    def _option_id(self, tree: TocTree) -> int: ...
+    def _append_trees(self, doc: Document) -> tuple[int, int]: ...
+    def _drop_trees(self, row: int) -> None: ...
+    def _garbage(self) -> int: ...
+    def _compact(self) -> None: ...
+    def _maybe_compact(self) -> None: ...
+    def _item(self, item_id: int) -> FileItem | GlobItem | UrlItem | RefItem: ...
+    def __getitem__(self, docname: str) -> Document: ...
+    def __setitem__(self, docname: str, doc: Document) -> None: ...
+    def __delitem__(self, docname: str) -> None: ...
+    def __contains__(self, docname: object) -> bool: ...
+    def __iter__(self) -> Iterator[str]: ...
+    def __len__(self) -> int: ...
+    def __getstate__(self) -> dict[str, Any]: ...
+    def __setstate__(self, state: dict[str, Any]) -> None: ...
+
+class _ParentColumn(MutableMapping[str, str]):
+    def __init__(self, docs: DocumentColumns) -> None: ...
+    def _sid(self, docname: str) -> int: ...
+    def __getitem__(self, docname: str) -> str: ...
+    def __setitem__(self, docname: str, parent: str) -> None: ...
+    def __delitem__(self, docname: str) -> None: ...
+    def __iter__(self) -> Iterator[str]: ...
+    def __len__(self) -> int: ...
+
+class CompactSiteMap(SiteMap):
+    def _create_storage(self) -> DocumentColumns: ...
+    def _create_parent_index(self) -> MutableMapping[str, str]: ...
@@ -56,6 +56,12 @@ Separate constants out so independent of any dependencies
 
    Default url key
 
+.. py:data:: INCLUDE_KEY
+   :type: str
+   :value: "include"
+
+   ToC fragment file key. Fragment root document is included as a file entry
+
 .. py:data:: TOCTREE_OPTIONS
    :type: tuple[str, ...]
    :value: ("caption", "hidden", "maxdepth", "numbered", "reversed", "titlesonly")
@@ -68,11 +74,11 @@ Separate constants out so independent of any dependencies
    All supported file formats / uses cases
 
 .. py:data:: __all__
-   :type: tuple[str, str, str, str, str, str, str, str, str, str, str, str, str]
+   :type: tuple[str, str, str, str, str, str, str, str, str, str, str, str, str, str, str]
    :value: ("g_app_name", "__version_app", "__url__", "URL_PATTERN", \
    "DEFAULT_SUBTREES_KEY", "DEFAULT_ITEMS_KEY", "FILE_FORMAT_KEY", \
-   "ROOT_KEY", "FILE_KEY", "GLOB_KEY", "REF_KEY", "URL_KEY", "TOCTREE_OPTIONS", \
-   "use_cases")
+   "ROOT_KEY", "FILE_KEY", "GLOB_KEY", "REF_KEY", "URL_KEY", "INCLUDE_KEY", \
+   "TOCTREE_OPTIONS", "use_cases")
 
 
 """
@@ -96,6 +102,7 @@ __all__ = (
     "GLOB_KEY",
     "REF_KEY",
     "URL_KEY",
+    "INCLUDE_KEY",
     "TOCTREE_OPTIONS",
     "use_cases",
 )
@@ -114,6 +121,7 @@ FILE_KEY = "file"
 GLOB_KEY = "glob"
 REF_KEY = "ref"
 URL_KEY = "url"
+INCLUDE_KEY = "include"
 
 TOCTREE_OPTIONS = (
     "caption",
@@ -10,7 +10,9 @@ if sys.version_info >= (3, 9):  # pragma: no cover
 else:  # pragma: no cover
     from typing import Sequence
 
-__all__: Final[tuple[str, str, str, str, str, str, str, str, str, str, str, str, str]]
+__all__: Final[
+    tuple[str, str, str, str, str, str, str, str, str, str, str, str, str, str, str]
+]
 
 g_app_name: Final[str]
 
@@ -23,6 +25,7 @@ ROOT_KEY: Final[str]
 FILE_KEY: Final[str]
 GLOB_KEY: Final[str]
 URL_KEY: Final[str]
+INCLUDE_KEY: Final[str]
 TOCTREE_OPTIONS: Final[Sequence[str]]
 
 use_cases: Final[tuple[str, ...]]
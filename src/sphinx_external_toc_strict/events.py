@@ -11,10 +11,13 @@ Sphinx extension machinery
 
 from __future__ import annotations
 
+from contextlib import nullcontext
+from dataclasses import dataclass
 from pathlib import (
     Path,
     PurePosixPath,
 )
+from typing import Any
 
 from docutils import nodes
 from sphinx.addnodes import toctree as toctree_node
@@ -24,7 +27,10 @@ from sphinx.util import logging
 from sphinx.util.docutils import SphinxDirective
 from sphinx.util.matching import Matcher
 
-from ._compat import findall
+from ._compat import (
+    DC_SLOTS,
+    findall,
+)
 from .api import (
     Document,
     FileItem,
@@ -33,11 +39,28 @@ from .api import (
     SiteMap,
     UrlItem,
 )
+from .cache import (
+    dir_snapshot_key,
+    load_dir_snapshot,
+    store_dir_snapshot,
+)
 from .filename_suffix import stem_natural
+from .manifest import (
+    MANIFEST_STDIN,
+    read_manifest,
+)
+from .matching import expand_globs
 from .parsing_strictyaml import parse_toc_yaml
+from .sphinx_node import inventory_key
+from .stats import ParseStats
 
 logger = logging.getLogger(__name__)
 
+# toctree template entry kinds
+_ENTRY_STATIC = 0
+_ENTRY_FILE = 1
+_ENTRY_GLOB = 2
+
 
 def create_warning(
     app,
@@ -140,8 +163,23 @@ def parse_toc_to_env(app, config):
         raise ExtensionError(f"[etoc] `external_toc_path` does not exist: {path}")
     if not path.is_file():
         raise ExtensionError(f"[etoc] `external_toc_path` is not a file: {path}")
+    cache_dir = app.config["external_toc_cache_dir"]
+    if cache_dir:
+        cache_path = PurePosixPath(cache_dir)
+        if not cache_path.is_absolute():
+            cache_dir = Path(app.srcdir) / str(cache_path)
+        else:
+            cache_dir = Path(str(cache_path))
+    else:
+        cache_dir = None
+    stats = ParseStats() if config["external_toc_profile"] else None
     try:
-        site_map = parse_toc_yaml(path)
+        site_map = parse_toc_yaml(
+            path,
+            cache_dir=cache_dir,
+            loader=app.config["external_toc_loader"],
+            stats=stats,
+        )
     except Exception as exc:
         raise ExtensionError(f"[etoc] {exc}") from exc
     config.external_site_map = site_map  # type: ignore[attr-defined]
@@ -155,11 +193,57 @@ def parse_toc_to_env(app, config):
 
     if config["external_toc_exclude_missing"]:
         # add files not specified in ToC file to exclude list
-        new_excluded = site_map.new_excluded(
-            app.srcdir,
-            config["source_suffix"],
-            config["exclude_patterns"],
-        )
+        manifest_path = config["external_toc_manifest"]
+        if manifest_path:
+            # source files listed in a manifest. No source folder walk
+            if manifest_path != MANIFEST_STDIN:
+                manifest_path = PurePosixPath(manifest_path)
+                if not manifest_path.is_absolute():
+                    manifest_path = Path(app.srcdir) / str(manifest_path)
+                else:
+                    manifest_path = Path(str(manifest_path))
+            else:  # pragma: no cover
+                pass
+            try:
+                manifest = read_manifest(manifest_path)
+            except (OSError, ValueError) as exc:
+                msg_err = f"[etoc] `external_toc_manifest` unusable: {exc}"
+                raise ExtensionError(msg_err) from exc
+        else:
+            manifest = None
+        walk_exclude_patterns = config["exclude_patterns"]
+        if cache_dir is not None and manifest is None:
+            # cache folder within the source folder. Not walked
+            try:
+                cache_rel = (
+                    Path(cache_dir).resolve().relative_to(Path(app.srcdir).resolve())
+                )
+            except ValueError:
+                cache_rel = None
+            if cache_rel is not None and cache_rel.parts:
+                walk_exclude_patterns = walk_exclude_patterns + [cache_rel.as_posix()]
+            else:  # pragma: no cover
+                pass
+            # folder listings of the previous build. Unchanged folders not relisted
+            snapshot_key = dir_snapshot_key(
+                config["source_suffix"],
+                walk_exclude_patterns,
+            )
+            snapshot = load_dir_snapshot(cache_dir, app.srcdir, snapshot_key)
+        else:
+            snapshot = None
+        with nullcontext() if stats is None else stats.phase("new_excluded"):
+            new_excluded = site_map.new_excluded(
+                app.srcdir,
+                config["source_suffix"],
+                walk_exclude_patterns,
+                snapshot=snapshot,
+                manifest=manifest,
+            )
+        if snapshot is not None:
+            store_dir_snapshot(cache_dir, app.srcdir, snapshot_key, snapshot)
+        else:  # pragma: no cover
+            pass
         if new_excluded:
             excluded_count = len(new_excluded)
             msg_info = f"[etoc] Excluded {excluded_count!s} extra file(s) not in toc"
@@ -169,6 +253,12 @@ def parse_toc_to_env(app, config):
             # Note, don't `extend` list, as it alters the default `Config.config_values`
             config["exclude_patterns"] = config["exclude_patterns"] + new_excluded
 
+    if stats is not None:
+        msg_info = f"[etoc] ToC parse stats\n{stats.format()}"
+        logger.info(msg_info)
+    else:  # pragma: no cover
+        pass
+
 
 def add_changed_toctrees(
     app,
@@ -198,6 +288,8 @@ def add_changed_toctrees(
     app.env.external_site_map = site_map = app.config.external_site_map  # type: ignore[attr-defined]
     # Compare to previous map, to record docnames with new or changed toctrees
     if not previous_map:
+        # pickled with the env. The next build compares against these
+        site_map.fingerprints()
         return set()
     filenames = site_map.get_changed(previous_map)
     # set_files = {remove_suffix(name, app.config.source_suffix) for name in filenames}
@@ -206,6 +298,216 @@ def add_changed_toctrees(
     return set_files
 
 
+def build_glob_table(app, env, docnames):
+    """Expand every toctree glob once per build, against found documents.
+
+    :py:func:`insert_toctrees` then only skips the current document and
+    earlier matches, rather than filtering every found document, per glob,
+    per document
+
+    :param app: Sphinx app instance
+    :type app: sphinx.application.Sphinx
+    :param env: Sphinx app environment
+    :type env: sphinx.environment.BuildEnvironment
+    :param docnames: Documents to be read
+    :type docnames: list[str]
+    """
+    site_map = getattr(env, "external_site_map", None)
+    if site_map is not None:
+        env.external_toc_glob_table = expand_globs(  # type: ignore[attr-defined]
+            site_map.globs(),
+            env.found_docs,
+        )
+    else:  # pragma: no cover
+        pass
+
+
+@dataclass(frozen=True, **DC_SLOTS)
+class ToctreeTemplate:
+    """One toctree of a Document, translated once per build.
+
+    Inserting it into a doctree is a copy of the attributes and static
+    entries, plus the glob and missing document fixups
+
+    :ivar attributes: toctree node attributes, from the toctree options
+    :vartype attributes: tuple[tuple[str, typing.Any], ...]
+    :ivar entries:
+
+       entry kind and value. Static, i.e. url or resolved ref, and file
+       entries are the Sphinx renderable tuple. Glob entries are the pattern
+
+    :vartype entries: tuple[tuple[int, typing.Any], ...]
+    :ivar hidden: toctree hidden option. Not when the document has a tableofcontents
+    :vartype hidden: bool
+    :ivar reversed: Whether entries are listed in reverse order
+    :vartype reversed: bool
+    """
+
+    attributes: tuple[tuple[str, Any], ...]
+    entries: tuple[tuple[int, Any], ...]
+    hidden: bool
+    reversed: bool
+
+
+def toctree_templates(app, site_map, doc_item):
+    """Translate a document's toctrees into templates. Options become node
+    attributes. Url, ref, and file items are rendered
+
+    :param app: Sphinx app instance
+    :type app: sphinx.application.Sphinx
+    :param site_map: site map
+    :type site_map: sphinx_external_toc_strict.api.SiteMap
+    :param doc_item: document with toctrees
+    :type doc_item: sphinx_external_toc_strict.api.Document
+    :returns: one template per toctree
+    :rtype: tuple[sphinx_external_toc_strict.events.ToctreeTemplate, ...]
+    """
+    templates = []
+    for toctree in doc_item.subtrees:
+        entries = []
+        for entry in toctree.items:
+            if isinstance(entry, UrlItem):
+                entries.append((_ENTRY_STATIC, next(entry.render())))
+            elif isinstance(entry, RefItem):
+                # Very similar to UrlItem, except needs app to retrieve from inventory
+                entries.append((_ENTRY_STATIC, render_ref(app, entry)))
+            elif isinstance(entry, FileItem):
+                entries.append((_ENTRY_FILE, next(entry.render(site_map))))
+            elif isinstance(entry, GlobItem):
+                entries.append((_ENTRY_GLOB, str(entry)))
+            else:  # pragma: no cover
+                pass
+
+        numbered = (
+            0
+            if toctree.numbered is False
+            else (999 if toctree.numbered is True else int(toctree.numbered))
+        )
+        attributes = (
+            ("maxdepth", toctree.maxdepth),
+            ("caption", toctree.caption),
+            # TODO this wasn't in the original code,
+            # but alabaster theme intermittently raised `KeyError('rawcaption')`
+            ("rawcaption", toctree.caption or ""),
+            ("glob", any(isinstance(entry, GlobItem) for entry in toctree.items)),
+            ("includehidden", False),
+            ("numbered", numbered),
+            ("titlesonly", toctree.titlesonly),
+        )
+        templates.append(
+            ToctreeTemplate(
+                attributes=attributes,
+                entries=tuple(entries),
+                hidden=toctree.hidden,
+                reversed=toctree.reversed,
+            )
+        )
+    ret = tuple(templates)
+
+    return ret
+
+
+def render_ref(app, entry):
+    """Sphinx renderable tuple of a RefItem. From the ref table, if
+    resolved already
+
+    :param app: Sphinx app instance
+    :type app: sphinx.application.Sphinx
+    :param entry: intersphinx ref toctree item
+    :type entry: sphinx_external_toc_strict.api.RefItem
+    :returns: title and url. Unresolved ref, title and url are empty
+    :rtype: tuple[str | None, str | None]
+    """
+    ref_table = getattr(app.env, "external_toc_ref_table", None)
+    key = (entry.ref_id, entry.title)
+    if ref_table is not None and key in ref_table[1]:
+        ret = ref_table[1][key]
+    else:
+        ret = next(entry.render(app))
+
+    return ret
+
+
+def build_ref_table(app, env, docnames):
+    """Resolve every RefItem in the site map, in one batch, after
+    intersphinx inventories load.
+
+    Hits and misses are kept in the env, pickled with it. Reused by the
+    next build, unless an inventory changed. Refs new to the site map are
+    resolved; refs no longer in it are dropped
+
+    :param app: Sphinx app instance
+    :type app: sphinx.application.Sphinx
+    :param env: Sphinx app environment
+    :type env: sphinx.environment.BuildEnvironment
+    :param docnames: Documents to be read
+    :type docnames: list[str]
+    """
+    site_map = getattr(env, "external_site_map", None)
+    if site_map is not None:
+        refs = {}
+        for doc in site_map.values():
+            for entry in doc.child_refs():
+                refs[(entry.ref_id, entry.title)] = entry
+
+        key = inventory_key(app)
+        ref_table = getattr(env, "external_toc_ref_table", None)
+        if ref_table is not None and ref_table[0] == key:
+            resolved_previous = ref_table[1]
+        else:
+            resolved_previous = {}
+        resolved = {}
+        for ref_key, entry in refs.items():
+            if ref_key in resolved_previous:
+                resolved[ref_key] = resolved_previous[ref_key]
+            else:
+                resolved[ref_key] = next(entry.render(app))
+        env.external_toc_ref_table = (key, resolved)  # type: ignore[attr-defined]
+    else:  # pragma: no cover
+        pass
+
+
+def build_toctree_templates(app, env, docnames):
+    """Translate the toctrees of documents to be read, once per build
+
+    :param app: Sphinx app instance
+    :type app: sphinx.application.Sphinx
+    :param env: Sphinx app environment
+    :type env: sphinx.environment.BuildEnvironment
+    :param docnames: Documents to be read
+    :type docnames: list[str]
+    """
+    site_map = getattr(env, "external_site_map", None)
+    if site_map is not None:
+        templates = {}
+        for docname in docnames:
+            doc_item = site_map.get_by_docname(docname, app.config.source_suffix)
+            if doc_item is not None and doc_item.subtrees:
+                templates[docname] = toctree_templates(app, site_map, doc_item)
+            else:  # pragma: no cover
+                pass
+        env.external_toc_templates = templates  # type: ignore[attr-defined]
+    else:  # pragma: no cover
+        pass
+
+
+def clear_read_tables(app, env):
+    """Read phase is over. Glob table and toctree templates are not
+    pickled with the env
+
+    :param app: Sphinx app instance
+    :type app: sphinx.application.Sphinx
+    :param env: Sphinx app environment
+    :type env: sphinx.environment.BuildEnvironment
+    :returns: Documents to reread. None
+    :rtype: list[str]
+    """
+    env.external_toc_glob_table = None  # type: ignore[attr-defined]
+    env.external_toc_templates = None  # type: ignore[attr-defined]
+
+    return []
+
+
 class TableOfContentsNode(nodes.Element):
     """A placeholder for the insertion of a toctree (in ``insert_toctrees``)
 
@@ -258,29 +560,12 @@ def insert_toctrees(app, doctree):
     )
 
     site_map: SiteMap = app.env.external_site_map  # type: ignore[attr-defined]
-    doc_item: Document | None = site_map.get(app.env.docname)
-
-    # check for matches with suffix
+    # docname, or docname with a source suffix. Index built once per build
     # TODO check in sitemap, that we do not have multiple docs of the same name
     # (strip extensions on creation)
-    for suffix in app.config.source_suffix:
-        if doc_item is not None:
-            break
-        doc_stem = stem_natural(app.env.docname)
-        if len(doc_stem) == 0:
-            suf_doc = Path(f"bob{app.env.docname}").suffix
-        else:
-            suf_doc = Path(app.env.docname).suffix
-        if len(suf_doc) == 0:
-            # docname -- no suffix
-            doc_item = site_map.get(app.env.docname + suffix)
-        else:
-            if suf_doc != suffix:
-                # docname -- different suffix
-                doc_item = site_map.get(f"{doc_stem}{suffix}")
-            else:
-                # docname -- matching suffix
-                doc_item = site_map.get(doc_stem)
+    doc_item: Document | None = site_map.get_by_docname(
+        app.env.docname, app.config.source_suffix
+    )
 
     is_no_document_or_descendants = doc_item is None or not doc_item.subtrees
     if is_no_document_or_descendants:
@@ -307,47 +592,43 @@ def insert_toctrees(app, doctree):
         node.replace_self([])
 
     # initial variables
-    all_docnames = app.env.found_docs.copy()
-    all_docnames.remove(app.env.docname)  # remove current document
+    # glob --> sorted docnames. Expanded once per build
+    glob_table = getattr(app.env, "external_toc_glob_table", None)
+    if glob_table is None:
+        all_docnames = app.env.found_docs.copy()
+        all_docnames.remove(app.env.docname)  # remove current document
+    else:
+        # current document and earlier glob matches
+        glob_used = {app.env.docname}
     excluded = Matcher(app.config.exclude_patterns)
 
     node_list: list[nodes.Element] = []
 
-    for toctree in doc_item.subtrees:
+    # toctrees translated once per build. Otherwise translated now
+    templates = getattr(app.env, "external_toc_templates", None)
+    doc_templates = None if templates is None else templates.get(app.env.docname)
+    if doc_templates is None:
+        doc_templates = toctree_templates(app, site_map, doc_item)
+    else:  # pragma: no cover
+        pass
+
+    for template in doc_templates:
         subnode = toctree_node()
         subnode["parent"] = app.env.docname
         subnode.source = doctree["source"]
         subnode.line = 1
         subnode["entries"] = []
         subnode["includefiles"] = []
-        subnode["maxdepth"] = toctree.maxdepth
-        subnode["caption"] = toctree.caption
-        # TODO this wasn't in the original code,
-        # but alabaster theme intermittently raised `KeyError('rawcaption')`
-        subnode["rawcaption"] = toctree.caption or ""
-        subnode["glob"] = any(isinstance(entry, GlobItem) for entry in toctree.items)
-        subnode["hidden"] = False if toc_placeholders else toctree.hidden
-        subnode["includehidden"] = False
-        subnode["numbered"] = (
-            0
-            if toctree.numbered is False
-            else (999 if toctree.numbered is True else int(toctree.numbered))
-        )
-        subnode["titlesonly"] = toctree.titlesonly
+        subnode.attributes.update(template.attributes)
+        subnode["hidden"] = False if toc_placeholders else template.hidden
         wrappernode = nodes.compound(classes=["toctree-wrapper"])
         wrappernode.append(subnode)
 
-        for entry in toctree.items:
-            if isinstance(entry, UrlItem):
-                t_sphinx_renderable: tuple[str, str] = next(entry.render())
-                subnode["entries"].append(t_sphinx_renderable)
-            elif isinstance(entry, RefItem):
-                # Very similar to UrlItem, except needs app to retrieve from inventory
-                t_sphinx_renderable: tuple[str, str] = next(entry.render(app))
-                subnode["entries"].append(t_sphinx_renderable)
-            elif isinstance(entry, FileItem):
-                t_sphinx_renderable: tuple[str, str] = next(entry.render(site_map))
-                _, docname = t_sphinx_renderable
+        for kind, entry in template.entries:
+            if kind == _ENTRY_STATIC:
+                subnode["entries"].append(entry)
+            elif kind == _ENTRY_FILE:
+                _, docname = entry
 
                 if docname not in app.env.found_docs:
                     if excluded(app.env.doc2path(docname, base=False)):
@@ -364,13 +645,31 @@ def insert_toctrees(app, doctree):
                     create_warning(app, doctree, "ref", message, append_to=node_list)
                     app.env.note_reread()
                 else:
-                    subnode["entries"].append(t_sphinx_renderable)
+                    subnode["entries"].append(entry)
                     subnode["includefiles"].append(docname)
-            elif isinstance(entry, GlobItem):
+            elif kind == _ENTRY_GLOB:
                 doc_count = 0
-                for t_sphinx_renderable in entry.render(all_docnames):
+                patname = entry
+                if glob_table is None:
+                    renderables = list(GlobItem(patname).render(all_docnames))
+                else:
+                    if patname not in glob_table:
+                        glob_table.update(expand_globs([patname], app.env.found_docs))
+                    else:  # pragma: no cover
+                        pass
+                    renderables = [
+                        (None, docname)
+                        for docname in glob_table[patname]
+                        if docname not in glob_used
+                    ]
+
+                for t_sphinx_renderable in renderables:
                     _, docname = t_sphinx_renderable
-                    all_docnames.remove(docname)  # don't include it again
+                    # don't include it again
+                    if glob_table is None:
+                        all_docnames.remove(docname)
+                    else:
+                        glob_used.add(docname)
                     subnode["entries"].append(t_sphinx_renderable)
                     subnode["includefiles"].append(docname)
                     doc_count += 1
@@ -383,7 +682,7 @@ def insert_toctrees(app, doctree):
                     create_warning(app, doctree, "glob", message, append_to=node_list)
 
         # reversing entries can be useful when globbing
-        if toctree.reversed:
+        if template.reversed:
             subnode["entries"] = list(reversed(subnode["entries"]))
             subnode["includefiles"] = list(reversed(subnode["includefiles"]))
 
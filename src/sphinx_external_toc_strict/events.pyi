@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from typing import Any
 
 from docutils import nodes
@@ -10,8 +11,23 @@ from sphinx.transforms import SphinxTransform
 from sphinx.util import logging
 from sphinx.util.docutils import SphinxDirective
 
+from .api import (
+    Document,
+    RefItem,
+    SiteMap,
+)
+
+if sys.version_info >= (3, 8):  # pragma: no cover
+    from typing import Final
+else:  # pragma: no cover
+    from typing_extensions import Final
+
 logger: logging.SphinxLoggerAdapter
 
+_ENTRY_STATIC: Final[int]
+_ENTRY_FILE: Final[int]
+_ENTRY_GLOB: Final[int]
+
 def create_warning(
     app: Sphinx,
     doctree: nodes.document,
@@ -31,6 +47,42 @@ def add_changed_toctrees(
     changed: set[str],
     removed: set[str],
 ) -> set[str]: ...
+def build_glob_table(
+    app: Sphinx,
+    env: BuildEnvironment,
+    docnames: list[str],
+) -> None: ...
+
+class ToctreeTemplate:
+    attributes: tuple[tuple[str, Any], ...]
+    entries: tuple[tuple[int, Any], ...]
+    hidden: bool
+    reversed: bool
+    def __init__(
+        self,
+        attributes: tuple[tuple[str, Any], ...],
+        entries: tuple[tuple[int, Any], ...],
+        hidden: bool,
+        reversed: bool,
+    ) -> None: ...
+
+def toctree_templates(
+    app: Sphinx,
+    site_map: SiteMap,
+    doc_item: Document,
+) -> tuple[ToctreeTemplate, ...]: ...
+def render_ref(app: Sphinx, entry: RefItem) -> tuple[str | None, str | None]: ...
+def build_ref_table(
+    app: Sphinx,
+    env: BuildEnvironment,
+    docnames: list[str],
+) -> None: ...
+def build_toctree_templates(
+    app: Sphinx,
+    env: BuildEnvironment,
+    docnames: list[str],
+) -> None: ...
+def clear_read_tables(app: Sphinx, env: BuildEnvironment) -> list[str]: ...
 
 class TableOfContentsNode(nodes.Element):  # type: ignore[misc]
     def __init__(self, **attributes: Any) -> None: ...
@@ -0,0 +1,448 @@
+"""
+.. moduleauthor:: Dave Faulkmore <https://mastodon.social/@msftcangoblowme>
+
+Read intersphinx inventories, ``objects.inv``, without Sphinx
+
+Checking every ``ref:`` entry of a ToC resolves, thru
+:py:func:`~sphinx_external_toc_strict.sphinx_node.query_intersphinx`,
+needs a Sphinx app with intersphinx loaded. Local inventory files, e.g.
+the ``docs/objects-*.inv`` files, can be read directly instead.
+
+The zlib stream is decompressed a chunk at a time. Lines are parsed as
+they are decompressed. The resulting index, ``domain:role`` --> name
+--> (uri, display name), is pickled into a cache folder. Keyed by
+inventory file size and mtime and this package's version. An unchanged
+inventory is not decompressed again.
+
+Resolution follows :py:func:`sphinx.ext.intersphinx.missing_reference`
+for a ``std:ref``, i.e. a :py:class:`~sphinx_external_toc_strict.api.RefItem`.
+A ``std:label`` entry, case sensitive match first. Then, with an
+``[inventory name]:`` prefix, only that inventory.
+
+.. code-block:: python
+
+   from sphinx_external_toc_strict.inventory import load_inventory, resolve_ref
+
+   inventories = [load_inventory("docs/objects-python.inv")]
+   t_found = resolve_ref(inventories, "python:tut-intro")
+
+.. py:data:: __all__
+   :type: tuple[str, str, str, str, str, str]
+   :value: ("Inventory", "read_inventory", "inventory_name", \
+   "inventory_cache_key", "load_inventory", "resolve_ref")
+
+   Module exports
+
+.. py:data:: BUFSIZE
+   :type: int
+   :value: 16384
+
+   Compressed bytes read per chunk
+
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import re
+import tempfile
+import zlib
+from pathlib import Path
+
+from ._version import __version__
+from .cache import CACHE_SUFFIX
+
+__all__ = (
+    "Inventory",
+    "read_inventory",
+    "inventory_name",
+    "inventory_cache_key",
+    "load_inventory",
+    "resolve_ref",
+)
+
+BUFSIZE = 16 * 1024
+
+# Same as sphinx. Names may contain spaces
+_LINE_PATTERN = re.compile(r"(.+?)\s+(\S+)\s+(-?\d+)\s+?(\S*)\s+(.*)")
+
+# objtypes matched case insensitive, after a case sensitive miss
+_CASE_INSENSITIVE = frozenset({"std:label", "std:term"})
+
+# objtypes of role std:ref
+_REF_OBJTYPES = ("std:label",)
+
+
+class Inventory:
+    """One intersphinx inventory. ``domain:role`` --> name --> (uri, display name)
+
+    :ivar name: inventory name. intersphinx_mapping key
+    :vartype name: str
+    :ivar project: project name, from the inventory header
+    :vartype project: str
+    :ivar version: project version, from the inventory header
+    :vartype version: str
+    :ivar objects:
+
+       ``domain:role`` --> name --> relative uri and display name. Display
+       name ``-`` means the name
+
+    :vartype objects: dict[str, dict[str, tuple[str, str]]]
+    """
+
+    def __init__(self, name, project, version, objects):
+        """Class constructor."""
+        self.name = name
+        self.project = project
+        self.version = version
+        self.objects = objects
+        # objtype --> lowercase name --> first name. Built on first use
+        self._lower = {}
+
+    def __len__(self):
+        """Entry count, across all ``domain:role``
+
+        :returns: number of entries
+        :rtype: int
+        """
+        return sum(len(names) for names in self.objects.values())
+
+    def get(self, objtype, target):
+        """Look up an entry. ``std:label`` and ``std:term`` fall back to a
+        case insensitive match
+
+        :param objtype: ``domain:role`` e.g. ``std:label``
+        :type objtype: str
+        :param target: entry name
+        :type target: str
+        :returns: relative uri and display name. None if not found
+        :rtype: tuple[str, str] | None
+        """
+        names = self.objects.get(objtype)
+        if names is None:
+            ret = None
+        elif target in names:
+            ret = names[target]
+        elif objtype in _CASE_INSENSITIVE:
+            lower = self._lower.get(objtype)
+            if lower is None:
+                lower = {}
+                for name in names:
+                    lower.setdefault(name.lower(), name)
+                self._lower[objtype] = lower
+            else:  # pragma: no cover
+                pass
+            name = lower.get(target.lower())
+            ret = None if name is None else names[name]
+        else:
+            ret = None
+
+        return ret
+
+    def __getstate__(self):
+        """Pickle without the case insensitive lookup tables
+
+        :returns: instance state
+        :rtype: dict[str, typing.Any]
+        """
+        state = self.__dict__.copy()
+        state["_lower"] = {}
+
+        return state
+
+
+def _iter_lines(f):
+    """Decompress the zlib stream a chunk at a time. Yield each line
+
+    :param f: inventory file, positioned after the header
+    :type f: typing.BinaryIO
+    :returns: decoded lines, without line ending
+    :rtype: collections.abc.Iterator[str]
+
+    :meta private:
+    """
+    decompressor = zlib.decompressobj()
+    tail = b""
+    while True:
+        chunk = f.read(BUFSIZE)
+        if not chunk:
+            break
+        else:  # pragma: no cover
+            pass
+        buf = tail + decompressor.decompress(chunk)
+        lines = buf.split(b"\n")
+        tail = lines.pop()
+        for line in lines:
+            yield line.decode("utf8")
+    tail += decompressor.flush()
+    for line in tail.split(b"\n"):
+        if line:
+            yield line.decode("utf8")
+        else:  # pragma: no cover
+            pass
+
+
+def read_inventory(path, name=None):
+    """Read an intersphinx inventory file, version 2
+
+    Same entries as Sphinx. A later duplicate replaces an earlier one,
+    except ``py:module``. Location ending in ``$`` ends with the name
+
+    :param path: ``objects.inv`` file path
+    :type path: str | pathlib.Path
+    :param name: Default None. inventory name. None, from the file name
+    :type name: str | None
+    :returns: inventory
+    :rtype: sphinx_external_toc_strict.inventory.Inventory
+    :raises:
+
+       - :py:exc:`OSError` -- inventory file not readable
+       - :py:exc:`ValueError` -- not an inventory version 2 file or corrupt
+
+    """
+    path = Path(path)
+    if name is None:
+        name = inventory_name(path)
+    else:  # pragma: no cover
+        pass
+
+    objects = {}
+    with path.open("rb") as f:
+        header = [f.readline() for _ in range(4)]
+        if header[0].rstrip() != b"# Sphinx inventory version 2":
+            msg_err = f"{path!s} is not an intersphinx inventory version 2"
+            raise ValueError(msg_err)
+        elif b"zlib" not in header[3]:
+            msg_err = f"{path!s} inventory header invalid (not compressed)"
+            raise ValueError(msg_err)
+        else:  # pragma: no cover
+            pass
+        project = header[1].rstrip()[11:].decode("utf8")
+        version = header[2].rstrip()[11:].decode("utf8")
+
+        try:
+            for line in _iter_lines(f):
+                m = _LINE_PATTERN.match(line.rstrip())
+                if m is None:
+                    continue
+                else:  # pragma: no cover
+                    pass
+                entry_name, objtype, _, location, dispname = m.groups()
+                if ":" not in objtype:
+                    continue
+                else:  # pragma: no cover
+                    pass
+                names = objects.setdefault(objtype, {})
+                if objtype == "py:module" and entry_name in names:
+                    # Sphinx 1.1 and below wrote two entries. First is correct
+                    continue
+                else:  # pragma: no cover
+                    pass
+                if location.endswith("$"):
+                    location = f"{location[:-1]}{entry_name}"
+                else:  # pragma: no cover
+                    pass
+                names[entry_name] = (location, dispname)
+        except (zlib.error, UnicodeDecodeError) as exc:
+            msg_err = f"{path!s} inventory corrupt: {exc}"
+            raise ValueError(msg_err) from exc
+
+    ret = Inventory(name, project, version, objects)
+
+    return ret
+
+
+def inventory_name(path):
+    """Inventory name from the file name. ``objects-python.inv`` --> ``python``
+
+    :param path: ``objects.inv`` file path
+    :type path: str | pathlib.Path
+    :returns: inventory name
+    :rtype: str
+    """
+    stem = Path(path).stem
+    if stem.startswith("objects-") and len(stem) > len("objects-"):
+        ret = stem[len("objects-") :]
+    else:
+        ret = stem
+
+    return ret
+
+
+def inventory_cache_key(path):
+    """Hash inventory file path, size, mtime, and package version
+
+    :param path: ``objects.inv`` file path
+    :type path: str | pathlib.Path
+    :returns: hex digest
+    :rtype: str
+    :raises:
+
+       - :py:exc:`OSError` -- inventory file not found
+
+    """
+    path_abs = Path(path).resolve()
+    st = path_abs.stat()
+    hasher = hashlib.sha256()
+    for item in (
+        __version__,
+        path_abs.as_posix(),
+        str(st.st_size),
+        str(st.st_mtime_ns),
+    ):
+        hasher.update(item.encode("utf8"))
+        hasher.update(b"\0")
+    ret = hasher.hexdigest()
+
+    return ret
+
+
+def _index_path(cache_dir, path):
+    """Cache entry file path. One per inventory file
+
+    :param cache_dir: cache folder
+    :type cache_dir: str | pathlib.Path
+    :param path: ``objects.inv`` file path
+    :type path: str | pathlib.Path
+    :returns: cache entry file path
+    :rtype: pathlib.Path
+
+    :meta private:
+    """
+    path_abs = Path(path).resolve().as_posix()
+    path_hash = hashlib.sha256(path_abs.encode("utf8")).hexdigest()[:16]
+    ret = Path(cache_dir).joinpath(f"inv-{path_hash}{CACHE_SUFFIX}")
+
+    return ret
+
+
+def load_inventory(path, name=None, cache_dir=None):
+    """Read an inventory. From the on-disk index, if the file is unchanged
+
+    The cache is best effort. Unreadable or corrupt cache entry is a
+    cache miss. Failing to write the cache entry is not an error.
+
+    :param path: ``objects.inv`` file path
+    :type path: str | pathlib.Path
+    :param name: Default None. inventory name. None, from the file name
+    :type name: str | None
+    :param cache_dir: Default None. cache folder. None, no cache
+    :type cache_dir: str | pathlib.Path | None
+    :returns: inventory
+    :rtype: sphinx_external_toc_strict.inventory.Inventory
+    :raises:
+
+       - :py:exc:`OSError` -- inventory file not readable
+       - :py:exc:`ValueError` -- not an inventory version 2 file or corrupt
+
+    """
+    if name is None:
+        name = inventory_name(path)
+    else:  # pragma: no cover
+        pass
+    if cache_dir is None:
+        return read_inventory(path, name=name)
+    else:  # pragma: no cover
+        pass
+
+    key = inventory_cache_key(path)
+    entry = _index_path(cache_dir, path)
+    try:
+        with entry.open("rb") as f:
+            t_entry = pickle.load(f)
+    except FileNotFoundError:
+        t_entry = None
+    except Exception:
+        # corrupt or created by an incompatible Python. Discard
+        entry.unlink(missing_ok=True)
+        t_entry = None
+
+    is_current = (
+        isinstance(t_entry, tuple)
+        and len(t_entry) == 2
+        and t_entry[0] == key
+        and isinstance(t_entry[1], Inventory)
+    )
+    if is_current:
+        ret = t_entry[1]
+        ret.name = name
+    else:
+        ret = read_inventory(path, name=name)
+        try:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            # write then rename. A concurrent run never reads a partial entry
+            fd, tmp_name = tempfile.mkstemp(
+                dir=entry.parent,
+                prefix="inv-",
+                suffix=".tmp",
+            )
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump((key, ret), f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_name, entry)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        except OSError:
+            pass
+
+    return ret
+
+
+def _resolve_target(inventories, target):
+    """Look up a ``std:label`` in inventories. Later inventory name wins,
+    as in the Sphinx main inventory
+
+    :param inventories: inventories to search
+    :type inventories: collections.abc.Sequence[sphinx_external_toc_strict.inventory.Inventory]
+    :param target: label
+    :type target: str
+    :returns: inventory name, relative uri, and display name. None if not found
+    :rtype: tuple[str, str, str] | None
+
+    :meta private:
+    """
+    ordered = sorted(inventories, key=lambda inv: inv.name, reverse=True)
+    for objtype in _REF_OBJTYPES:
+        # case sensitive match in any inventory, before case insensitive
+        for inv in ordered:
+            names = inv.objects.get(objtype)
+            if names is not None and target in names:
+                return (inv.name, *names[target])
+            else:  # pragma: no cover
+                pass
+        for inv in ordered:
+            t_found = inv.get(objtype, target)
+            if t_found is not None:
+                return (inv.name, *t_found)
+            else:  # pragma: no cover
+                pass
+
+    return None
+
+
+def resolve_ref(inventories, ref_id):
+    """Resolve a RefItem ref id. Every inventory first. Then, if prefixed
+    ``[inventory name]:``, the rest in that inventory
+
+    :param inventories: inventories to search
+    :type inventories: collections.abc.Sequence[sphinx_external_toc_strict.inventory.Inventory]
+    :param ref_id: e.g. ``tut-intro`` or ``python:tut-intro``
+    :type ref_id: str
+    :returns:
+
+       inventory name, relative uri, and display name. None if unresolved
+
+    :rtype: tuple[str, str, str] | None
+    """
+    ret = _resolve_target(inventories, ref_id)
+    if ret is None and ":" in ref_id:
+        inv_name, target = ref_id.split(":", 1)
+        named = [inv for inv in inventories if inv.name == inv_name]
+        ret = _resolve_target(named, target)
+    else:  # pragma: no cover
+        pass
+
+    return ret
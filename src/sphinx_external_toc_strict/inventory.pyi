@@ -0,0 +1,59 @@
+import re
+import sys
+from collections.abc import (
+    Iterator,
+    Sequence,
+)
+from pathlib import Path
+from typing import (
+    Any,
+    BinaryIO,
+)
+
+if sys.version_info >= (3, 8):  # pragma: no cover
+    from typing import Final
+else:  # pragma: no cover
+    from typing_extensions import Final
+
+__all__: Final[tuple[str, str, str, str, str, str]]
+
+BUFSIZE: Final[int]
+_LINE_PATTERN: Final[re.Pattern[str]]
+_CASE_INSENSITIVE: Final[frozenset[str]]
+_REF_OBJTYPES: Final[tuple[str, ...]]
+
+class Inventory:
+    name: str
+    project: str
+    version: str
+    objects: dict[str, dict[str, tuple[str, str]]]
+    _lower: dict[str, dict[str, str]]
+    def __init__(
+        self,
+        name: str,
+        project: str,
+        version: str,
+        objects: dict[str, dict[str, tuple[str, str]]],
+    ) -> None: ...
+    def __len__(self) -> int: ...
+    def get(self, objtype: str, target: str) -> tuple[str, str] | None: ...
+    def __getstate__(self) -> dict[str, Any]: ...
+
+def _iter_lines(f: BinaryIO) -> Iterator[str]: ...
+def read_inventory(path: str | Path, name: str | None = None) -> Inventory: ...
+def inventory_name(path: str | Path) -> str: ...
+def inventory_cache_key(path: str | Path) -> str: ...
+def _index_path(cache_dir: str | Path, path: str | Path) -> Path: ...
+def load_inventory(
+    path: str | Path,
+    name: str | None = None,
+    cache_dir: str | Path | None = None,
+) -> Inventory: ...
+def _resolve_target(
+    inventories: Sequence[Inventory],
+    target: str,
+) -> tuple[str, str, str] | None: ...
+def resolve_ref(
+    inventories: Sequence[Inventory],
+    ref_id: str,
+) -> tuple[str, str, str] | None: ...
@@ -0,0 +1,297 @@
+"""
+.. moduleauthor:: Dave Faulkmore <https://mastodon.social/@msftcangoblowme>
+
+Lazy site map. Documents parsed on first access
+
+Link checkers and partial builds touch a few documents of a huge ToC.
+Parsing, and validating, every document up front is wasted work.
+
+The parser indexes the ToC once, docname --> raw doc item. Document
+file used more than once is still caught up front. Each
+:py:class:`~sphinx_external_toc_strict.api.Document` is parsed, and
+validated, when first reached, by lookup or by iterating documents.
+Iterating docnames alone parses nothing.
+
+Whole site map methods, e.g. ``globs``, ``parent_of``, and ``as_json``,
+parse every remaining document. :py:meth:`LazySiteMap.materialize` does
+so explicitly, raising on the first invalid document.
+
+.. code-block:: python
+
+   from sphinx_external_toc_strict.parsing_strictyaml import parse_toc_yaml
+
+   site_map = parse_toc_yaml("docs/_toc.yml", lazy=True)
+   doc = site_map["intro"]
+   site_map.materialize()
+
+.. py:data:: __all__
+   :type: tuple[str, str]
+   :value: ("LazySiteMap", "LazyDocuments")
+
+   Module exports
+
+"""
+
+from __future__ import annotations
+
+from .api import (
+    Document,
+    SiteMap,
+)
+
+try:
+    from collections.abc import MutableMapping
+except (ModuleNotFoundError, ImportError):  # pragma: no cover
+    from typing import MutableMapping
+
+__all__ = (
+    "LazySiteMap",
+    "LazyDocuments",
+)
+
+
+class LazyDocuments(MutableMapping):
+    """docname --> Document. Pending documents parsed on first access
+
+    :ivar on_parse:
+
+       Default None. Called with docname and document, once a pending
+       document is parsed
+
+    :vartype on_parse: collections.abc.Callable[[str, sphinx_external_toc_strict.api.Document], None] | None
+    """
+
+    def __init__(self, on_parse=None):
+        """Class constructor."""
+        # docname --> Document. Or, if pending, zero argument parse callable
+        self._entries = {}
+        self._pending_count = 0
+        self._on_parse = on_parse
+
+    def add_pending(self, docname, parse):
+        """Add a document, parsed on first access
+
+        :param docname: document name
+        :type docname: str
+        :param parse: zero argument callable. Returns the document
+        :type parse: collections.abc.Callable[[], sphinx_external_toc_strict.api.Document]
+        """
+        entry = self._entries.get(docname)
+        if entry is None or isinstance(entry, Document):
+            self._pending_count += 1
+        else:  # pragma: no cover
+            pass
+        self._entries[docname] = parse
+
+    def pending(self):
+        """Document names not yet parsed. ToC order
+
+        :returns: pending document names
+        :rtype: list[str]
+        """
+        ret = [
+            docname
+            for docname, entry in self._entries.items()
+            if not isinstance(entry, Document)
+        ]
+
+        return ret
+
+    def __getitem__(self, docname):
+        """Document. Parsed, if pending
+
+        :param docname: document name
+        :type docname: str
+        :returns: document
+        :rtype: sphinx_external_toc_strict.api.Document
+        :raises:
+
+           - :py:exc:`KeyError` -- not a document
+           - :py:exc:`~sphinx_external_toc_strict.exceptions.MalformedError` --
+             invalid doc item. Stays pending
+
+        """
+        entry = self._entries[docname]
+        if not isinstance(entry, Document):
+            entry = entry()
+            self._entries[docname] = entry
+            self._pending_count -= 1
+            if self._on_parse is not None:
+                self._on_parse(docname, entry)
+            else:  # pragma: no cover
+                pass
+        else:  # pragma: no cover
+            pass
+
+        return entry
+
+    def __setitem__(self, docname, doc):
+        """Store a parsed document. Replaces a pending document
+
+        :param docname: document name
+        :type docname: str
+        :param doc: document
+        :type doc: sphinx_external_toc_strict.api.Document
+        """
+        entry = self._entries.get(docname)
+        if entry is not None and not isinstance(entry, Document):
+            self._pending_count -= 1
+        else:  # pragma: no cover
+            pass
+        self._entries[docname] = doc
+
+    def __delitem__(self, docname):
+        """Remove a document. Pending or not
+
+        :param docname: document name
+        :type docname: str
+        """
+        entry = self._entries.pop(docname)
+        if not isinstance(entry, Document):
+            self._pending_count -= 1
+        else:  # pragma: no cover
+            pass
+
+    def __contains__(self, docname):
+        """Whether a document. Not parsed
+
+        :param docname: document name
+        :type docname: typing.Any
+        :returns: True if a document
+        :rtype: bool
+        """
+        return docname in self._entries
+
+    def __iter__(self):
+        """Document names. Not parsed
+
+        :returns: document name
+        :rtype: collections.abc.Iterator[str]
+        """
+        return iter(self._entries)
+
+    def __len__(self):
+        """Document count, including pending documents
+
+        :returns: number of documents
+        :rtype: int
+        """
+        return len(self._entries)
+
+    def __getstate__(self):
+        """Pickle. Every document is parsed first
+
+        :returns: instance state
+        :rtype: dict[str, typing.Any]
+        """
+        if self._pending_count != 0:
+            for docname in self.pending():
+                self[docname]
+        else:  # pragma: no cover
+            pass
+        state = self.__dict__.copy()
+        # nothing left to parse
+        state["_on_parse"] = None
+
+        return state
+
+
+class LazySiteMap(SiteMap):
+    """Site map with documents parsed on first access. Same interface as
+    :py:class:`~sphinx_external_toc_strict.api.SiteMap`
+
+    Methods needing the parent index or the glob index, ``globs``,
+    ``match_globs``, ``parent_of``, and ``ancestors_of``, parse every
+    pending document first
+
+    :ivar root: Document root
+    :vartype root: sphinx_external_toc_strict.api.Document
+    :ivar meta: YAML tricks
+    :vartype meta: dict[str, typing.Any] | None
+    :ivar file_format: Supported formats / use cases
+    :vartype file_format: str | None
+    """
+
+    def _create_storage(self):
+        """Create the docname to Document storage. Parsed documents are
+        indexed
+
+        :returns: empty storage
+        :rtype: sphinx_external_toc_strict.lazy.LazyDocuments
+
+        :meta private:
+        """
+        return LazyDocuments(on_parse=self._index_document)
+
+    def add_pending(self, docname, parse):
+        """Add a document, parsed on first access. Not yet indexed
+
+        :param docname: document name
+        :type docname: str
+        :param parse: zero argument callable. Returns the document
+        :type parse: collections.abc.Callable[[], sphinx_external_toc_strict.api.Document]
+        """
+        self._docs.add_pending(docname, parse)
+        self._fingerprints = None
+        self._docname_index = None
+        self._sorted_docnames = None
+        self._glob_matcher = None
+
+    def pending(self):
+        """Document names not yet parsed. ToC order
+
+        :returns: pending document names
+        :rtype: list[str]
+        """
+        return self._docs.pending()
+
+    def materialize(self):
+        """Parse, and validate, every pending document
+
+        :raises:
+
+           - :py:exc:`~sphinx_external_toc_strict.exceptions.MalformedError` --
+             invalid doc item. It, and later documents, stay pending
+
+        """
+        for docname in self._docs.pending():
+            self._docs[docname]
+
+    def globs(self):
+        """All globs present across all toctrees. Parses every pending
+        document
+
+        :returns: set of all globs present across all toctrees
+        :rtype: set[str]
+        """
+        self.materialize()
+        ret = super().globs()
+
+        return ret
+
+    def parent_of(self, docname):
+        """Get the document whose toctree lists this document. Parses every
+        pending document
+
+        :param docname: document name
+        :type docname: str
+        :returns: parent docname. None for root and documents not in any toctree
+        :rtype: str | None
+        :raises:
+
+           - :py:exc:`KeyError` -- docname not in site map
+
+        """
+        self.materialize()
+        ret = super().parent_of(docname)
+
+        return ret
+
+    def __setstate__(self, state):
+        """Unpickle. Parsed documents are indexed
+
+        :param state: instance state
+        :type state: dict[str, typing.Any]
+        """
+        super().__setstate__(state)
+        self._docs._on_parse = self._index_document
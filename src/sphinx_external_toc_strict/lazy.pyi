@@ -0,0 +1,47 @@
+import sys
+from collections.abc import (
+    Callable,
+    Iterator,
+)
+from typing import Any
+
+from .api import (
+    Document,
+    SiteMap,
+)
+
+if sys.version_info >= (3, 9):
+    from collections.abc import MutableMapping
+else:
+    from typing import MutableMapping
+
+if sys.version_info >= (3, 8):  # pragma: no cover
+    from typing import Final
+else:  # pragma: no cover
+    from typing_extensions import Final
+
+__all__: Final[tuple[str, str]]
+
+class LazyDocuments(MutableMapping[str, Document]):
+    def __init__(
+        self,
+        on_parse: Callable[[str, Document], None] | None = None,
+    ) -> None: ...
+    def add_pending(self, docname: str, parse: Callable[[], Document]) -> None: ...
+    def pending(self) -> list[str]: ...
+    def __getitem__(self, docname: str) -> Document: ...
+    def __setitem__(self, docname: str, doc: Document) -> None: ...
+    def __delitem__(self, docname: str) -> None: ...
+    def __contains__(self, docname: object) -> bool: ...
+    def __iter__(self) -> Iterator[str]: ...
+    def __len__(self) -> int: ...
+    def __getstate__(self) -> dict[str, Any]: ...
+
+class LazySiteMap(SiteMap):
+    def _create_storage(self) -> LazyDocuments: ...
+    def add_pending(self, docname: str, parse: Callable[[], Document]) -> None: ...
+    def pending(self) -> list[str]: ...
+    def materialize(self) -> None: ...
+    def globs(self) -> set[str]: ...
+    def parent_of(self, docname: str) -> str | None: ...
+    def __setstate__(self, state: dict[str, Any]) -> None: ...
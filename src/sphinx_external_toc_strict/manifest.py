@@ -0,0 +1,200 @@
+"""
+.. moduleauthor:: Dave Faulkmore <https://mastodon.social/@msftcangoblowme>
+
+Source file manifest. A list of source files, rather than a folder walk
+
+CI often already knows every source file, e.g. ``git ls-files``. On a
+slow, network mounted, checkout walking the source folder is expensive.
+A manifest lists source file paths, one per line, relative to the source
+folder. Blank lines and lines starting with ``#`` are ignored.
+
+.. code-block:: shell
+
+   git ls-files docs | sed 's|^docs/||' > docs/_manifest.txt
+
+From the manifest, finding documents not in the ToC, and creating a site
+map from a folder tree, need no further filesystem I/O.
+
+.. py:data:: __all__
+   :type: tuple[str, str, str]
+   :value: ("read_manifest", "manifest_tree", "manifest_source_files")
+
+   Module exports
+
+.. py:data:: MANIFEST_STDIN
+   :type: str
+   :value: "-"
+
+   Manifest path meaning read from stdin
+
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+__all__ = (
+    "read_manifest",
+    "manifest_tree",
+    "manifest_source_files",
+)
+
+MANIFEST_STDIN = "-"
+
+
+def _normalize_path(line):
+    """Manifest line to relative posix path.
+
+    :param line: one manifest line
+    :type line: str
+    :returns: relative posix path. None if blank or comment
+    :rtype: str | None
+    :raises:
+
+       - :py:exc:`ValueError` -- absolute path or outside the source folder
+
+    :meta private:
+    """
+    path = line.strip().replace("\\", "/")
+    if not path or path.startswith("#"):
+        ret = None
+    else:
+        if path.startswith("/") or (len(path) > 1 and path[1] == ":"):
+            msg_err = f"manifest path must be relative to source folder. Got {path}"
+            raise ValueError(msg_err)
+        else:  # pragma: no cover
+            pass
+        components = [part for part in path.split("/") if part not in ("", ".")]
+        if ".." in components:
+            msg_err = f"manifest path must be within source folder. Got {path}"
+            raise ValueError(msg_err)
+        else:  # pragma: no cover
+            pass
+        ret = "/".join(components) or None
+
+    return ret
+
+
+def read_manifest(source):
+    """Read a manifest file, or stdin.
+
+    :param source: manifest file path. ``-`` to read from stdin
+    :type source: str | pathlib.Path
+    :returns: relative posix paths. In manifest order, without duplicates
+    :rtype: tuple[str, ...]
+    :raises:
+
+       - :py:exc:`OSError` -- manifest file unreadable
+       - :py:exc:`ValueError` -- absolute path or outside the source folder
+
+    """
+    if str(source) == MANIFEST_STDIN:
+        lines = sys.stdin.read().splitlines()
+    else:
+        lines = Path(source).read_text(encoding="utf8").splitlines()
+
+    # dict keeps first seen order
+    paths = {}
+    for line in lines:
+        path = _normalize_path(line)
+        if path is not None:
+            paths[path] = None
+        else:  # pragma: no cover
+            pass
+    ret = tuple(paths)
+
+    return ret
+
+
+def manifest_tree(paths):
+    """Folder tree from manifest paths. Each folder's files and subfolders.
+
+    Folders are implied by the file paths within them. The root folder,
+    ``""``, is always present
+
+    :param paths: relative posix paths. From :py:func:`read_manifest`
+    :type paths: collections.abc.Iterable[str]
+    :returns:
+
+       folder relative posix path --> file names and subfolder names, in
+       manifest order
+
+    :rtype: dict[str, tuple[list[str], list[str]]]
+    """
+    ret = {"": ([], [])}
+    # duplicate paths skipped. One lookup, not a scan of the folder's files
+    seen = set()
+    for path in paths:
+        if path in seen:
+            continue
+        else:  # pragma: no cover
+            pass
+        seen.add(path)
+        folder, _, name = path.rpartition("/")
+        if folder in ret:
+            ret[folder][0].append(name)
+            continue
+        else:  # pragma: no cover
+            pass
+
+        ret[folder] = ([name], [])
+        # register the new folder, and any new ancestors, with their parent
+        while folder:
+            parent, _, folder_name = folder.rpartition("/")
+            is_new_parent = parent not in ret
+            if is_new_parent:
+                ret[parent] = ([], [])
+            else:  # pragma: no cover
+                pass
+            ret[parent][1].append(folder_name)
+            if not is_new_parent:
+                break
+            else:  # pragma: no cover
+                pass
+            folder = parent
+
+    return ret
+
+
+def manifest_source_files(paths, suffixes, is_excluded):
+    """Document files in the manifest. In memory, no filesystem I/O.
+
+    Like the source folder walk: hidden files and folders skipped, excluded
+    files and files within excluded folders skipped.
+
+    :param paths: relative posix paths. From :py:func:`read_manifest`
+    :type paths: collections.abc.Iterable[str]
+    :param suffixes: document file suffixes
+    :type suffixes: collections.abc.Sequence[str]
+    :param is_excluded:
+
+       relative posix path --> True if the path, or a folder containing it,
+       is excluded. e.g.
+       :py:meth:`PrefixMatcher.match_prefix <sphinx_external_toc_strict.matching.PrefixMatcher.match_prefix>`
+
+    :type is_excluded: collections.abc.Callable[[str], bool]
+    :returns:
+
+       Not excluded files' relative posix path and suffix. Grouped by suffix,
+       in suffixes order
+
+    :rtype: list[tuple[str, str]]
+    """
+    found = {suffix: [] for suffix in suffixes}
+    for path in paths:
+        is_hidden = path.startswith(".") or "/." in path
+        if is_hidden:
+            continue
+        else:  # pragma: no cover
+            pass
+        suffixes_matched = [suffix for suffix in found if path.endswith(suffix)]
+        if suffixes_matched and not is_excluded(path):
+            for suffix in suffixes_matched:
+                found[suffix].append(path)
+        else:  # pragma: no cover
+            pass
+
+    ret = [(posix, suffix) for suffix, posix_s in found.items() for posix in posix_s]
+
+    return ret
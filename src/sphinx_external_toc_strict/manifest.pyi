@@ -0,0 +1,25 @@
+import sys
+from collections.abc import (
+    Callable,
+    Iterable,
+    Sequence,
+)
+from pathlib import Path
+
+if sys.version_info >= (3, 8):  # pragma: no cover
+    from typing import Final
+else:  # pragma: no cover
+    from typing_extensions import Final
+
+__all__: Final[tuple[str, str, str]]
+
+MANIFEST_STDIN: Final[str]
+
+def _normalize_path(line: str) -> str | None: ...
+def read_manifest(source: str | Path) -> tuple[str, ...]: ...
+def manifest_tree(paths: Iterable[str]) -> dict[str, tuple[list[str], list[str]]]: ...
+def manifest_source_files(
+    paths: Iterable[str],
+    suffixes: Sequence[str],
+    is_excluded: Callable[[str], bool],
+) -> list[tuple[str, str]]: ...
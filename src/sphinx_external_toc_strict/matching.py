@@ -0,0 +1,337 @@
+"""
+.. moduleauthor:: Dave Faulkmore <https://mastodon.social/@msftcangoblowme>
+
+Match paths against ``exclude_patterns``. Same results as
+:py:class:`sphinx.util.matching.Matcher`.
+
+:py:class:`~sphinx.util.matching.Matcher` tries every pattern, one after
+another. To ask whether a file, or any of its folders, is excluded, it is
+called once per path prefix. With hundreds of patterns and deep paths,
+that adds up.
+
+:py:class:`PrefixMatcher` splits the patterns. Literal patterns, e.g.
+``_build``, go into a trie of path components. Wildcard patterns are
+combined into one regex. Whether a path or any of its folders is excluded
+is then one trie walk and one regex match.
+
+:py:func:`expand_globs` expands toctree globs once per build. Sphinx
+would otherwise filter every found document, per glob, per document.
+
+:py:class:`SortedDocnames` sorts docnames once. A glob's literal prefix,
+e.g. ``reference/api/`` of ``reference/api/**``, is a bisect into the
+sorted docnames. Only docnames with that prefix are matched against the
+wildcards.
+
+.. py:data:: __all__
+   :type: tuple[str, str, str]
+   :value: ("PrefixMatcher", "SortedDocnames", "expand_globs")
+
+   Module exports
+
+"""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_left
+
+from sphinx.util.matching import _translate_pattern
+from sphinx.util.osutil import canon_path
+
+__all__ = (
+    "PrefixMatcher",
+    "SortedDocnames",
+    "expand_globs",
+)
+
+_WILDCARD_CHARS = frozenset("*?[")
+
+# trie node key marking the end of a literal pattern. Not a valid component
+_END = None
+
+
+def _is_literal(pat):
+    """Pattern without wildcards. Matches only itself
+
+    :param pat: shell-style glob pattern
+    :type pat: str
+    :returns: True if pattern has no wildcard characters
+    :rtype: bool
+
+    :meta private:
+    """
+    ret = _WILDCARD_CHARS.isdisjoint(pat)
+
+    return ret
+
+
+def _literal_prefix(pat):
+    """Pattern up to the first wildcard character. Every match starts
+    with it
+
+    :param pat: shell-style glob pattern
+    :type pat: str
+    :returns: literal prefix. Whole pattern if no wildcards
+    :rtype: str
+
+    :meta private:
+    """
+    for idx, char in enumerate(pat):
+        if char in _WILDCARD_CHARS:
+            ret = pat[:idx]
+            break
+        else:  # pragma: no cover
+            pass
+    else:
+        ret = pat
+
+    return ret
+
+
+def _compile_wildcards(pats, boundary):
+    """Combine wildcard patterns into one regex
+
+    :param pats: shell-style glob patterns
+    :type pats: collections.abc.Sequence[str]
+    :param boundary:
+
+       True to match a path prefix ending at a folder separator, or the
+       end. False to match the whole path
+
+    :type boundary: bool
+    :returns: compiled regex. None if there are no patterns
+    :rtype: re.Pattern[str] | None
+
+    :meta private:
+    """
+    if not pats:
+        ret = None
+    else:
+        regexes = []
+        for pat in pats:
+            regex = _translate_pattern(pat)
+            if boundary:
+                # strip the end anchor. Prefix ends at a folder separator
+                regex = f"{regex[:-1]}(?=/|$)"
+            else:  # pragma: no cover
+                pass
+            regexes.append(f"(?:{regex})")
+        ret = re.compile("|".join(regexes))
+
+    return ret
+
+
+class PrefixMatcher:
+    """Match paths against shell-style glob patterns, e.g. ``exclude_patterns``
+
+    Like :py:class:`sphinx.util.matching.Matcher`, ``**/index.rst`` also
+    matches ``index.rst``.
+
+    :ivar patterns: shell-style glob patterns
+    :vartype patterns: collections.abc.Iterable[str]
+    """
+
+    def __init__(self, patterns):
+        """Class constructor."""
+        patterns = list(patterns)
+        expanded = patterns + [pat[3:] for pat in patterns if pat.startswith("**/")]
+        literals = []
+        wildcards = []
+        for pat in expanded:
+            if _is_literal(pat):
+                literals.append(pat)
+            else:
+                wildcards.append(pat)
+
+        self._literals = frozenset(literals)
+        # literal pattern components --> nested dict. _END key marks a pattern
+        self._trie = {}
+        for pat in literals:
+            node = self._trie
+            for component in pat.split("/"):
+                node = node.setdefault(component, {})
+            node[_END] = True
+        self._wildcards = _compile_wildcards(wildcards, boundary=False)
+        self._wildcards_prefix = _compile_wildcards(wildcards, boundary=True)
+
+    def __call__(self, string):
+        """Same as :py:meth:`match`
+
+        :param string: relative posix path
+        :type string: str
+        :returns: True if path matches a pattern
+        :rtype: bool
+        """
+        return self.match(string)
+
+    def match(self, string):
+        """Whether path matches a pattern. Same as Matcher
+
+        :param string: relative posix path
+        :type string: str
+        :returns: True if path matches a pattern
+        :rtype: bool
+        """
+        string = canon_path(string)
+        if string in self._literals:
+            ret = True
+        elif self._wildcards is not None:
+            ret = self._wildcards.match(string) is not None
+        else:
+            ret = False
+
+        return ret
+
+    def match_prefix(self, string):
+        """Whether path, or any of its folders, matches a pattern
+
+        One lookup. Same as Matcher called on every path prefix, i.e.
+        ``a``, ``a/b``, and ``a/b/c.rst``
+
+        :param string: relative posix path
+        :type string: str
+        :returns: True if path or a folder containing it matches a pattern
+        :rtype: bool
+        """
+        string = canon_path(string)
+        node = self._trie
+        for component in string.split("/"):
+            node = node.get(component)
+            if node is None:
+                break
+            elif _END in node:
+                return True
+            else:  # pragma: no cover
+                pass
+
+        if self._wildcards_prefix is not None:
+            ret = self._wildcards_prefix.match(string) is not None
+        else:
+            ret = False
+
+        return ret
+
+
+class SortedDocnames:
+    """Docnames sorted once. Prefix, folder, and glob queries by bisect
+
+    :ivar docnames: document names
+    :vartype docnames: collections.abc.Iterable[str]
+    """
+
+    def __init__(self, docnames):
+        """Class constructor."""
+        self._docnames = tuple(sorted(set(docnames)))
+
+    def __len__(self):
+        """Docname count
+
+        :returns: number of docnames
+        :rtype: int
+        """
+        return len(self._docnames)
+
+    def __iter__(self):
+        """Docnames, sorted
+
+        :returns: docname
+        :rtype: collections.abc.Iterator[str]
+        """
+        return iter(self._docnames)
+
+    def __contains__(self, docname):
+        """Whether a docname. One bisect
+
+        :param docname: document name
+        :type docname: typing.Any
+        :returns: True if a docname
+        :rtype: bool
+        """
+        if not isinstance(docname, str):
+            ret = False
+        else:
+            idx = bisect_left(self._docnames, docname)
+            ret = idx < len(self._docnames) and self._docnames[idx] == docname
+
+        return ret
+
+    def with_prefix(self, prefix):
+        """Docnames starting with prefix. Two bisects
+
+        :param prefix: docname prefix. Empty str for all docnames
+        :type prefix: str
+        :returns: sorted docnames
+        :rtype: tuple[str, ...]
+        """
+        docnames = self._docnames
+        if not prefix:
+            ret = docnames
+        else:
+            lo = bisect_left(docnames, prefix)
+            # first str after every str starting with prefix
+            prefix_next = f"{prefix[:-1]}{chr(ord(prefix[-1]) + 1)}"
+            hi = bisect_left(docnames, prefix_next, lo)
+            ret = docnames[lo:hi]
+
+        return ret
+
+    def under(self, folder):
+        """Docnames within a folder, at any depth
+
+        :param folder: relative posix path. Empty str for all docnames
+        :type folder: str
+        :returns: sorted docnames
+        :rtype: tuple[str, ...]
+        """
+        folder = folder.rstrip("/")
+        if not folder:
+            ret = self._docnames
+        else:
+            ret = self.with_prefix(f"{folder}/")
+
+        return ret
+
+    def glob(self, pat):
+        """Docnames matching a toctree glob. Same matches as
+        :py:func:`sphinx.util.matching.patfilter`. Only docnames with the
+        glob's literal prefix are matched against the wildcards
+
+        :param pat: shell-style glob pattern
+        :type pat: str
+        :returns: sorted docnames
+        :rtype: tuple[str, ...]
+        """
+        pat = str(pat)
+        if _is_literal(pat):
+            ret = (pat,) if pat in self else ()
+        else:
+            match = re.compile(_translate_pattern(pat)).match
+            ret = tuple(filter(match, self.with_prefix(_literal_prefix(pat))))
+
+        return ret
+
+
+def expand_globs(patterns, docnames):
+    """Expand toctree globs against found documents. Same matches, and
+    order, as :py:meth:`GlobItem.render <sphinx_external_toc_strict.api.GlobItem.render>`
+
+    :param patterns: toctree glob patterns
+    :type patterns: collections.abc.Iterable[str]
+    :param docnames: found documents, e.g. ``env.found_docs``. Or already sorted
+    :type docnames: collections.abc.Iterable[str] | sphinx_external_toc_strict.matching.SortedDocnames
+    :returns: glob pattern --> sorted matching docnames
+    :rtype: dict[str, tuple[str, ...]]
+    """
+    if isinstance(docnames, SortedDocnames):
+        sorted_docnames = docnames
+    else:
+        sorted_docnames = SortedDocnames(docnames)
+    ret = {}
+    for pat in patterns:
+        pat = str(pat)
+        if pat not in ret:
+            ret[pat] = sorted_docnames.glob(pat)
+        else:  # pragma: no cover
+            pass
+
+    return ret
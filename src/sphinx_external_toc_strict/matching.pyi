@@ -0,0 +1,45 @@
+import re
+import sys
+from collections.abc import (
+    Iterable,
+    Iterator,
+    Sequence,
+)
+from typing import Any
+
+if sys.version_info >= (3, 8):  # pragma: no cover
+    from typing import Final
+else:  # pragma: no cover
+    from typing_extensions import Final
+
+__all__: Final[tuple[str, str, str]]
+
+_WILDCARD_CHARS: Final[frozenset[str]]
+_END: Final[None]
+
+def _is_literal(pat: str) -> bool: ...
+def _literal_prefix(pat: str) -> str: ...
+def _compile_wildcards(
+    pats: Sequence[str],
+    boundary: bool,
+) -> re.Pattern[str] | None: ...
+
+class PrefixMatcher:
+    def __init__(self, patterns: Iterable[str]) -> None: ...
+    def __call__(self, string: str) -> bool: ...
+    def match(self, string: str) -> bool: ...
+    def match_prefix(self, string: str) -> bool: ...
+
+class SortedDocnames:
+    def __init__(self, docnames: Iterable[str]) -> None: ...
+    def __len__(self) -> int: ...
+    def __iter__(self) -> Iterator[str]: ...
+    def __contains__(self, docname: Any) -> bool: ...
+    def with_prefix(self, prefix: str) -> tuple[str, ...]: ...
+    def under(self, folder: str) -> tuple[str, ...]: ...
+    def glob(self, pat: str) -> tuple[str, ...]: ...
+
+def expand_globs(
+    patterns: Iterable[str],
+    docnames: Iterable[str] | SortedDocnames,
+) -> dict[str, tuple[str, ...]]: ...
@@ -0,0 +1,216 @@
+"""
+.. moduleauthor:: Dave Faulkmore <https://mastodon.social/@msftcangoblowme>
+
+Alternative ToC file loader. Consumes YAML parse events
+
+:py:func:`~sphinx_external_toc_strict.parsing_strictyaml.load_yaml` reads
+the whole file into a str. strictyaml then builds a round-trip document,
+keeping comments and positions, and finally a copy as plain data. For a
+very large ToC file, those copies are all in memory at once.
+
+This loader streams the file thru the YAML parser. From the parse events,
+builds the plain data, :py:class:`dict`, :py:class:`list`, and
+:py:class:`str`, directly. Neither the file contents nor a YAML document
+is kept in memory.
+
+Same semantics as strictyaml dirty load. No implicit typing, every
+scalar is a :py:class:`str`. Scalar types are fixed later, by
+:py:func:`~sphinx_external_toc_strict.parsing_strictyaml.parse_toc_data`.
+Rejected:
+
+- anchors and aliases
+
+- tags
+
+- duplicate keys
+
+- non-scalar keys
+
+- more than one document
+
+.. py:data:: __all__
+   :type: tuple[str, str, str]
+   :value: ("LOADERS", "load_yaml_events", "loads_yaml_events")
+
+   Module exports
+
+.. py:data:: LOADERS
+   :type: tuple[str, str]
+   :value: ("strictyaml", "events")
+
+   Supported ToC file loaders. First is the default
+
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from strictyaml.ruamel import YAML
+from strictyaml.ruamel.events import (
+    AliasEvent,
+    DocumentStartEvent,
+    MappingEndEvent,
+    MappingStartEvent,
+    ScalarEvent,
+    SequenceEndEvent,
+    SequenceStartEvent,
+)
+
+from .exceptions import MalformedError
+
+__all__ = (
+    "LOADERS",
+    "load_yaml_events",
+    "loads_yaml_events",
+)
+
+LOADERS = ("strictyaml", "events")
+
+_NO_KEY = object()
+
+
+def _check_node_event(event):
+    """Reject anchors and tags. Both are YAML features strictyaml disallows
+
+    :param event: node event
+    :type event: strictyaml.ruamel.events.NodeEvent
+    :raises:
+
+       - :py:exc:`~sphinx_external_toc_strict.exceptions.MalformedError` --
+         anchor or tag found
+
+    :meta private:
+    """
+    if event.anchor is not None:
+        msg_exc = f"Disallowed anchor '&{event.anchor}'{event.start_mark}"
+        raise MalformedError(msg_exc)
+    elif getattr(event, "tag", None) is not None:
+        msg_exc = f"Disallowed tag '{event.tag}'{event.start_mark}"
+        raise MalformedError(msg_exc)
+    else:  # pragma: no cover
+        pass
+
+
+def _build_data(events):
+    """From YAML parse events, build plain data. Every scalar is a str
+
+    Iterative. Open collections are kept on a stack, so nesting depth
+    is not limited by the recursion limit.
+
+    :param events: YAML parse events
+    :type events: collections.abc.Iterable[strictyaml.ruamel.events.Event]
+    :returns: document data. None if stream contains no document
+    :rtype: typing.Any
+    :raises:
+
+       - :py:exc:`~sphinx_external_toc_strict.exceptions.MalformedError` --
+         disallowed YAML feature, duplicate key, or more than one document
+
+    :meta private:
+    """
+    ret = None
+    document_count = 0
+    # Each entry: [collection, pending mapping key]
+    stack = []
+    for event in events:
+        cls = type(event)
+        if cls is ScalarEvent:
+            _check_node_event(event)
+            node = event.value
+            is_collection = False
+        elif cls is MappingStartEvent:
+            _check_node_event(event)
+            node = {}
+            is_collection = True
+        elif cls is SequenceStartEvent:
+            _check_node_event(event)
+            node = []
+            is_collection = True
+        elif cls is MappingEndEvent or cls is SequenceEndEvent:
+            stack.pop()
+            continue
+        elif cls is AliasEvent:
+            msg_exc = f"Disallowed alias '*{event.anchor}'{event.start_mark}"
+            raise MalformedError(msg_exc)
+        elif cls is DocumentStartEvent:
+            document_count += 1
+            if document_count > 1:
+                msg_exc = f"Expected a single document in the stream{event.start_mark}"
+                raise MalformedError(msg_exc)
+            else:  # pragma: no cover
+                pass
+            continue
+        else:
+            # stream start/end and document end
+            continue
+
+        if not stack:
+            ret = node
+        else:
+            entry = stack[-1]
+            parent = entry[0]
+            if type(parent) is list:
+                parent.append(node)
+            elif entry[1] is _NO_KEY:
+                if is_collection:
+                    msg_exc = f"Disallowed non-scalar key{event.start_mark}"
+                    raise MalformedError(msg_exc)
+                elif node in parent:
+                    msg_exc = f"Duplicate key '{node}' found{event.start_mark}"
+                    raise MalformedError(msg_exc)
+                else:  # pragma: no cover
+                    pass
+                entry[1] = node
+            else:
+                parent[entry[1]] = node
+                entry[1] = _NO_KEY
+
+        if is_collection:
+            stack.append([node, _NO_KEY])
+        else:  # pragma: no cover
+            pass
+
+    return ret
+
+
+def load_yaml_events(path, encoding="utf8"):
+    """Load a ToC file from YAML parse events. Every scalar is a str
+
+    The file is read in chunks, never held in memory as a whole.
+
+    :param path: absolute path to yaml file
+    :type path: str | pathlib.Path
+    :param encoding: Default "utf8". Provide encoding if other than "utf8"
+    :type encoding: str
+    :returns: ToC data. None if the file contains no document
+    :rtype: typing.Any
+    :raises:
+
+       - :py:exc:`~sphinx_external_toc_strict.exceptions.MalformedError` --
+         disallowed YAML feature, duplicate key, or more than one document
+
+    """
+    with Path(path).open(encoding=encoding) as f:
+        ret = loads_yaml_events(f)
+
+    return ret
+
+
+def loads_yaml_events(stream):
+    """Load ToC data from YAML parse events. Every scalar is a str
+
+    :param stream: yaml str or text stream
+    :type stream: str | typing.TextIO
+    :returns: ToC data. None if stream contains no document
+    :rtype: typing.Any
+    :raises:
+
+       - :py:exc:`~sphinx_external_toc_strict.exceptions.MalformedError` --
+         disallowed YAML feature, duplicate key, or more than one document
+
+    """
+    yaml = YAML(typ="safe", pure=True)
+    ret = _build_data(yaml.parse(stream))
+
+    return ret
@@ -0,0 +1,27 @@
+import sys
+from collections.abc import Iterable
+from pathlib import Path
+from typing import (
+    Any,
+    TextIO,
+)
+
+from strictyaml.ruamel.events import (
+    Event,
+    NodeEvent,
+)
+
+if sys.version_info >= (3, 8):  # pragma: no cover
+    from typing import Final
+else:  # pragma: no cover
+    from typing_extensions import Final
+
+__all__: Final[tuple[str, str, str]]
+
+LOADERS: Final[tuple[str, str]]
+_NO_KEY: Final[object]
+
+def _check_node_event(event: NodeEvent) -> None: ...
+def _build_data(events: Iterable[Event]) -> Any: ...
+def load_yaml_events(path: str | Path, encoding: str = "utf8") -> Any: ...
+def loads_yaml_events(stream: str | TextIO) -> Any: ...
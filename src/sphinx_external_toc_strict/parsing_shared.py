@@ -4,8 +4,8 @@
 Shared objects, such as: data, functions, and classes
 
 .. py:data:: __all__
-   :type: tuple[str, str, str]
-   :value: ("FileFormat", "create_toc_dict", "FILE_FORMATS")
+   :type: tuple[str, str, str, str]
+   :value: ("FileFormat", "create_toc_dict", "FILE_FORMATS", "intern_docname")
 
    Module exports
 
@@ -57,6 +57,7 @@ __all__ = (
     "FileFormat",
     "create_toc_dict",
     "FILE_FORMATS",
+    "intern_docname",
 )
 
 
@@ -142,6 +143,30 @@ FILE_FORMATS = {
 }
 
 
+def intern_docname(docnames, docname):
+    """One :py:class:`~sphinx_external_toc_strict.api.FileItem` per docname
+
+    The toctree item, the :py:class:`~sphinx_external_toc_strict.api.Document`
+    docname, and the site map key can then be the same object, rather than
+    three copies of the same text. Matters for very large site maps
+
+    :param docnames: docname --> FileItem. Filled in
+    :type docnames: dict[str, sphinx_external_toc_strict.api.FileItem]
+    :param docname: document path
+    :type docname: str
+    :returns: shared file item
+    :rtype: sphinx_external_toc_strict.api.FileItem
+    """
+    ret = docnames.get(docname)
+    if ret is None:
+        ret = FileItem(docname)
+        docnames[docname] = ret
+    else:  # pragma: no cover
+        pass
+
+    return ret
+
+
 def create_toc_dict(site_map, *, skip_defaults=True):
     """Create the ToC dictionary from a site-map.
 
@@ -304,7 +329,8 @@ def _docitem_to_dict(
 
     data: dict[str, Any] = {}
 
-    data[file_key] = doc_item.docname
+    # docname may be a shared FileItem. Dump as a plain str
+    data[file_key] = str(doc_item.docname)
     if doc_item.title is not None:
         data["title"] = doc_item.title
 
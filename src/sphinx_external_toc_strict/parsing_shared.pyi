@@ -11,6 +11,7 @@ from ._compat import (
 )
 from .api import (
     Document,
+    FileItem,
     SiteMap,
 )
 from .constants import (
@@ -28,7 +29,7 @@ if sys.version_info >= (3, 9):  # pragma: no cover
 else:  # pragma: no cover
     from typing import Sequence
 
-__all__: Final[tuple[str, str, str]]
+__all__: Final[tuple[str, str, str, str]]
 
 @dataclass(**DC_SLOTS)
 class FileFormat:
@@ -43,6 +44,7 @@ class FileFormat:
 
 FILE_FORMATS: dict[str, FileFormat]
 
+def intern_docname(docnames: dict[str, FileItem], docname: str) -> FileItem: ...
 def create_toc_dict(
     site_map: SiteMap,
     *,
@@ -34,13 +34,28 @@ and ``tests/_toc_files`` folders
 
    value: strictyaml scalar Validator
 
+.. py:data:: _scalar_coercion_map
+   :type: types.MappingProxyType[str, collections.abc.Callable[[typing.Any], typing.Any] | None]
+
+   Read-only mapping. Built from :py:data:`_scalar_affinity_map`. Native
+   coercion functions which fix the scalar value's type without a
+   strictyaml reload
+
+   key: field key
+
+   value: coercion function. None if the validator has no native equivalent
+
 """
 
 from __future__ import annotations
 
 import io
+import re
 import sys
 from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from functools import partial
 from pathlib import (
     Path,
     PurePath,
@@ -49,6 +64,8 @@ from types import MappingProxyType
 from typing import Any
 
 import strictyaml as s
+from strictyaml import constants as s_constants
+from strictyaml.validators import OrValidator
 
 from .api import (
     Document,
@@ -59,19 +76,33 @@ from .api import (
     TocTree,
     UrlItem,
 )
+from .cache import (
+    load_cache_entry,
+    store_site_map,
+    toc_cache_key,
+)
+from .compact import CompactSiteMap
 from .constants import (
     FILE_FORMAT_KEY,
     FILE_KEY,
     GLOB_KEY,
+    INCLUDE_KEY,
     REF_KEY,
     ROOT_KEY,
     TOCTREE_OPTIONS,
     URL_KEY,
 )
 from .exceptions import MalformedError
+from .lazy import LazySiteMap
+from .parsing_events import (
+    LOADERS,
+    load_yaml_events,
+    loads_yaml_events,
+)
 from .parsing_shared import (
     FILE_FORMATS,
     create_toc_dict,
+    intern_docname,
 )
 
 if sys.version_info >= (3, 9):  # pragma: no cover
@@ -103,6 +134,257 @@ _scalar_affinity_map = MappingProxyType(
 )
 
 
+# Unquoted str which YAML loads as itself. Anything else is left to strictyaml
+_re_plain_scalar = re.compile(r"\w(?:[\w .,/()+=~'!?&*%@-]*[\w.,/()+=~'!?&*%@-])?")
+_re_integer = re.compile(r"[-+]?[0-9_]*[0-9][0-9_]*")
+_true_values = frozenset(s_constants.TRUE_VALUES)
+_false_values = frozenset(s_constants.FALSE_VALUES)
+
+# Stats not collected. Reusable, does nothing
+_no_phase = nullcontext()
+
+# Native coercion outcomes, other than a coerced value
+# strictyaml would reject the value
+_REJECTED = object()
+# Not sure. Let strictyaml decide
+_UNRESOLVED = object()
+
+
+def _coerce_str(val):
+    """Native equivalent of :py:class:`strictyaml.Str`
+
+    :param val: scalar value
+    :type val: typing.Any
+    :returns: str or _UNRESOLVED
+    :rtype: typing.Any
+    :meta private:
+    """
+    str_val = f"{val}"
+    if _re_plain_scalar.fullmatch(str_val) is not None:
+        ret = str_val
+    else:
+        ret = _UNRESOLVED
+
+    return ret
+
+
+def _coerce_bool(val):
+    """Native equivalent of :py:class:`strictyaml.Bool`
+
+    :param val: scalar value
+    :type val: typing.Any
+    :returns: bool, _REJECTED, or _UNRESOLVED
+    :rtype: typing.Any
+    :meta private:
+    """
+    str_val = f"{val}"
+    str_lower = str_val.lower()
+    if str_lower in _true_values:
+        ret = True
+    elif str_lower in _false_values:
+        ret = False
+    elif _re_plain_scalar.fullmatch(str_val) is not None:
+        ret = _REJECTED
+    else:
+        ret = _UNRESOLVED
+
+    return ret
+
+
+def _coerce_int(val):
+    """Native equivalent of :py:class:`strictyaml.Int`
+
+    :param val: scalar value
+    :type val: typing.Any
+    :returns: int, _REJECTED, or _UNRESOLVED
+    :rtype: typing.Any
+    :meta private:
+    """
+    str_val = f"{val}"
+    if _re_integer.fullmatch(str_val) is not None:
+        ret = int(str_val.replace("_", ""))
+    elif _re_plain_scalar.fullmatch(str_val) is not None:
+        ret = _REJECTED
+    else:
+        ret = _UNRESOLVED
+
+    return ret
+
+
+def _scalar_coercer(validator):
+    """Get native coercion function equivalent of a strictyaml validator
+
+    :param validator: strictyaml validator
+    :type validator: strictyaml.validators.Validator
+    :returns: coercion function. None if no native equivalent
+    :rtype: collections.abc.Callable[[typing.Any], typing.Any] | None
+    :meta private:
+    """
+    cls = type(validator)
+    if cls is s.Str:
+        ret = _coerce_str
+    elif cls is s.Bool:
+        ret = _coerce_bool
+    elif cls is s.Int:
+        ret = _coerce_int
+    elif cls is OrValidator:
+        coerce_a = _scalar_coercer(validator._validator_a)
+        coerce_b = _scalar_coercer(validator._validator_b)
+        if coerce_a is None or coerce_b is None:
+            ret = None
+        else:
+
+            def _coerce_or(val):
+                """Try coercion a, only if rejected try coercion b."""
+                ret_a = coerce_a(val)
+                return coerce_b(val) if ret_a is _REJECTED else ret_a
+
+            ret = _coerce_or
+    elif cls is s.Seq:
+        coerce_item = _scalar_coercer(validator._validator)
+        if coerce_item is not _coerce_str:
+            ret = None
+        else:
+
+            def _coerce_seq(val):
+                """Sequence of plain str stays as is."""
+                is_plain = (
+                    type(val) is list
+                    and len(val) != 0
+                    and all(
+                        type(item) is str
+                        and _re_plain_scalar.fullmatch(item) is not None
+                        for item in val
+                    )
+                )
+                return list(val) if is_plain else _UNRESOLVED
+
+            ret = _coerce_seq
+    else:
+        ret = None
+
+    return ret
+
+
+_scalar_coercion_map = MappingProxyType(
+    {key: _scalar_coercer(val) for key, val in _scalar_affinity_map.items()},
+)
+
+
+def _coerce_val(
+    key,
+    val,
+    mapping=_scalar_affinity_map,
+    coercion_map=_scalar_coercion_map,
+):
+    """Fix a scalar value's type. Natively if possible, otherwise by strictyaml
+
+    Native coercion and strictyaml accept and reject the same values. When
+    rejected, strictyaml reloads the value, so the error message is the same
+
+    :param key: field key used in yaml file
+    :type key: str
+    :param val: value. Usually a str
+    :type val: typing.Any
+    :param mapping: Key is field key. Value is a strictyaml scalar Validator
+    :type mapping: types.MappingProxyType
+    :param coercion_map:
+
+       Key is field key. Value is a native coercion function. None to
+       build the coercion function from mapping
+
+    :type coercion_map: types.MappingProxyType | None
+    :returns: Value with fixed type
+    :rtype: str | int | bool | list[str]
+    :raises:
+
+       - :py:exc:`strictyaml.YAMLValidationError` -- Field value unexpected data type
+
+    :meta private:
+    """
+    if key not in mapping:
+        # a scalar str it began, a scalar str it shall remain!
+        return val
+    else:  # pragma: no cover
+        pass
+
+    if coercion_map is None:
+        coerce = _scalar_coercer(mapping[key])
+    else:
+        coerce = coercion_map.get(key)
+
+    if coerce is not None:
+        ret = coerce(val)
+        if ret is not _REJECTED and ret is not _UNRESOLVED:
+            return ret
+        else:  # pragma: no cover
+            pass
+    else:  # pragma: no cover
+        pass
+
+    # strictyaml decides. Raises the strictyaml error message
+    str_yaml = f"{val}"
+    schema = mapping[key]
+    try:
+        yml = s.dirty_load(str_yaml, schema, allow_flow_style=True)
+    except s.YAMLValidationError:
+        """strictyaml.exceptions.YAMLValidationError: when expecting an integer
+        E       found an arbitrary number
+        E         in "<unicode string>", line 1, column 1:
+        E           '1.12345'
+        E            ^ (line: 1)
+        """
+        raise
+    else:
+        ret = yml.data
+
+    return ret
+
+
+def _coerce_counted(key, val, stats):
+    """Fix a scalar value's type. When collecting stats, count and time it
+
+    :param key: field key
+    :type key: str
+    :param val: field value
+    :type val: typing.Any
+    :param stats: Collects scalar count and ``coerce`` phase wall time
+    :type stats: sphinx_external_toc_strict.stats.ParseStats | None
+    :returns: value with type fixed
+    :rtype: typing.Any
+    :raises:
+
+       - :py:exc:`strictyaml.YAMLValidationError` -- value rejected
+
+    :meta private:
+    """
+    if stats is None:
+        ret = _coerce_val(key, val)
+    else:
+        stats.scalars_coerced += 1
+        with stats.phase("coerce"):
+            ret = _coerce_val(key, val)
+
+    return ret
+
+
+def _phase(stats, name):
+    """Time a phase, when collecting stats
+
+    :param stats: Collects phase wall times
+    :type stats: sphinx_external_toc_strict.stats.ParseStats | None
+    :param name: phase name
+    :type name: str
+    :returns: context manager
+    :rtype: contextlib.AbstractContextManager[None]
+
+    :meta private:
+    """
+    ret = _no_phase if stats is None else stats.phase(name)
+
+    return ret
+
+
 def affinity_val(
     key,
     val,
@@ -149,25 +431,12 @@ def affinity_val(
     else:  # pragma: no cover
         pass
 
-    is_uninteresting = key not in mapping.keys()
-    if is_uninteresting:
-        # a scalar str it began, a scalar str it shall remain!
-        ret = val
+    if mapping is _scalar_affinity_map:
+        coercion_map = _scalar_coercion_map
     else:
-        str_yaml = f"{val}"
-        schema = mapping[key]
-        try:
-            yml = s.dirty_load(str_yaml, schema, allow_flow_style=True)
-        except s.YAMLValidationError:
-            """strictyaml.exceptions.YAMLValidationError: when expecting an integer
-            E       found an arbitrary number
-            E         in "<unicode string>", line 1, column 1:
-            E           '1.12345'
-            E            ^ (line: 1)
-            """
-            raise
-        else:
-            ret = yml.data
+        coercion_map = None
+
+    ret = _coerce_val(key, val, mapping=mapping, coercion_map=coercion_map)
 
     return ret
 
@@ -243,47 +512,438 @@ def dump_yaml(site_map):
     return ret
 
 
-def parse_toc_yaml(path, encoding="utf8"):
+def parse_toc_yaml(
+    path,
+    encoding="utf8",
+    cache_dir=None,
+    loader="strictyaml",
+    max_workers=None,
+    stats=None,
+    compact=False,
+    lazy=False,
+):
     """Parse the ToC file
 
+    Entries, ``include: [fragment file]``, include a ToC fragment file. A
+    fragment is a standalone ToC file, path relative to the including
+    file. When there are several fragments, they are parsed concurrently,
+    in a process pool. With a cache folder, each fragment is cached
+    separately, so editing one fragment reparses only that fragment
+
     :param path: `_toc.yml` file path
     :type path: str | pathlib.Path | strictyaml.YAML
     :param encoding: `_toc.yml` file character encoding
     :type encoding: str | None
+    :param cache_dir:
+
+       Default None. Folder to cache the parsed site map. Keyed by the
+       ToC file contents hash. Ignored unless path is a file path
+
+    :type cache_dir: str | pathlib.Path | None
+    :param loader:
+
+       Default "strictyaml". ToC file loader. ``events`` streams the
+       file thru the YAML parser; less memory for very large ToC files.
+       Ignored unless path is a file path. See
+       :py:data:`~sphinx_external_toc_strict.parsing_events.LOADERS`
+
+    :type loader: str
+    :param max_workers:
+
+       Default None. Process pool size, for parsing ToC fragments. None
+       for one process per CPU. 1 to parse fragments in this process
+
+    :type max_workers: int | None
+    :param stats: Default None. Filled in with per phase wall time and counts
+    :type stats: sphinx_external_toc_strict.stats.ParseStats | None
+    :param compact:
+
+       Default False. True to parse into a
+       :py:class:`~sphinx_external_toc_strict.compact.CompactSiteMap`.
+       Documents stored in array columns; less memory for very large sites
+
+    :type compact: bool
+    :param lazy:
+
+       Default False. True to parse into a
+       :py:class:`~sphinx_external_toc_strict.lazy.LazySiteMap`. Documents
+       are parsed on first access. With a cache folder, a cache hit is
+       already parsed
+
+    :type lazy: bool
     :return: parsed site map
     :rtype: sphinx_external_toc_strict.api.SiteMap
     :raises:
 
        - :py:exc:`ValueError` -- unsupported type expecting a
-         :py:class:`pathlib.Path` or :py:class:`strictyaml.YAML`
+         :py:class:`pathlib.Path` or :py:class:`strictyaml.YAML`.
+         Or unsupported loader. Or both compact and lazy
 
     """
     msg_exc = f"Expecting a Path or strictyaml.YAML got {type(path)}"
+    if loader not in LOADERS:
+        msg_loader = f"Unsupported loader {loader!r} expecting one of {LOADERS}"
+        raise ValueError(msg_loader)
+    else:  # pragma: no cover
+        pass
+    if compact and lazy:
+        msg_err = "compact and lazy site maps are exclusive. Choose one"
+        raise ValueError(msg_err)
+    else:  # pragma: no cover
+        pass
+
     is_pathlike = path is not None and (
         isinstance(path, str) or issubclass(type(path), PurePath)
     )
     if path is not None:
         if is_pathlike:
-            yml = load_yaml(path)
+            sm, _ = _parse_toc_file(
+                path,
+                encoding,
+                cache_dir,
+                loader,
+                max_workers,
+                (),
+                stats=stats,
+                compact=compact,
+                lazy=lazy,
+            )
+            return sm
         elif isinstance(path, s.YAML):
-            yml = path
+            data = path.data
         else:
             raise ValueError(msg_exc)
     else:
         raise ValueError(msg_exc)
 
-    sm = parse_toc_data(yml.data)
+    sm = parse_toc_data(data, stats=stats, compact=compact, lazy=lazy)
 
     return sm
 
 
-def parse_toc_data(data):
+def _parse_toc_file(
+    path,
+    encoding,
+    cache_dir,
+    loader,
+    max_workers,
+    ancestors,
+    stats=None,
+    compact=False,
+    lazy=False,
+):
+    """Parse a ToC file and the fragments it includes. Unchanged ToC
+    files are loaded from the cache
+
+    Module level, so a process pool worker can run it. Fragments are
+    always parsed into a :py:class:`~sphinx_external_toc_strict.api.SiteMap`
+
+    :param path: `_toc.yml` or fragment file path
+    :type path: str | pathlib.Path
+    :param encoding: `_toc.yml` file character encoding
+    :type encoding: str
+    :param cache_dir: Folder containing cached site maps. None for no cache
+    :type cache_dir: str | pathlib.Path | None
+    :param loader: ToC file loader
+    :type loader: str
+    :param max_workers: Process pool size. None for one process per CPU
+    :type max_workers: int | None
+    :param ancestors: Resolved paths of the ToC files including this file
+    :type ancestors: tuple[pathlib.Path, ...]
+    :param stats: Default None. Filled in with per phase wall time and counts
+    :type stats: sphinx_external_toc_strict.stats.ParseStats | None
+    :param compact: Default False. True to parse into a CompactSiteMap
+    :type compact: bool
+    :param lazy: Default False. True to parse into a LazySiteMap
+    :type lazy: bool
+    :return:
+
+       parsed site map and the included fragment files' path and cache
+       key pairs. Pairs include this file. Empty if no cache folder
+
+    :rtype: tuple[sphinx_external_toc_strict.api.SiteMap, tuple[tuple[str, str], ...]]
+    :raises:
+
+       - :py:exc:`MalformedError` -- ToC file includes itself
+
+    :meta private:
+    """
+    path_abs = Path(path).resolve()
+    if path_abs in ancestors:
+        raise MalformedError(f"include cycle: '{Path(path).as_posix()}'")
+    else:  # pragma: no cover
+        pass
+
+    if cache_dir is not None:
+        with _phase(stats, "cache"):
+            contents = path_abs.read_bytes()
+            key = toc_cache_key(contents, encoding=encoding, loader=loader)
+            t_entry = load_cache_entry(
+                cache_dir, path_abs, key, encoding=encoding, loader=loader
+            )
+        if t_entry is not None:
+            site_map, depends = t_entry
+            cls_site_map = CompactSiteMap if compact else SiteMap
+            if lazy:
+                # already parsed. Nothing to defer
+                pass
+            elif type(site_map) is not cls_site_map:
+                # cached by a parse with the other compact setting
+                site_map = cls_site_map.from_site_map(site_map)
+            else:  # pragma: no cover
+                pass
+            if stats is not None:
+                stats.count_site_map(site_map)
+            else:  # pragma: no cover
+                pass
+            return site_map, ((str(path_abs), key),) + depends
+        else:  # pragma: no cover
+            pass
+
+        with _phase(stats, "load"):
+            str_yaml = contents.decode(encoding)
+            del contents
+            if loader == "events":
+                data = loads_yaml_events(str_yaml)
+            else:
+                data = s.dirty_load(str_yaml, allow_flow_style=True).data
+            del str_yaml
+    else:
+        with _phase(stats, "load"):
+            if loader == "events":
+                data = load_yaml_events(path_abs, encoding=encoding)
+            else:
+                data = load_yaml(path_abs, encoding=encoding).data
+
+    with _phase(stats, "include"):
+        includes, depends = _parse_includes(
+            data,
+            path_abs.parent,
+            encoding,
+            cache_dir,
+            loader,
+            max_workers,
+            ancestors + (path_abs,),
+        )
+    site_map = parse_toc_data(
+        data, includes=includes, stats=stats, compact=compact, lazy=lazy
+    )
+
+    if cache_dir is not None:
+        with _phase(stats, "cache"):
+            store_site_map(cache_dir, path_abs, key, site_map, depends=depends)
+        ret = (site_map, ((str(path_abs), key),) + depends)
+    else:
+        ret = (site_map, ())
+
+    return ret
+
+
+def _find_includes(data):
+    """Find the fragment files included by ToC data
+
+    Any mapping, within a sequence, containing key ``include``. Keys are
+    not checked; :py:func:`parse_toc_data` does that
+
+    :param data: ToC data
+    :type data: typing.Any
+    :returns: included fragment file paths. Order of appearance, no duplicates
+    :rtype: list[str]
+    :meta private:
+    """
+    ret = []
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, Mapping):
+            stack.extend(reversed(list(node.values())))
+        elif isinstance(node, list):
+            for item in node:
+                if isinstance(item, Mapping) and INCLUDE_KEY in item:
+                    val = item[INCLUDE_KEY]
+                    if isinstance(val, str) and val not in ret:
+                        ret.append(val)
+                    else:  # pragma: no cover
+                        pass
+                else:  # pragma: no cover
+                    pass
+            stack.extend(reversed(node))
+        else:  # pragma: no cover
+            pass
+
+    return ret
+
+
+def _parse_includes(
+    data,
+    base_dir,
+    encoding,
+    cache_dir,
+    loader,
+    max_workers,
+    ancestors,
+):
+    """Parse the fragment files included by ToC data
+
+    More than one fragment, fragments are parsed in a process pool.
+    Fragments' own fragments are parsed by that worker process
+
+    :param data: ToC data
+    :type data: typing.Any
+    :param base_dir: including ToC file folder
+    :type base_dir: pathlib.Path
+    :param encoding: fragment files character encoding
+    :type encoding: str
+    :param cache_dir: Folder containing cached site maps. None for no cache
+    :type cache_dir: str | pathlib.Path | None
+    :param loader: ToC file loader
+    :type loader: str
+    :param max_workers: Process pool size. None for one process per CPU
+    :type max_workers: int | None
+    :param ancestors: Resolved paths of the including ToC files
+    :type ancestors: tuple[pathlib.Path, ...]
+    :returns:
+
+       include value --> parsed fragment site map. And the fragment
+       files' path and cache key pairs
+
+    :rtype: tuple[dict[str, sphinx_external_toc_strict.api.SiteMap], tuple[tuple[str, str], ...]]
+    :raises:
+
+       - :py:exc:`MalformedError` -- fragment file not found or invalid
+
+    :meta private:
+    """
+    includes = _find_includes(data)
+    d_paths = {}
+    for include in includes:
+        path_fragment = base_dir.joinpath(include)
+        if not path_fragment.is_file():
+            msg_exc = f"include file not found: '{include}'"
+            raise MalformedError(msg_exc)
+        else:  # pragma: no cover
+            pass
+        d_paths[include] = path_fragment
+
+    is_pool = len(d_paths) > 1 and (max_workers is None or max_workers > 1)
+    if is_pool:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    _parse_toc_file,
+                    path_fragment,
+                    encoding,
+                    cache_dir,
+                    loader,
+                    1,
+                    ancestors,
+                )
+                for path_fragment in d_paths.values()
+            ]
+            results = [future.result() for future in futures]
+    else:
+        results = [
+            _parse_toc_file(
+                path_fragment,
+                encoding,
+                cache_dir,
+                loader,
+                max_workers,
+                ancestors,
+            )
+            for path_fragment in d_paths.values()
+        ]
+
+    d_includes = {}
+    depends = []
+    for include, (site_map, fragment_depends) in zip(d_paths.keys(), results):
+        d_includes[include] = site_map
+        depends.extend(fragment_depends)
+
+    return d_includes, tuple(depends)
+
+
+def parse_toc_data(data, includes=None, stats=None, compact=False, lazy=False):
     """Parse a dictionary of the ToC
 
     :param data: ToC data dictionary
     :type data: dict[str, typing.Any]
+    :param includes:
+
+       Default None. ``include`` entry value --> parsed fragment site
+       map. The fragment root document becomes a file entry. The fragment
+       documents are merged into this site map
+
+    :type includes: collections.abc.Mapping[str, sphinx_external_toc_strict.api.SiteMap] | None
+    :param stats: Default None. Filled in with per phase wall time and counts
+    :type stats: sphinx_external_toc_strict.stats.ParseStats | None
+    :param compact:
+
+       Default False. True to parse into a
+       :py:class:`~sphinx_external_toc_strict.compact.CompactSiteMap`
+
+    :type compact: bool
+    :param lazy:
+
+       Default False. True to parse into a
+       :py:class:`~sphinx_external_toc_strict.lazy.LazySiteMap`. Documents
+       are indexed, and checked for duplicates, now. Parsed and validated
+       on first access. Stats count only the parsed documents
+
+    :type lazy: bool
     :return: parsed site map
     :rtype: sphinx_external_toc_strict.api.SiteMap
+    :raises:
+
+       - :py:exc:`ValueError` -- both compact and lazy
+
+    """
+    if compact and lazy:
+        msg_err = "compact and lazy site maps are exclusive. Choose one"
+        raise ValueError(msg_err)
+    else:  # pragma: no cover
+        pass
+
+    if stats is None:
+        site_map = _parse_toc_data(data, includes, None, compact=compact, lazy=lazy)
+    else:
+        with stats.phase("parse"):
+            site_map = _parse_toc_data(
+                data, includes, stats, compact=compact, lazy=lazy
+            )
+        if lazy:
+            # only parsed documents. Counting pending documents would parse them
+            pending = set(site_map.pending())
+            stats.count_site_map(
+                {
+                    docname: site_map[docname]
+                    for docname in site_map
+                    if docname not in pending
+                }
+            )
+        else:
+            stats.count_site_map(site_map)
+
+    return site_map
+
+
+def _parse_toc_data(data, includes, stats, compact=False, lazy=False):
+    """Parse a dictionary of the ToC. See :py:func:`parse_toc_data`
+
+    :param data: ToC data dictionary
+    :type data: dict[str, typing.Any]
+    :param includes: include entry value --> fragment site map
+    :type includes: collections.abc.Mapping[str, sphinx_external_toc_strict.api.SiteMap] | None
+    :param stats: Filled in with scalar count and phase wall times
+    :type stats: sphinx_external_toc_strict.stats.ParseStats | None
+    :param compact: Default False. True to parse into a CompactSiteMap
+    :type compact: bool
+    :param lazy: Default False. True to parse into a LazySiteMap
+    :type lazy: bool
+    :return: parsed site map
+    :rtype: sphinx_external_toc_strict.api.SiteMap
+
+    :meta private:
     """
     if not isinstance(data, Mapping):
         raise MalformedError(f"toc is not a mapping: {type(data)}")
@@ -300,7 +960,7 @@ def parse_toc_data(data):
     d_faults = data.get("defaults", {})
     for key_inner, val_inner in d_faults.items():
         try:
-            defaults[key_inner] = affinity_val(key_inner, val_inner)
+            defaults[key_inner] = _coerce_counted(key_inner, val_inner, stats)
         except s.YAMLValidationError as exc:
             exc_arg = exc.args[0] if exc.args else ""
             msg_exc = (
@@ -308,15 +968,25 @@ def parse_toc_data(data):
             )
             raise MalformedError(msg_exc)
 
+    # docname --> FileItem. Document docname is its parent's FileItem
+    docnames = {}
     doc_item, docs_list = _parse_doc_item(
-        data, defaults, "/", depth=0, is_root=True, file_format=file_format
+        data,
+        defaults,
+        "/",
+        depth=0,
+        is_root=True,
+        file_format=file_format,
+        includes=includes,
+        stats=stats,
+        docnames=docnames,
     )
 
     d_meta = data.get("meta")
     if d_meta is not None and isinstance(d_meta, Mapping):
         for k, v in d_meta.items():
             try:
-                v_2 = affinity_val(k, v)
+                v_2 = _coerce_counted(k, v, stats)
             except s.YAMLValidationError as exc:
                 exc_arg = exc.args[0] if exc.args else ""
                 msg_exc = f"Field value unexpected: {k}: {v} \n" f"{exc_arg}"
@@ -326,13 +996,39 @@ def parse_toc_data(data):
                 if v_2 is not v:
                     d_meta[k] = v_2
 
-    site_map = SiteMap(
+    if lazy:
+        cls_site_map = LazySiteMap
+    elif compact:
+        cls_site_map = CompactSiteMap
+    else:
+        cls_site_map = SiteMap
+    site_map = cls_site_map(
         root=doc_item,
         meta=d_meta,
         file_format=data.get(FILE_FORMAT_KEY),
     )
 
-    _parse_docs_list(docs_list, site_map, defaults, depth=1, file_format=file_format)
+    if lazy:
+        _index_docs_list(
+            docs_list,
+            site_map,
+            defaults,
+            depth=1,
+            file_format=file_format,
+            includes=includes,
+            docnames=docnames,
+        )
+    else:
+        _parse_docs_list(
+            docs_list,
+            site_map,
+            defaults,
+            depth=1,
+            file_format=file_format,
+            includes=includes,
+            stats=stats,
+            docnames=docnames,
+        )
 
     return site_map
 
@@ -345,6 +1041,9 @@ def _parse_doc_item(
     depth,
     file_format,
     is_root=False,
+    includes=None,
+    stats=None,
+    docnames=None,
 ):
     """Parse a single doc item
 
@@ -360,6 +1059,16 @@ def _parse_doc_item(
     :type file_format: FileFormat
     :param is_root: Default False. Whether this is the root item
     :type is_root: bool
+    :param includes: Default None. include entry value --> fragment site map
+    :type includes: collections.abc.Mapping[str, sphinx_external_toc_strict.api.SiteMap] | None
+    :param stats: Default None. Filled in with scalar count and phase wall times
+    :type stats: sphinx_external_toc_strict.stats.ParseStats | None
+    :param docnames:
+
+       Default None. docname --> shared FileItem. Filled in. None to not
+       share docnames
+
+    :type docnames: dict[str, sphinx_external_toc_strict.api.FileItem] | None
     :return: parsed doc item
     :rtype: tuple[sphinx_external_toc_strict.api.Document, collections.abc.Sequence[tuple[str, dict[str, typing.Any]]]]
     :raises:
@@ -368,6 +1077,7 @@ def _parse_doc_item(
 
     :meta private:
     """
+    path_item = path
     file_key = ROOT_KEY if is_root else FILE_KEY
     if file_key not in data.keys():
         raise MalformedError(f"'{file_key}' key not found @ '{path}'")
@@ -410,7 +1120,7 @@ def _parse_doc_item(
     else:
         subtrees_data = []
 
-    _known_link_keys = {FILE_KEY, GLOB_KEY, URL_KEY, REF_KEY}
+    _known_link_keys = {FILE_KEY, GLOB_KEY, URL_KEY, REF_KEY, INCLUDE_KEY}
 
     toctrees = []
     for toc_idx, toc_data in enumerate(subtrees_data):
@@ -447,7 +1157,7 @@ def _parse_doc_item(
                     f"entry contains incompatible keys "
                     f"{link_keys!r} @ '{toc_path}{items_key}/{item_idx}'"
                 )
-            for item_key in (GLOB_KEY, URL_KEY, REF_KEY):
+            for item_key in (GLOB_KEY, URL_KEY, REF_KEY, INCLUDE_KEY):
                 for other_key in (subtrees_key, items_key):
                     if link_keys == {item_key} and other_key in item_data:
                         raise MalformedError(
@@ -456,7 +1166,9 @@ def _parse_doc_item(
                         )
 
             try:
-                if link_keys == {FILE_KEY}:
+                if link_keys == {FILE_KEY} and docnames is not None:
+                    items.append(intern_docname(docnames, item_data[FILE_KEY]))
+                elif link_keys == {FILE_KEY}:
                     items.append(FileItem(item_data[FILE_KEY]))
                 elif link_keys == {GLOB_KEY}:
                     items.append(GlobItem(item_data[GLOB_KEY]))
@@ -464,6 +1176,16 @@ def _parse_doc_item(
                     items.append(UrlItem(item_data[URL_KEY], item_data.get("title")))
                 elif link_keys == {REF_KEY}:
                     items.append(RefItem(item_data[REF_KEY], item_data.get("title")))
+                elif link_keys == {INCLUDE_KEY}:
+                    include = item_data[INCLUDE_KEY]
+                    if includes is None or include not in includes:
+                        raise MalformedError(
+                            f"include file not loaded: '{include}' @ "
+                            f"'{toc_path}{items_key}/{item_idx}'"
+                        )
+                    else:  # pragma: no cover
+                        pass
+                    items.append(FileItem(includes[include].root.docname))
                 else:  # pragma: no cover unknown link key already handled
                     pass
             except (ValueError, TypeError) as exc:
@@ -486,12 +1208,17 @@ def _parse_doc_item(
             if k in toc_data:
                 try:
                     v = toc_data[k]
-                    v_2 = affinity_val(k, v)
+                    v_2 = _coerce_counted(k, v, stats)
                 except s.YAMLValidationError as exc:
                     exc_arg = exc.args[0] if exc.args else ""
                     msg_exc = f"Field value unexpected: {k}: {v} \n" f"{exc_arg}"
                     raise MalformedError(msg_exc)
                 else:
+                    if k == "caption" and type(v_2) is str:
+                        # many toctrees share a few captions
+                        v_2 = sys.intern(v_2)
+                    else:  # pragma: no cover
+                        pass
                     d_keywords[k] = v_2
 
         for key in defaults:
@@ -502,7 +1229,8 @@ def _parse_doc_item(
 
         try:
             # toc_item = TocTree(items=items, **keywords)
-            toc_item = TocTree(items=items, **d_keywords)
+            with _phase(stats, "construct"):
+                toc_item = TocTree(items=items, **d_keywords)
         except (ValueError, TypeError) as exc:
             exc_arg = exc.args[0] if exc.args else ""
             raise MalformedError(
@@ -510,43 +1238,87 @@ def _parse_doc_item(
             ) from exc
         toctrees.append(toc_item)
 
+    docname = data[file_key]
+    if docnames is not None and type(docname) is str:
+        # the parent toctree's FileItem
+        docname = docnames.get(docname, docname)
+    else:  # pragma: no cover
+        pass
+
     try:
-        doc_item = Document(
-            docname=data[file_key], title=data.get("title"), subtrees=toctrees
-        )
+        with _phase(stats, "construct"):
+            doc_item = Document(
+                docname=docname, title=data.get("title"), subtrees=toctrees
+            )
     except (ValueError, TypeError) as exc:
         exc_arg = exc.args[0] if exc.args else ""
         raise MalformedError(f"doc validation @ '{path}': {exc_arg}") from exc
 
     # list of docs that need to be parsed recursively (and path)
-    """docs_to_be_parsed_list = [
-        (
-            f"{path}/{items_key}/{ii}/"
-            if shorthand_used
-            else f"{path}{ti}/{items_key}/{ii}/",
-            item_data,
-        )
-        for ti, toc_data in enumerate(subtrees_data)
-        for ii, item_data in enumerate(toc_data[items_key])
-        if FILE_KEY in item_data
-    ]
+    docs_to_be_parsed_list = _doc_item_children(
+        data, path_item, depth=depth, file_format=file_format
+    )
+
+    return (
+        doc_item,
+        docs_to_be_parsed_list,
+    )
+
+
+def _doc_item_children(data, path, *, depth, file_format):
+    """A doc item's child doc items, and includes, with their path. Not
+    validated; malformed entries are skipped
+
+    :param data: doc item dictionary
+    :type data: dict[str, typing.Any]
+    :param path: doc item file path
+    :type path: str
+    :param depth: recursive depth (starts at 0)
+    :type depth: int
+    :param file_format: doc item file format
+    :type file_format: FileFormat
+    :returns: child doc items' path and dictionary
+    :rtype: list[tuple[str, dict[str, typing.Any]]]
+
+    :meta private:
     """
-    docs_to_be_parsed_list = []
+    subtrees_key = file_format.get_subtrees_key(depth)
+    items_key = file_format.get_items_key(depth)
+    shorthand_used = items_key in data
+    if shorthand_used:
+        subtrees_data = [{items_key: data[items_key]}]
+    elif subtrees_key in data:
+        subtrees_data = data[subtrees_key]
+        path = f"{path}{subtrees_key}/"
+    else:
+        subtrees_data = []
+
+    ret = []
+    if not isinstance(subtrees_data, Sequence) or isinstance(subtrees_data, str):
+        return ret
+    else:  # pragma: no cover
+        pass
     for ti, toc_data in enumerate(subtrees_data):
-        for ii, item_data in enumerate(toc_data[items_key]):
-            if FILE_KEY in item_data:
+        items_data = toc_data.get(items_key) if isinstance(toc_data, Mapping) else None
+        if not isinstance(items_data, Sequence) or isinstance(items_data, str):
+            continue
+        else:  # pragma: no cover
+            pass
+        for ii, item_data in enumerate(items_data):
+            is_child = isinstance(item_data, Mapping) and (
+                FILE_KEY in item_data or INCLUDE_KEY in item_data
+            )
+            if is_child:
                 str_path = (
                     f"{path}/{items_key}/{ii}/"
                     if shorthand_used
                     else f"{path}{ti}/{items_key}/{ii}/"
                 )
-                t_pair = (str_path, item_data)
-                docs_to_be_parsed_list.append(t_pair)
+                ret.append((str_path, item_data))
+            else:  # pragma: no cover
+                pass
 
-    return (
-        doc_item,
-        docs_to_be_parsed_list,
-    )
+    return ret
 
 
 def _parse_docs_list(
@@ -556,8 +1328,17 @@ def _parse_docs_list(
     *,
     depth,
     file_format,
+    includes=None,
+    stats=None,
+    docnames=None,
 ):
-    """Parse a list of docs
+    """Parse a list of docs and, depth first, all their descendants.
+
+    Rather than recursion, uses a stack of pending docs lists. Deeply
+    nested ToC do not hit the interpreter recursion limit. Documents are
+    parsed in the same order as recursion would, so the same
+    :py:exc:`~sphinx_external_toc_strict.exceptions.MalformedError`
+    is raised
 
     :param docs_list: sequence of doc items
     :type docs_list: collections.abc.Sequence[tuple[str, dict[str, typing.Any]]]
@@ -565,17 +1346,48 @@ def _parse_docs_list(
     :type site_map: sphinx_external_toc_strict.SiteMap
     :param defaults: default doc item values
     :type defaults: dict[str, typing.Any]
-    :param depth: recursive depth (starts at 0)
+    :param depth: depth of docs_list items (starts at 0)
     :type depth: int
     :param file_format: doc item file format
     :type file_format: FileFormat
+    :param includes: Default None. include entry value --> fragment site map
+    :type includes: collections.abc.Mapping[str, sphinx_external_toc_strict.api.SiteMap] | None
+    :param stats: Default None. Filled in with scalar count and phase wall times
+    :type stats: sphinx_external_toc_strict.stats.ParseStats | None
+    :param docnames: Default None. docname --> shared FileItem. Filled in
+    :type docnames: dict[str, sphinx_external_toc_strict.api.FileItem] | None
     :raises:
 
        - :py:exc:`MalformedError` -- doc file used multiple times
 
     :meta private:
     """
-    for child_path, doc_data in docs_list:
+    # Each pending list is reversed. pop() takes the next doc and drops
+    # the reference, so parsed docs' raw data is released
+    stack = [(depth, list(reversed(docs_list)))]
+    while stack:
+        depth_current, pending = stack[-1]
+        if not pending:
+            stack.pop()
+            continue
+        else:  # pragma: no cover
+            pass
+
+        child_path, doc_data = pending.pop()
+        if INCLUDE_KEY in doc_data:
+            # fragment already parsed. Merge, in place of the entry
+            for docname, doc in includes[doc_data[INCLUDE_KEY]].items():
+                if docname in site_map:
+                    raise MalformedError(
+                        f"document file used multiple times: '{docname}'"
+                    )
+                else:  # pragma: no cover
+                    pass
+                site_map[docname] = doc
+            continue
+        else:  # pragma: no cover
+            pass
+
         docname = doc_data[FILE_KEY]
         if docname in site_map:
             raise MalformedError(f"document file used multiple times: '{docname}'")
@@ -583,15 +1395,149 @@ def _parse_docs_list(
             doc_data,
             defaults,
             child_path,
-            depth=depth,
+            depth=depth_current,
             file_format=file_format,
+            includes=includes,
+            stats=stats,
+            docnames=docnames,
         )
-        site_map[docname] = child_item
+        # key is the shared docname
+        site_map[child_item.docname] = child_item
 
-        _parse_docs_list(
-            child_docs_list,
-            site_map,
+        if child_docs_list:
+            stack.append((depth_current + 1, list(reversed(child_docs_list))))
+        else:  # pragma: no cover
+            pass
+
+
+def _parse_pending(doc_data, defaults, path, depth, file_format, includes, docnames):
+    """Parse a lazy site map's pending doc item. Its children are
+    already indexed
+
+    :param doc_data: doc item dictionary
+    :type doc_data: dict[str, typing.Any]
+    :param defaults: doc item defaults dictionary
+    :type defaults: dict[str, typing.Any]
+    :param path: doc item file path
+    :type path: str
+    :param depth: doc item depth
+    :type depth: int
+    :param file_format: doc item file format
+    :type file_format: FileFormat
+    :param includes: include entry value --> fragment site map
+    :type includes: collections.abc.Mapping[str, sphinx_external_toc_strict.api.SiteMap] | None
+    :param docnames: docname --> shared FileItem. Filled in
+    :type docnames: dict[str, sphinx_external_toc_strict.api.FileItem]
+    :returns: parsed doc item
+    :rtype: sphinx_external_toc_strict.api.Document
+    :raises:
+
+       - :py:exc:`MalformedError` -- invalid doc item
+
+    :meta private:
+    """
+    doc_item, _ = _parse_doc_item(
+        doc_data,
+        defaults,
+        path,
+        depth=depth,
+        file_format=file_format,
+        includes=includes,
+        docnames=docnames,
+    )
+
+    return doc_item
+
+
+def _index_docs_list(
+    docs_list,
+    site_map,
+    defaults,
+    *,
+    depth,
+    file_format,
+    includes=None,
+    docnames=None,
+):
+    """Index a list of docs and, depth first, all their descendants. Each
+    doc item is added pending, parsed on first access
+
+    Same order, and same document file used multiple times check, as
+    :py:func:`_parse_docs_list`. Children are found without parsing
+
+    :param docs_list: sequence of doc items
+    :type docs_list: collections.abc.Sequence[tuple[str, dict[str, typing.Any]]]
+    :param site_map: lazy site map
+    :type site_map: sphinx_external_toc_strict.lazy.LazySiteMap
+    :param defaults: default doc item values
+    :type defaults: dict[str, typing.Any]
+    :param depth: depth of docs_list items (starts at 0)
+    :type depth: int
+    :param file_format: doc item file format
+    :type file_format: FileFormat
+    :param includes: Default None. include entry value --> fragment site map
+    :type includes: collections.abc.Mapping[str, sphinx_external_toc_strict.api.SiteMap] | None
+    :param docnames: Default None. docname --> shared FileItem. Filled in
+    :type docnames: dict[str, sphinx_external_toc_strict.api.FileItem] | None
+    :raises:
+
+       - :py:exc:`MalformedError` -- doc file used multiple times. Or
+         include file not loaded
+
+    :meta private:
+    """
+    stack = [(depth, list(reversed(docs_list)))]
+    while stack:
+        depth_current, pending = stack[-1]
+        if not pending:
+            stack.pop()
+            continue
+        else:  # pragma: no cover
+            pass
+
+        child_path, doc_data = pending.pop()
+        if INCLUDE_KEY in doc_data:
+            include = doc_data[INCLUDE_KEY]
+            if includes is None or include not in includes:
+                raise MalformedError(
+                    f"include file not loaded: '{include}' @ '{child_path}'"
+                )
+            else:  # pragma: no cover
+                pass
+            # fragment already parsed. Merge, in place of the entry
+            for docname, doc in includes[include].items():
+                if docname in site_map:
+                    raise MalformedError(
+                        f"document file used multiple times: '{docname}'"
+                    )
+                else:  # pragma: no cover
+                    pass
+                site_map[docname] = doc
+            continue
+        else:  # pragma: no cover
+            pass
+
+        docname = doc_data[FILE_KEY]
+        if docname in site_map:
+            raise MalformedError(f"document file used multiple times: '{docname}'")
+        else:  # pragma: no cover
+            pass
+        parse = partial(
+            _parse_pending,
+            doc_data,
             defaults,
-            depth=depth + 1,
-            file_format=file_format,
+            child_path,
+            depth_current,
+            file_format,
+            includes,
+            docnames,
+        )
+        site_map.add_pending(docname, parse)
+
+        child_docs_list = _doc_item_children(
+            doc_data, child_path, depth=depth_current, file_format=file_format
         )
+        if child_docs_list:
+            stack.append((depth_current + 1, list(reversed(child_docs_list))))
+        else:  # pragma: no cover
+            pass
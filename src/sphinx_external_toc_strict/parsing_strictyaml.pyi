@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import sys
+from contextlib import AbstractContextManager
 from dataclasses import (
     dataclass,
     fields,
 )
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 import strictyaml as s
@@ -16,13 +18,16 @@ from ._compat import (
 )
 from .api import (
     Document,
+    FileItem,
     SiteMap,
 )
 from .constants import (
     DEFAULT_ITEMS_KEY,
     DEFAULT_SUBTREES_KEY,
 )
+from .lazy import LazySiteMap
 from .parsing_shared import FileFormat
+from .stats import ParseStats
 
 if sys.version_info >= (3, 8):  # pragma: no cover
     from typing import Final
@@ -31,21 +36,88 @@ else:  # pragma: no cover
 
 if sys.version_info >= (3, 9):  # pragma: no cover
     from collections.abc import (
+        Callable,
         Iterable,
+        Mapping,
         Sequence,
     )
 else:  # pragma: no cover
     from typing import (
+        Callable,
         Iterable,
+        Mapping,
         Sequence,
     )
 
 __all__: Final[tuple[str, str, str, str, str]]
 
+_scalar_affinity_map: MappingProxyType[str, s.Validator]
+_scalar_coercion_map: MappingProxyType[str, Callable[[Any], Any] | None]
+
+def _coerce_str(val: Any) -> Any: ...
+def _coerce_bool(val: Any) -> Any: ...
+def _coerce_int(val: Any) -> Any: ...
+def _scalar_coercer(validator: s.Validator) -> Callable[[Any], Any] | None: ...
+def _coerce_val(
+    key: str,
+    val: Any,
+    mapping: MappingProxyType[str, s.Validator] = ...,
+    coercion_map: MappingProxyType[str, Callable[[Any], Any] | None] | None = ...,
+) -> Any: ...
+def _coerce_counted(key: str, val: Any, stats: ParseStats | None) -> Any: ...
+def _phase(stats: ParseStats | None, name: str) -> AbstractContextManager[None]: ...
+def affinity_val(
+    key: str,
+    val: Any,
+    mapping: MappingProxyType[str, s.Validator] = ...,
+) -> Any: ...
 def dump_yaml(site_map: SiteMap | dict[str, Any]) -> str: ...
 def load_yaml(path: str | Path, encoding: str = "utf8") -> s.YAML: ...
-def parse_toc_yaml(path: str | Path | s.YAML, encoding: str = "utf8") -> SiteMap: ...
-def parse_toc_data(data: dict[str, Any]) -> SiteMap: ...
+def parse_toc_yaml(
+    path: str | Path | s.YAML,
+    encoding: str = "utf8",
+    cache_dir: str | Path | None = None,
+    loader: str = "strictyaml",
+    max_workers: int | None = None,
+    stats: ParseStats | None = None,
+    compact: bool = False,
+    lazy: bool = False,
+) -> SiteMap: ...
+def _parse_toc_file(
+    path: str | Path,
+    encoding: str,
+    cache_dir: str | Path | None,
+    loader: str,
+    max_workers: int | None,
+    ancestors: tuple[Path, ...],
+    stats: ParseStats | None = None,
+    compact: bool = False,
+    lazy: bool = False,
+) -> tuple[SiteMap, tuple[tuple[str, str], ...]]: ...
+def _find_includes(data: Any) -> list[str]: ...
+def _parse_includes(
+    data: Any,
+    base_dir: Path,
+    encoding: str,
+    cache_dir: str | Path | None,
+    loader: str,
+    max_workers: int | None,
+    ancestors: tuple[Path, ...],
+) -> tuple[dict[str, SiteMap], tuple[tuple[str, str], ...]]: ...
+def parse_toc_data(
+    data: dict[str, Any],
+    includes: Mapping[str, SiteMap] | None = None,
+    stats: ParseStats | None = None,
+    compact: bool = False,
+    lazy: bool = False,
+) -> SiteMap: ...
+def _parse_toc_data(
+    data: dict[str, Any],
+    includes: Mapping[str, SiteMap] | None,
+    stats: ParseStats | None,
+    compact: bool = False,
+    lazy: bool = False,
+) -> SiteMap: ...
 def _parse_doc_item(
     data: dict[str, Any],
     defaults: dict[str, Any],
@@ -54,7 +126,17 @@ def _parse_doc_item(
     depth: int,
     file_format: FileFormat,
     is_root: bool = False,
+    includes: Mapping[str, SiteMap] | None = None,
+    stats: ParseStats | None = None,
+    docnames: dict[str, FileItem] | None = None,
 ) -> tuple[Document, Sequence[tuple[str, dict[str, Any]]]]: ...
+def _doc_item_children(
+    data: dict[str, Any],
+    path: str,
+    *,
+    depth: int,
+    file_format: FileFormat,
+) -> list[tuple[str, dict[str, Any]]]: ...
 def _parse_docs_list(
     docs_list: Sequence[tuple[str, dict[str, Any]]],
     site_map: SiteMap,
@@ -62,4 +144,26 @@ def _parse_docs_list(
     *,
     depth: int,
     file_format: FileFormat,
+    includes: Mapping[str, SiteMap] | None = None,
+    stats: ParseStats | None = None,
+    docnames: dict[str, FileItem] | None = None,
+) -> None: ...
+def _parse_pending(
+    doc_data: dict[str, Any],
+    defaults: dict[str, Any],
+    path: str,
+    depth: int,
+    file_format: FileFormat,
+    includes: Mapping[str, SiteMap] | None,
+    docnames: dict[str, FileItem] | None,
+) -> Document: ...
+def _index_docs_list(
+    docs_list: Sequence[tuple[str, dict[str, Any]]],
+    site_map: LazySiteMap,
+    defaults: dict[str, Any],
+    *,
+    depth: int,
+    file_format: FileFormat,
+    includes: Mapping[str, SiteMap] | None = None,
+    docnames: dict[str, FileItem] | None = None,
 ) -> None: ...
@@ -4,8 +4,8 @@
 Query sphinx.ext.intersphinx inventories.
 
 .. py:data:: __all__
-   :type: tuple[str, str]
-   :value: ("fake_node", "query_intersphinx")
+   :type: tuple[str, str, str]
+   :value: ("fake_node", "query_intersphinx", "inventory_key")
 
    Module exports
 
@@ -31,6 +31,9 @@ Query sphinx.ext.intersphinx inventories.
 
 """
 
+import posixpath
+from pathlib import Path
+
 from docutils import nodes
 from sphinx import addnodes
 from sphinx.ext.intersphinx import missing_reference
@@ -38,6 +41,7 @@ from sphinx.ext.intersphinx import missing_reference
 __all__ = (
     "fake_node",
     "query_intersphinx",
+    "inventory_key",
 )
 
 
@@ -127,3 +131,105 @@ def query_intersphinx(app, target, contents=None, domain="std", ref_type="ref"):
         t_ret = (docname, url)
 
     return t_ret
+
+
+def _inventory_locations(app):
+    """Inventory locations of each intersphinx target URI
+
+    :param app: Sphinx app instance
+    :type app: sphinx.application.Sphinx
+    :returns: target URI --> inventory locations. None is the default location
+    :rtype: dict[str, tuple[str | None, ...]]
+
+    :meta private:
+    """
+    mapping = getattr(app.config, "intersphinx_mapping", None) or {}
+    ret = {}
+    for value in mapping.values():
+        # normalized by intersphinx. name --> (name, (target URI, locations))
+        try:
+            _, (target_uri, locations) = value
+        except (TypeError, ValueError):
+            continue
+        ret[str(target_uri)] = tuple(locations)
+
+    return ret
+
+
+def _inventory_stamp(srcdir, target_uri, locations, fetched):
+    """Identify one inventory's contents
+
+    intersphinx reads local inventory files again every build, so the
+    fetch time always changes. Local files are identified by size and
+    mtime instead. An inventory with any remote location keeps the fetch
+    time, which only changes once the remote inventory is fetched again
+
+    :param srcdir: Sphinx source folder. Local locations are relative to it
+    :type srcdir: str | pathlib.Path
+    :param target_uri: intersphinx target URI
+    :type target_uri: str
+    :param locations: inventory locations. None if target URI unknown
+    :type locations: tuple[str | None, ...] | None
+    :param fetched: inventory fetch time
+    :type fetched: int
+    :returns: fetch time. Or local files' location, size, and mtime_ns
+    :rtype: int | tuple[tuple[str, int | None, int | None], ...]
+
+    :meta private:
+    """
+    if locations is None:
+        return fetched
+    else:  # pragma: no cover
+        pass
+
+    inv_locations = []
+    for location in locations or (None,):
+        if location is None:
+            inv_location = posixpath.join(target_uri, "objects.inv")
+        else:
+            inv_location = location
+        if "://" in inv_location:
+            return fetched
+        else:  # pragma: no cover
+            pass
+        inv_locations.append(inv_location)
+
+    stamps = []
+    for inv_location in inv_locations:
+        try:
+            st = Path(srcdir).joinpath(inv_location).stat()
+        except OSError:
+            stamps.append((inv_location, None, None))
+        else:
+            stamps.append((inv_location, st.st_size, st.st_mtime_ns))
+    ret = tuple(stamps)
+
+    return ret
+
+
+def inventory_key(app):
+    """Identify the loaded intersphinx inventories. Changes when an
+    inventory is added, removed, or its contents may have changed
+
+    Local inventory files are identified by size and mtime. Remote
+    inventories by fetch time
+
+    :param app: Sphinx app instance
+    :type app: sphinx.application.Sphinx
+    :returns: inventory URI, name, and contents stamp. Sorted. Disabled ref types
+    :rtype: tuple[tuple[tuple[str, str, typing.Any], ...], tuple[str, ...]]
+    """
+    cache = getattr(app.env, "intersphinx_cache", None) or {}
+    locations = _inventory_locations(app)
+    entries = []
+    for uri in sorted(cache, key=str):
+        name, fetched = cache[uri][:2]
+        uri = str(uri)
+        stamp = _inventory_stamp(app.srcdir, uri, locations.get(uri), fetched)
+        entries.append((uri, str(name), stamp))
+    inventories = tuple(entries)
+    disabled_reftypes = getattr(app.config, "intersphinx_disabled_reftypes", None)
+    disabled = tuple(sorted(disabled_reftypes or ()))
+    ret = (inventories, disabled)
+
+    return ret
@@ -1,3 +1,4 @@
+from pathlib import Path
 from typing import Any
 
 import sphinx
@@ -13,6 +14,7 @@ from sphinx.application import Sphinx
 __all__ = (
     "fake_node",
     "query_intersphinx",
+    "inventory_key",
 )
 
 def fake_node(
@@ -29,3 +31,13 @@ def query_intersphinx(
     domain: str | None = ...,
     ref_type: str | None = ...,
 ) -> tuple[str | None, str | None]: ...
+def _inventory_locations(app: Sphinx) -> dict[str, tuple[str | None, ...]]: ...
+def _inventory_stamp(
+    srcdir: str | Path,
+    target_uri: str,
+    locations: tuple[str | None, ...] | None,
+    fetched: int,
+) -> int | tuple[tuple[str, int | None, int | None], ...]: ...
+def inventory_key(
+    app: Sphinx,
+) -> tuple[tuple[tuple[str, str, Any], ...], tuple[str, ...]]: ...
@@ -0,0 +1,136 @@
+"""
+.. moduleauthor:: Dave Faulkmore <https://mastodon.social/@msftcangoblowme>
+
+Where does ToC parsing spend its time? Per phase wall time and counts.
+
+Pass a :py:class:`ParseStats` to
+:py:func:`~sphinx_external_toc_strict.parsing_strictyaml.parse_toc_yaml`
+or :py:func:`~sphinx_external_toc_strict.parsing_strictyaml.parse_toc_data`.
+It is filled in while parsing.
+
+Phases
+
+- ``cache`` -- cache lookup and store
+
+- ``load`` -- read ToC file and load the YAML
+
+- ``include`` -- parse included fragment files. Includes their phases
+
+- ``coerce`` -- fix scalar value types
+
+- ``construct`` -- create and validate Document and TocTree instances
+
+- ``parse`` -- :py:func:`~sphinx_external_toc_strict.parsing_strictyaml.parse_toc_data`.
+  Includes ``coerce`` and ``construct``
+
+- ``new_excluded`` -- Sphinx only. Walk source folder for documents not in ToC
+
+.. py:data:: __all__
+   :type: tuple[str]
+   :value: ("ParseStats",)
+
+   Module exports
+
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from dataclasses import (
+    dataclass,
+    field,
+)
+
+from ._compat import DC_SLOTS
+
+__all__ = ("ParseStats",)
+
+
+@dataclass(**DC_SLOTS)
+class ParseStats:
+    """Per phase wall time and counts, of parsing a ToC
+
+    :ivar times: phase name --> accumulated wall time in seconds
+    :vartype times: dict[str, float]
+    :ivar documents: document count
+    :vartype documents: int
+    :ivar toctrees: toctree count
+    :vartype toctrees: int
+    :ivar items: item kind, e.g. ``FileItem``, --> count
+    :vartype items: dict[str, int]
+    :ivar scalars_coerced: scalar values which had their type fixed
+    :vartype scalars_coerced: int
+    """
+
+    times: dict[str, float] = field(default_factory=dict)
+    documents: int = 0
+    toctrees: int = 0
+    items: dict[str, int] = field(default_factory=dict)
+    scalars_coerced: int = 0
+
+    @contextmanager
+    def phase(self, name):
+        """Time a phase. Time accumulates, if phase is timed more than once
+
+        :param name: phase name
+        :type name: str
+        :returns: context manager
+        :rtype: collections.abc.Iterator[None]
+        """
+        time_start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - time_start
+            self.times[name] = self.times.get(name, 0.0) + elapsed
+
+    def count_site_map(self, site_map):
+        """Count documents, toctrees, and items by kind
+
+        :param site_map: parsed site map
+        :type site_map: sphinx_external_toc_strict.api.SiteMap
+        """
+        items = self.items
+        for doc in site_map.values():
+            self.documents += 1
+            for toctree in doc.subtrees:
+                self.toctrees += 1
+                for item in toctree.items:
+                    kind = type(item).__name__
+                    items[kind] = items.get(kind, 0) + 1
+
+    def as_json(self):
+        """Stats as a dict
+
+        :returns: JSON serializable dict
+        :rtype: dict[str, typing.Any]
+        """
+        ret = {
+            "times": dict(self.times),
+            "documents": self.documents,
+            "toctrees": self.toctrees,
+            "items": dict(self.items),
+            "scalars_coerced": self.scalars_coerced,
+        }
+
+        return ret
+
+    def format(self):
+        """Stats as human readable lines
+
+        :returns: one line per phase and per count
+        :rtype: str
+        """
+        lines = [
+            f"{name:<14}{seconds * 1000:>12.2f} ms"
+            for name, seconds in self.times.items()
+        ]
+        lines.append(f"{'documents':<14}{self.documents:>12}")
+        lines.append(f"{'toctrees':<14}{self.toctrees:>12}")
+        for kind, count in sorted(self.items.items()):
+            lines.append(f"{kind:<14}{count:>12}")
+        lines.append(f"{'scalars':<14}{self.scalars_coerced:>12}")
+        ret = "\n".join(lines)
+
+        return ret
@@ -0,0 +1,29 @@
+import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from ._compat import DC_SLOTS
+from .api import SiteMap
+
+if sys.version_info >= (3, 8):  # pragma: no cover
+    from typing import Final
+else:  # pragma: no cover
+    from typing_extensions import Final
+
+__all__: Final[tuple[str]]
+
+@dataclass(**DC_SLOTS)
+class ParseStats:
+    times: dict[str, float] = ...
+    documents: int = 0
+    toctrees: int = 0
+    items: dict[str, int] = ...
+    scalars_coerced: int = 0
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]: ...
+    def count_site_map(self, site_map: SiteMap) -> None: ...
+    def as_json(self) -> dict[str, Any]: ...
+    def format(self) -> str: ...
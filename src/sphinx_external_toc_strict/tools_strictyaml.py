@@ -15,17 +15,22 @@ from typing import Any
 
 from .api import (
     Document,
-    FileItem,
     SiteMap,
     TocTree,
+    trusted_construction,
 )
+from .compact import CompactSiteMap
 from .constants import (
     DEFAULT_ITEMS_KEY,
     DEFAULT_SUBTREES_KEY,
 )
 from .exceptions import MalformedError
 from .filename_suffix import strip_suffix
-from .parsing_shared import create_toc_dict
+from .manifest import manifest_tree
+from .parsing_shared import (
+    create_toc_dict,
+    intern_docname,
+)
 from .parsing_strictyaml import (
     load_yaml,
     parse_toc_data,
@@ -264,7 +269,10 @@ def site_map_guess_titles(
         words = name.split("_")
         # remove first word if is an integer
         words = words[1:] if words and all(c.isdigit() for c in words[0]) else words
-        site_map[docname].title = " ".join(words).capitalize()
+        # documents may be views. Set again
+        doc = site_map[docname]
+        doc.title = " ".join(words).capitalize()
+        site_map[docname] = doc
 
 
 def create_site_map_from_path(
@@ -274,6 +282,8 @@ def create_site_map_from_path(
     default_index="index",
     ignore_matches=(".*",),
     file_format=None,
+    manifest=None,
+    compact=False,
 ):
     """Create the site-map from a folder structure.
 
@@ -299,6 +309,20 @@ def create_site_map_from_path(
     :type ignore_matches: collections.abc.Sequence[str]
     :param file_format: Default None. File format if specified
     :type file_format: str | None
+    :param manifest:
+
+       Default None. File paths relative to ``root_path``, e.g. from
+       :py:func:`~sphinx_external_toc_strict.manifest.read_manifest`. The
+       folder tree is built from these, rather than from the filesystem
+
+    :type manifest: collections.abc.Iterable[str] | None
+    :param compact:
+
+       Default False. True to create a
+       :py:class:`~sphinx_external_toc_strict.compact.CompactSiteMap`.
+       Documents stored in array columns; less memory for very large sites
+
+    :type compact: bool
     :returns: Site map created from folder tree starting at ``root_path``
     :rtype: sphinx_external_toc_strict.api.SiteMap
     :raises:
@@ -308,9 +332,17 @@ def create_site_map_from_path(
 
     """
     root_path = Path(root_path)
+    if manifest is not None:
+        # folder path --> file names and folder names. No filesystem I/O
+        tree = {
+            root_path.joinpath(folder): listing
+            for folder, listing in manifest_tree(manifest).items()
+        }
+    else:
+        tree = None
     # assess root. raises NotADirectoryError
     root_index, root_files, root_folders = _assess_folder(
-        root_path, suffixes, default_index, ignore_matches
+        root_path, suffixes, default_index, ignore_matches, tree=tree
     )
 
     is_no_index = root_index is None or root_index != default_index
@@ -320,50 +352,63 @@ def create_site_map_from_path(
     else:  # pragma: no cover
         pass
 
-    # create root item and child folders
-    root_item, indexed_folders = _doc_item_from_path(
-        root_path,
-        root_path,
-        root_index,
-        root_files,
-        root_folders,
-        suffixes,
-        default_index,
-        ignore_matches,
-    )
-
-    # create base site-map
-    site_map = SiteMap(root=root_item, file_format=file_format)
-    # we add all files to the site map, even if they don't have descendants
-    # so we may later change their title
-    for root_file in root_files:
-        site_map[root_file] = Document(root_file)
-
-    # while there are subfolders add them to the site-map
-    while indexed_folders:
-        (
-            sub_path,
-            child_index,
-            child_files,
-            child_folders,
-        ) = indexed_folders.pop(0)
-        for child_file in child_files:
-            child_docname = (sub_path / child_file).relative_to(root_path).as_posix()
-            assert child_docname not in site_map
-            site_map[child_docname] = Document(child_docname)
-        doc_item, new_indexed_folders = _doc_item_from_path(
+    # docname --> FileItem. Shared by toctree item, Document, and site map key
+    docnames = {}
+    # Documents are built from the folder tree. Valid by construction
+    with trusted_construction():
+        # create root item and child folders
+        root_item, indexed_folders = _doc_item_from_path(
+            root_path,
             root_path,
-            sub_path,
-            child_index,
-            child_files,
-            child_folders,
+            root_index,
+            root_files,
+            root_folders,
             suffixes,
             default_index,
             ignore_matches,
+            docnames=docnames,
+            tree=tree,
         )
-        assert doc_item.docname not in site_map
-        site_map[doc_item.docname] = doc_item
-        indexed_folders += new_indexed_folders
+
+        # create base site-map
+        cls_site_map = CompactSiteMap if compact else SiteMap
+        site_map = cls_site_map(root=root_item, file_format=file_format)
+        # we add all files to the site map, even if they don't have descendants
+        # so we may later change their title
+        for root_file in root_files:
+            docname = intern_docname(docnames, root_file)
+            site_map[docname] = Document(docname)
+
+        # while there are subfolders add them to the site-map
+        while indexed_folders:
+            (
+                sub_path,
+                child_index,
+                child_files,
+                child_folders,
+            ) = indexed_folders.pop(0)
+            for child_file in child_files:
+                path_child = sub_path / child_file
+                child_docname = intern_docname(
+                    docnames, path_child.relative_to(root_path).as_posix()
+                )
+                assert child_docname not in site_map
+                site_map[child_docname] = Document(child_docname)
+            doc_item, new_indexed_folders = _doc_item_from_path(
+                root_path,
+                sub_path,
+                child_index,
+                child_files,
+                child_folders,
+                suffixes,
+                default_index,
+                ignore_matches,
+                docnames=docnames,
+                tree=tree,
+            )
+            assert doc_item.docname not in site_map
+            site_map[doc_item.docname] = doc_item
+            indexed_folders += new_indexed_folders
 
     return site_map
 
@@ -377,6 +422,8 @@ def _doc_item_from_path(
     suffixes,
     default_index,
     ignore_matches,
+    docnames=None,
+    tree=None,
 ):
     """Return the :py:class:`sphinx_external_toc_strict.api.Document`
     and children folders that contain an index.
@@ -397,6 +444,18 @@ def _doc_item_from_path(
     :type default_index: str
     :param ignore_matches: index names to ignore
     :type ignore_matches: collections.abc.Sequence[str]
+    :param docnames:
+
+       Default None. docname --> shared FileItem. Filled in. None to not
+       share docnames
+
+    :type docnames: dict[str, sphinx_external_toc_strict.api.FileItem] | None
+    :param tree:
+
+       Default None. Folder path --> file names and folder names. None to
+       list folders from the filesystem
+
+    :type tree: dict[pathlib.Path, tuple[collections.abc.Sequence[str], collections.abc.Sequence[str]]] | None
     :returns:
 
        tuple containing: Document, list of sub_folder, child_index,
@@ -405,8 +464,13 @@ def _doc_item_from_path(
     :rtype: tuple[sphinx_external_toc_strict.api.Document, list[tuple[pathlib.Path, str, collections.abc.Sequence[str], collections.abc.Sequence[str]]]]
     :meta private:
     """
+    if docnames is None:
+        docnames = {}
+    else:  # pragma: no cover
+        pass
+
     file_items = [
-        FileItem((folder / name).relative_to(root).as_posix())
+        intern_docname(docnames, (folder / name).relative_to(root).as_posix())
         for name in other_docnames
     ]
 
@@ -417,18 +481,21 @@ def _doc_item_from_path(
         sub_folder = folder / folder_name
         # raises NotADirectoryError if root folder is not a folder
         child_index, child_files, child_folders = _assess_folder(
-            sub_folder, suffixes, default_index, ignore_matches
+            sub_folder, suffixes, default_index, ignore_matches, tree=tree
         )
         if not child_index:
             # TODO handle folders with no files, but files in sub-folders
             continue
         indexed_folders.append((sub_folder, child_index, child_files, child_folders))
         index_items.append(
-            FileItem((sub_folder / child_index).relative_to(root).as_posix())
+            intern_docname(
+                docnames, (sub_folder / child_index).relative_to(root).as_posix()
+            )
         )
 
+    docname = (folder / index_docname).relative_to(root).as_posix()
     doc_item = Document(
-        docname=(folder / index_docname).relative_to(root).as_posix(),
+        docname=docnames.get(docname, docname),
         subtrees=(
             [TocTree(items=file_items + index_items)]  # type: ignore[arg-type]
             if (file_items or index_items)
@@ -481,6 +548,7 @@ def _assess_folder(
     suffixes,
     default_index,
     ignore_matches,
+    tree=None,
 ):
     """Assess the folder for ToC items. Strips suffixes from file names and
     sorts file/folder names by natural order.
@@ -493,6 +561,12 @@ def _assess_folder(
     :type default_index: str
     :param ignore_matches: list of glob patterns of files to ignore
     :type ignore_matches: collections.abc.Sequence[str]
+    :param tree:
+
+       Default None. Folder path --> file names and folder names. None to
+       list the folder from the filesystem
+
+    :type tree: dict[pathlib.Path, tuple[collections.abc.Sequence[str], collections.abc.Sequence[str]]] | None
     :returns: (index file name, other file names, folders)
     :rtype: tuple[str | None, collections.abc.Sequence[str], collections.abc.Sequence[str]]
     :raises:
@@ -501,29 +575,34 @@ def _assess_folder(
 
     :meta private:
     """
-    if not folder.is_dir():
-        raise NotADirectoryError(f"path must be a directory: {folder}")
+    if tree is not None:
+        if folder not in tree:
+            raise NotADirectoryError(f"path must be a directory: {folder}")
+        file_names, folder_names = tree[folder]
+    else:
+        if not folder.is_dir():
+            raise NotADirectoryError(f"path must be a directory: {folder}")
+        file_names = [path.name for path in folder.iterdir() if path.is_file()]
+        folder_names = [path.name for path in folder.iterdir() if path.is_dir()]
 
     # conversion to a set is to remove duplicates, e.g. doc.rst and doc.md
     sub_files = natural_sort(
         list(
             set(
                 [
-                    strip_suffix(path.name, suffixes)
-                    for path in folder.iterdir()
-                    if path.is_file()
-                    and any(path.name.endswith(suffix) for suffix in suffixes)
-                    and (not any(fnmatch(path.name, pat) for pat in ignore_matches))
+                    strip_suffix(name, suffixes)
+                    for name in file_names
+                    if any(name.endswith(suffix) for suffix in suffixes)
+                    and (not any(fnmatch(name, pat) for pat in ignore_matches))
                 ]
             )
         )
     )
     sub_folders = natural_sort(
         [
-            path.name
-            for path in folder.iterdir()
-            if path.is_dir()
-            if (not any(fnmatch(path.name, pat) for pat in ignore_matches))
+            name
+            for name in folder_names
+            if (not any(fnmatch(name, pat) for pat in ignore_matches))
         ]
     )
 
@@ -4,6 +4,7 @@ from typing import Any
 
 from .api import (
     Document,
+    FileItem,
     SiteMap,
 )
 
@@ -45,6 +46,8 @@ def create_site_map_from_path(
     default_index: str = "index",
     ignore_matches: Sequence[str] = (".*",),
     file_format: str | None = None,
+    manifest: Iterable[str] | None = None,
+    compact: bool = False,
 ) -> SiteMap: ...
 def _doc_item_from_path(
     root: Path,
@@ -55,6 +58,8 @@ def _doc_item_from_path(
     suffixes: Sequence[str],
     default_index: str,
     ignore_matches: Sequence[str],
+    docnames: dict[str, FileItem] | None = None,
+    tree: dict[Path, tuple[Sequence[str], Sequence[str]]] | None = None,
 ) -> tuple[Document, list[tuple[Path, str, Sequence[str], Sequence[str]]]]: ...
 def natural_sort(iterable: Iterable[str]) -> list[str]: ...
 def _assess_folder(
@@ -62,6 +67,7 @@ def _assess_folder(
     suffixes: Sequence[str],
     default_index: str,
     ignore_matches: Sequence[str],
+    tree: dict[Path, tuple[Sequence[str], Sequence[str]]] | None = None,
 ) -> tuple[str | None, Sequence[str], Sequence[str]]: ...
 def migrate_jupyter_book(
     toc: Path | dict[str, Any] | list[dict[str, Any]],
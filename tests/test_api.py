@@ -15,10 +15,23 @@ Unit test -- Module
 
 """
 
+import glob
+import json
+import os
+import pickle
+import random
+import shutil
+import sys
 from contextlib import nullcontext as does_not_raise
+from pathlib import Path
 
 import pytest
+from sphinx.util.matching import (
+    Matcher,
+    patmatch,
+)
 
+from benchmarks.generate import generate_site_map
 from sphinx_external_toc_strict.api import (
     Document,
     FileItem,
@@ -151,3 +164,591 @@ def test_sitemap_get_changed_subtrees_numbered():
     root2.subtrees = [TocTree([], numbered=True)]
     sitemap2 = SiteMap(root2)
     assert sitemap1.get_changed(sitemap2) == {"root"}
+
+
+def _get_changed_reference(site_map, previous):
+    """Compare every document. As get_changed used to
+
+    :param site_map: current site map
+    :type site_map: sphinx_external_toc_strict.api.SiteMap
+    :param previous: SiteMap to compare against
+    :type previous: sphinx_external_toc_strict.api.SiteMap
+    :returns: changed docnames
+    :rtype: set[str]
+    """
+    ret = set()
+    for name, doc in site_map.items():
+        if name not in previous or previous[name] != doc:
+            ret.add(name)
+        else:  # pragma: no cover
+            pass
+    return ret
+
+
+def test_sitemap_get_changed_fingerprints():
+    """Branch fingerprints roll up. Same changes as comparing every document."""
+    # pytest --showlocals --log-level INFO -k "test_sitemap_get_changed_fingerprints" tests
+    site_map = generate_site_map(
+        docs=300, depth=4, fan_out=6, glob_ratio=0.1, url_ratio=0.1, ref_ratio=0.1
+    )
+    previous = pickle.loads(pickle.dumps(site_map))
+    assert site_map.get_changed(previous) == set()
+    starts, digests = site_map.fingerprints()
+    assert starts == ("index",)
+    assert set(digests) == set(site_map)
+    # fingerprints pickled. Not recomputed after unpickling
+    restored = pickle.loads(pickle.dumps(site_map))
+    assert restored._fingerprints == site_map.fingerprints()
+    # pickling does not cache fingerprints on the instance
+    site_map_fresh = generate_site_map(docs=10, depth=2, fan_out=3)
+    restored = pickle.loads(pickle.dumps(site_map_fresh))
+    assert site_map_fresh._fingerprints is None
+    assert restored._fingerprints == site_map_fresh.fingerprints()
+
+    # change a leaf. Only its ancestors' branch fingerprints change
+    changed_name = next(name for name, doc in site_map.items() if not doc.subtrees)
+    ancestors = {changed_name}
+    child = changed_name
+    while True:
+        parent = next(
+            (name for name, doc in site_map.items() if child in doc.child_files()),
+            None,
+        )
+        if parent is None:
+            break
+        ancestors.add(parent)
+        child = parent
+    site_map[changed_name] = Document(changed_name, title="Changed")
+    _, digests_changed = site_map.fingerprints()
+    branch_changed = {
+        name for name in digests if digests[name][1] != digests_changed[name][1]
+    }
+    assert branch_changed == ancestors
+    own_changed = {
+        name for name in digests if digests[name][0] != digests_changed[name][0]
+    }
+    assert own_changed == {changed_name}
+    assert site_map.get_changed(previous) == {changed_name}
+
+    # add, remove, and edit documents. Same as comparing every document
+    rng = random.Random(0)
+    for _ in range(20):
+        current = pickle.loads(pickle.dumps(previous))
+        for name in rng.sample(sorted(current), 5):
+            doc = current[name]
+            if rng.random() < 0.5:
+                current[name] = Document(name, subtrees=doc.subtrees, title="New")
+            elif doc.subtrees:
+                tree = doc.subtrees[0]
+                items = tree.items[:-1] + [FileItem(f"{name}_new")]
+                subtrees = [TocTree(items, caption="new")] + doc.subtrees[1:]
+                current[name] = Document(name, subtrees=subtrees, title=doc.title)
+                current[f"{name}_new"] = Document(f"{name}_new")
+            else:  # pragma: no cover
+                pass
+        expected = _get_changed_reference(current, previous)
+        assert current.get_changed(previous) == expected
+        assert previous.get_changed(current) == _get_changed_reference(
+            previous, current
+        )
+
+
+def test_sitemap_fingerprints_orphans_and_cycles():
+    """Documents not reachable from root, and cycles, still compared."""
+
+    # pytest --showlocals --log-level INFO -k "test_sitemap_fingerprints_orphans_and_cycles" tests
+    def _site_map(title):
+        """root --> a <--> b. orphan unreachable."""
+        site_map = SiteMap(Document("root", subtrees=[TocTree([FileItem("a")])]))
+        site_map["a"] = Document("a", subtrees=[TocTree([FileItem("b")])])
+        site_map["b"] = Document("b", subtrees=[TocTree([FileItem("a")])], title=title)
+        site_map["orphan"] = Document("orphan", title=title)
+        return site_map
+
+    previous = _site_map("old")
+    current = _site_map("new")
+    starts, _ = current.fingerprints()
+    assert starts == ("root", "orphan")
+    assert current.get_changed(previous) == {"b", "orphan"}
+    assert current.get_changed(_site_map("new")) == set()
+    # cache cleared on delete
+    del current["orphan"]
+    assert current.fingerprints()[0] == ("root",)
+    assert current.get_changed(previous) == {"b"}
+
+
+testdata_sitemap_match_globs = (
+    "doc1",
+    "doc12",
+    "doc",
+    "folder/doc1",
+    "folder/sub/doc1",
+    "other/page",
+    "other/x/page",
+    "a[1]",
+    "chapter.1",
+    "chapterX1",
+    "",
+)
+
+
+@pytest.mark.parametrize("posix_no_suffix", testdata_sitemap_match_globs)
+def test_sitemap_match_globs(posix_no_suffix):
+    """One compiled matcher. Same result as patmatch per glob."""
+    # pytest --showlocals --log-level INFO -k "test_sitemap_match_globs" tests
+    globs = ["doc?", "folder/*", "other/**/page", "a[[]1]", "chapter.?"]
+    root = Document("root", subtrees=[TocTree([GlobItem(glob) for glob in globs])])
+    site_map = SiteMap(root)
+    expected = any(patmatch(posix_no_suffix, glob) for glob in globs)
+    assert site_map.match_globs(posix_no_suffix) is expected
+
+
+def test_sitemap_glob_index():
+    """Glob index follows set and delete. Documents not scanned per match."""
+    # pytest --showlocals --log-level INFO -k "test_sitemap_glob_index" tests
+    site_map = SiteMap(Document("root", subtrees=[TocTree([FileItem("a")])]))
+    assert site_map.globs() == set()
+    assert site_map.match_globs("b/doc") is False
+
+    site_map["a"] = Document("a", subtrees=[TocTree([GlobItem("b/*")])])
+    assert site_map.globs() == {"b/*"}
+    assert site_map.match_globs("b/doc") is True
+    matcher = site_map._glob_matcher
+
+    # same globs --> matcher kept
+    site_map["c"] = Document("c")
+    site_map["a"] = Document("a", subtrees=[TocTree([GlobItem("b/*")])])
+    assert site_map._glob_matcher is matcher
+
+    # replaced globs
+    site_map["a"] = Document("a", subtrees=[TocTree([GlobItem("c/*")])])
+    assert site_map.match_globs("b/doc") is False
+    assert site_map.match_globs("c/doc") is True
+
+    # deleted
+    del site_map["a"]
+    assert site_map.globs() == set()
+    assert site_map.match_globs("c/doc") is False
+
+    # many documents. matching does not visit documents
+    for idx in range(1_000):
+        docname = f"doc{idx}"
+        site_map[docname] = Document(
+            docname, subtrees=[TocTree([GlobItem(f"{docname}/*")])]
+        )
+    assert site_map.match_globs("doc999/x") is True
+
+    def _fail(self):
+        """match_globs must use the index."""
+        raise AssertionError("documents scanned")
+
+    child_globs_orig = Document.child_globs
+    Document.child_globs = _fail
+    try:
+        assert site_map.match_globs("doc500/x") is True
+        assert site_map.match_globs("doc500") is False
+        assert len(site_map.globs()) == 1_000
+    finally:
+        Document.child_globs = child_globs_orig
+
+
+def test_sitemap_pickle():
+    """Pickled without matcher. Pickle without glob index gets one."""
+    # pytest --showlocals --log-level INFO -k "test_sitemap_pickle" tests
+    root = Document("root", subtrees=[TocTree([GlobItem("b/*")])])
+    site_map = SiteMap(root)
+    assert site_map.match_globs("b/doc") is True
+    assert site_map._glob_matcher is not None
+
+    site_map_copy = pickle.loads(pickle.dumps(site_map))
+    assert site_map_copy._glob_matcher is None
+    assert site_map_copy.match_globs("b/doc") is True
+
+    # pickled before the glob index existed
+    state = site_map.__getstate__()
+    del state["_globs"]
+    del state["_glob_matcher"]
+    site_map_old = SiteMap.__new__(SiteMap)
+    site_map_old.__setstate__(state)
+    assert site_map_old.globs() == {"b/*"}
+    assert site_map_old.match_globs("b/doc") is True
+
+
+def _new_excluded_glob(site_map, srcdir, source_suffix, exclude_patterns):
+    """Reference. A recursive glob per suffix, each path prefix matched
+
+    :param site_map: site map
+    :type site_map: sphinx_external_toc_strict.api.SiteMap
+    :param srcdir: source folder
+    :type srcdir: pathlib.Path
+    :param source_suffix: document file suffixes
+    :type source_suffix: collections.abc.Sequence[str]
+    :param exclude_patterns: glob patterns of documents to exclude
+    :type exclude_patterns: collections.abc.Sequence[str]
+    :returns: files to exclude
+    :rtype: list[str]
+    """
+    ret = []
+    already_excluded = Matcher(exclude_patterns)
+    for suffix in source_suffix:
+        for path_str in glob.iglob(
+            str(Path(srcdir) / "**" / f"*{suffix}"), recursive=True
+        ):
+            path = Path(path_str)
+            if not path.is_file():
+                continue
+            posix = path.relative_to(srcdir).as_posix()
+            posix_no_suffix = posix[: -len(suffix)]
+            components = posix.split("/")
+            if not (
+                posix in site_map
+                or posix_no_suffix in site_map
+                or any(
+                    already_excluded("/".join(components[: i + 1]))
+                    for i in range(len(components))
+                )
+                or site_map.match_globs(posix_no_suffix)
+            ):
+                ret.append(posix)
+    return ret
+
+
+testdata_new_excluded_walk = (
+    ([".rst", ".md"], []),
+    ([".md", ".rst"], ["_build"]),
+    ([".rst", ".md", ".txt"], ["_build", "**/deep/e.rst", "sub/c*", "link"]),
+    ([".rst"], ["sub"]),
+    ([".rst"], ["sub/deep/*", "weird.rst"]),
+)
+
+
+@pytest.mark.parametrize("source_suffix, exclude_patterns", testdata_new_excluded_walk)
+def test_new_excluded_walk(source_suffix, exclude_patterns, tmp_path):
+    """One pruning walk. Same exclude list as a recursive glob per suffix."""
+    # pytest --showlocals --log-level INFO -k "test_new_excluded_walk" tests
+    files = (
+        "index.rst",
+        "doc1.rst",
+        "doc2.md",
+        "extra.rst",
+        "extra.md",
+        ".hidden.rst",
+        ".hid/x.rst",
+        "_build/html/x.rst",
+        "_build/html/y.md",
+        "sub/a.rst",
+        "sub/b.txt",
+        "sub/c.rst",
+        "sub/.d/h.rst",
+        "sub/deep/d.md",
+        "sub/deep/e.rst",
+        "weird.rst/f.rst",
+        "g/p1.rst",
+        "g/p2.md",
+    )
+    for file_name in files:
+        path = tmp_path.joinpath(file_name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("", encoding="utf8")
+    try:
+        tmp_path.joinpath("link").symlink_to(tmp_path / "sub", target_is_directory=True)
+    except OSError:  # pragma: no cover
+        pass
+
+    items = [FileItem("doc1"), FileItem("doc2.md"), FileItem("sub/a"), GlobItem("g/*")]
+    site_map = SiteMap(Document("index", subtrees=[TocTree(items)]))
+    for docname in ("doc1", "doc2.md", "sub/a"):
+        site_map[docname] = Document(docname)
+
+    expected = _new_excluded_glob(site_map, tmp_path, source_suffix, exclude_patterns)
+    actual = site_map.new_excluded(tmp_path, source_suffix, exclude_patterns)
+    assert actual == expected
+    # manifest rather than walk. Same exclude list. Manifest lists no symlinks
+    actual_manifest = site_map.new_excluded(
+        tmp_path, source_suffix, exclude_patterns, manifest=files
+    )
+    expected_no_link = [path for path in expected if not path.startswith("link/")]
+    assert sorted(actual_manifest) == sorted(expected_no_link)
+    assert "extra.rst" in actual
+    assert all(not part.startswith(".") for path in actual for part in path.split("/"))
+
+
+def test_new_excluded_snapshot(tmp_path, monkeypatch):
+    """Folders with unchanged mtime not listed again. Same exclude list."""
+    # pytest --showlocals --log-level INFO -k "test_new_excluded_snapshot" tests
+    from sphinx_external_toc_strict import api
+
+    files = ("index.rst", "doc1.rst", "extra.rst", "sub/a.rst", "sub/deep/b.md")
+    for file_name in files:
+        path = tmp_path.joinpath(file_name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("", encoding="utf8")
+
+    def _set_old_mtimes():
+        """Folder mtimes well before the walk, so snapshot trusts them."""
+        for folder in (tmp_path, tmp_path / "sub", tmp_path / "sub" / "deep"):
+            if folder.exists():
+                os.utime(folder, ns=(1_000_000_000, 1_000_000_000))
+            else:  # pragma: no cover
+                pass
+
+    listed = []
+    list_folder_orig = api._list_folder
+
+    def _list_folder(folder, prefix, suffixes, is_excluded):
+        """Count folder listings."""
+        listed.append(prefix)
+        return list_folder_orig(folder, prefix, suffixes, is_excluded)
+
+    monkeypatch.setattr(api, "_list_folder", _list_folder)
+
+    site_map = SiteMap(Document("index", subtrees=[TocTree([FileItem("doc1")])]))
+    site_map["doc1"] = Document("doc1")
+    source_suffix = [".rst", ".md"]
+    _set_old_mtimes()
+
+    # first walk lists every folder
+    snapshot = {}
+    expected = site_map.new_excluded(tmp_path, source_suffix, [])
+    listed.clear()
+    actual = site_map.new_excluded(tmp_path, source_suffix, [], snapshot=snapshot)
+    assert actual == expected
+    assert sorted(listed) == ["", "sub/", "sub/deep/"]
+    assert set(snapshot) == {"", "sub/", "sub/deep/"}
+
+    # nothing changed. Nothing listed
+    listed.clear()
+    actual = site_map.new_excluded(tmp_path, source_suffix, [], snapshot=snapshot)
+    assert actual == expected
+    assert listed == []
+
+    # add a file. Only its folder is listed again
+    tmp_path.joinpath("sub", "new.rst").write_text("", encoding="utf8")
+    listed.clear()
+    actual = site_map.new_excluded(tmp_path, source_suffix, [], snapshot=snapshot)
+    assert "sub/new.rst" in actual
+    assert listed == ["sub/"]
+    assert actual == site_map.new_excluded(tmp_path, source_suffix, [])
+
+    # folder modified moments ago. Not trusted next walk
+    assert snapshot["sub/"][0] is None
+    listed.clear()
+    site_map.new_excluded(tmp_path, source_suffix, [], snapshot=snapshot)
+    assert listed == ["sub/"]
+
+    # remove a folder. Dropped from snapshot
+    shutil.rmtree(tmp_path / "sub" / "deep")
+    _set_old_mtimes()
+    actual = site_map.new_excluded(tmp_path, source_suffix, [], snapshot=snapshot)
+    assert actual == site_map.new_excluded(tmp_path, source_suffix, [])
+    assert "sub/deep/b.md" not in actual
+    assert set(snapshot) == {"", "sub/"}
+
+
+def _parent_reference(site_map, docname):
+    """Scan every document's child files. First document set wins
+
+    :param site_map: site map
+    :type site_map: sphinx_external_toc_strict.api.SiteMap
+    :param docname: document name
+    :type docname: str
+    :returns: parent docname or None
+    :rtype: str | None
+    """
+    return next(
+        (name for name, doc in site_map.items() if docname in doc.child_files()),
+        None,
+    )
+
+
+def test_sitemap_parent_index():
+    """parent_of and ancestors_of stay correct as documents are set and deleted."""
+    # pytest --showlocals --log-level INFO -k "test_sitemap_parent_index" tests
+    site_map = generate_site_map(docs=200, depth=4, fan_out=5)
+    for docname in site_map:
+        assert site_map.parent_of(docname) == _parent_reference(site_map, docname)
+    assert site_map.parent_of("index") is None
+    with pytest.raises(KeyError):
+        site_map.parent_of("nonexistent")
+
+    deepest = max(site_map, key=lambda name: name.count("/"))
+    ancestors = site_map.ancestors_of(deepest)
+    assert ancestors[-1] == "index"
+    assert len(ancestors) == deepest.count("/") + 1
+    for child, parent in zip([deepest] + ancestors, ancestors):
+        assert site_map.parent_of(child) == parent
+
+    # listed by two documents. Second takes over when first is removed
+    rng = random.Random(0)
+    docnames = sorted(name for name in site_map if name != "index")
+    for _ in range(50):
+        name = rng.choice(docnames)
+        doc = site_map[name]
+        other = rng.choice(docnames)
+        if rng.random() < 0.5 and other != name:
+            # also list other, at the end
+            items = [FileItem(other)]
+            site_map[name] = Document(name, subtrees=doc.subtrees + [TocTree(items)])
+        else:
+            # forget children
+            site_map[name] = Document(name, title=doc.title)
+        for docname in site_map:
+            expected = _parent_reference(site_map, docname)
+            actual = site_map.parent_of(docname)
+            # reference picks by site map order, index by set order
+            if expected is None:
+                assert actual is None
+            else:
+                assert docname in site_map[actual].child_files()
+
+    # delete a parent. Its children have no parent
+    name = next(name for name in docnames if site_map[name].child_files())
+    children = site_map[name].child_files()
+    del site_map[name]
+    for child in children:
+        if child in site_map:
+            assert site_map.parent_of(child) == _parent_reference(site_map, child)
+        else:  # pragma: no cover
+            pass
+
+    # index rebuilt for a pickle without one
+    restored = pickle.loads(pickle.dumps(site_map))
+    state = site_map.__getstate__()
+    del state["_parents"]
+    del state["_parents_extra"]
+    restored.__setstate__(state)
+
+    def _all_parents(sm):
+        """child docname --> every parent docname."""
+        return {
+            child: {parent, *sm._parents_extra.get(child, ())}
+            for child, parent in sm._parents.items()
+        }
+
+    assert _all_parents(restored) == _all_parents(site_map)
+
+
+def test_sitemap_walk():
+    """ToC order, depth first. Deep ToC does not hit the recursion limit."""
+    # pytest --showlocals --log-level INFO -k "test_sitemap_walk" tests
+    site_map = SiteMap(
+        Document("index", subtrees=[TocTree([FileItem("a"), FileItem("b")])])
+    )
+    site_map["a"] = Document(
+        "a", subtrees=[TocTree([FileItem("a1"), FileItem("b"), FileItem("x")])]
+    )
+    site_map["a1"] = Document("a1")
+    # cycle back to root
+    site_map["b"] = Document("b", subtrees=[TocTree([FileItem("index")])])
+    site_map["orphan"] = Document("orphan")
+    actual = [(depth, parent, doc.docname) for depth, parent, doc in site_map.walk()]
+    assert actual == [
+        (0, None, "index"),
+        (1, "index", "a"),
+        (2, "a", "a1"),
+        (1, "index", "b"),
+    ]
+    # cycle guard
+    assert site_map.ancestors_of("index") == ["b"]
+
+    # deeper than the recursion limit
+    depth_max = sys.getrecursionlimit() + 500
+    site_map = SiteMap(Document("d0", subtrees=[TocTree([FileItem("d1")])]))
+    for idx in range(1, depth_max):
+        subtrees = [TocTree([FileItem(f"d{idx + 1}")])] if idx < depth_max - 1 else []
+        site_map[f"d{idx}"] = Document(f"d{idx}", subtrees=subtrees)
+    depths = [depth for depth, _, _ in site_map.walk()]
+    assert depths == list(range(depth_max))
+    assert len(site_map.ancestors_of(f"d{depth_max - 1}")) == depth_max - 1
+
+
+@pytest.mark.parametrize("file_format", ["default", "jb-book"])
+def test_sitemap_iter_json(file_format, tmp_path):
+    """Streamed JSON. Same output as json.dumps of as_json."""
+    # pytest --showlocals --log-level INFO -k "test_sitemap_iter_json" tests
+    site_map = generate_site_map(
+        docs=100,
+        glob_ratio=0.2,
+        url_ratio=0.2,
+        ref_ratio=0.2,
+        file_format=file_format,
+    )
+    site_map.meta.update({"regress": "intro", "create_files": ["a", "b"], "x": "é"})
+    expected = json.dumps(site_map.as_json())
+    chunks = list(site_map.iter_json())
+    assert len(chunks) > len(site_map)
+    assert "".join(chunks) == expected
+
+    path_json = tmp_path / "site_map.json"
+    with path_json.open("w", encoding="utf8") as f:
+        site_map.dump_json(f)
+    assert path_json.read_text(encoding="utf8") == expected
+
+
+def test_sitemap_docname_index():
+    """Sphinx docname to document. Mixed .rst and .md sites."""
+    # pytest --showlocals --log-level INFO -k "test_sitemap_docname_index" tests
+    source_suffix = {".rst": "restructuredtext", ".md": "markdown"}
+    site_map = SiteMap(Document("intro.rst"))
+    for docname in ("a/doc1.md", "both.md", "both.rst", "plain", "plain.md"):
+        site_map[docname] = Document(docname)
+
+    def _reference(docname):
+        """docname, then docname with each source suffix, in order."""
+        doc = site_map.get(docname)
+        for suffix in source_suffix:
+            if doc is None:
+                doc = site_map.get(docname + suffix)
+            else:  # pragma: no cover
+                pass
+        return doc
+
+    for docname in ("intro", "a/doc1", "both", "plain", "plain.md", "missing", "a"):
+        assert site_map.get_by_docname(docname, source_suffix) == _reference(docname)
+    assert site_map.get_by_docname("both", source_suffix).docname == "both.rst"
+    assert site_map.get_by_docname("both", [".md", ".rst"]).docname == "both.md"
+    # exact docname wins over a suffix
+    assert site_map.get_by_docname("plain", source_suffix).docname == "plain"
+
+    # cached. Cleared by a new or deleted document, not by replacing one
+    index = site_map.docname_index(source_suffix)
+    assert site_map.docname_index(source_suffix) is index
+    site_map["plain"] = Document("plain", title="Plain")
+    assert site_map.docname_index(source_suffix) is index
+    site_map["new.md"] = Document("new.md")
+    assert site_map.get_by_docname("new", source_suffix).docname == "new.md"
+    del site_map["new.md"]
+    assert site_map.get_by_docname("new", source_suffix) is None
+
+    # not pickled
+    site_map_unpickled = pickle.loads(pickle.dumps(site_map))
+    assert site_map_unpickled._docname_index is None
+    assert site_map_unpickled.get_by_docname("a/doc1", source_suffix).docname == (
+        "a/doc1.md"
+    )
+
+
+def test_sitemap_docnames_under():
+    """Documents within a folder. Cached until docnames change."""
+    # pytest --showlocals --log-level INFO -k "test_sitemap_docnames_under" tests
+    site_map = SiteMap(Document("index"))
+    for docname in ("guides/a", "guides/b/c", "guidesx", "ref/api/d", "guides"):
+        site_map[docname] = Document(docname)
+    assert site_map.docnames_under("guides") == ("guides/a", "guides/b/c")
+    assert site_map.docnames_under("guides/b/") == ("guides/b/c",)
+    assert site_map.docnames_under("missing") == ()
+    assert site_map.docnames_under("") == tuple(sorted(site_map))
+
+    # cached. Cleared by a new or deleted document, not by replacing one
+    sorted_docnames = site_map._sorted_docnames
+    site_map["guides/a"] = Document("guides/a", title="A")
+    assert site_map._sorted_docnames is sorted_docnames
+    site_map["guides/new"] = Document("guides/new")
+    assert site_map.docnames_under("guides")[-1] == "guides/new"
+    del site_map["guides/a"]
+    assert site_map.docnames_under("guides") == ("guides/b/c", "guides/new")
+
+    # not pickled
+    site_map_unpickled = pickle.loads(pickle.dumps(site_map))
+    assert site_map_unpickled._sorted_docnames is None
+    assert site_map_unpickled.docnames_under("ref") == ("ref/api/d",)
@@ -0,0 +1,129 @@
+"""
+.. moduleauthor:: Dave Faulkmore <https://mastodon.social/@msftcangoblowme>
+
+Unittest of benchmarks package. Small sizes, so fast
+
+Unit test -- Module
+
+.. code-block:: shell
+
+   python -m coverage run --source='benchmarks' -m pytest \
+   --showlocals tests/test_benchmarks.py && coverage report \
+   --data-file=.coverage --include="**/benchmarks/*.py"
+
+"""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from benchmarks.__main__ import main
+from benchmarks.generate import (
+    GLOB_FILES,
+    generate_site_map,
+    write_project,
+)
+from benchmarks.run import (
+    BENCHMARKS,
+    compare_results,
+    load_results,
+    run_benchmarks,
+)
+from sphinx_external_toc_strict.parsing_shared import FILE_FORMATS
+from sphinx_external_toc_strict.parsing_strictyaml import parse_toc_yaml
+
+
+@pytest.mark.parametrize("file_format", list(FILE_FORMATS))
+def test_generate_site_map(file_format, tmp_path):
+    """Generated ToC file parses back into the generated site map."""
+    # pytest --showlocals --log-level INFO -k "test_generate_site_map" tests
+    site_map = generate_site_map(
+        docs=40,
+        depth=2,
+        fan_out=6,
+        glob_ratio=0.3,
+        url_ratio=0.3,
+        ref_ratio=0.3,
+        file_format=file_format,
+    )
+    assert len(site_map) == 40
+    # same arguments, same site map
+    assert (
+        site_map.as_json()
+        == generate_site_map(
+            docs=40,
+            depth=2,
+            fan_out=6,
+            glob_ratio=0.3,
+            url_ratio=0.3,
+            ref_ratio=0.3,
+            file_format=file_format,
+        ).as_json()
+    )
+
+    files = write_project(site_map, tmp_path, orphans=3)
+    assert files == 40 + GLOB_FILES * len(site_map.globs()) + 3
+    assert len(list(tmp_path.glob("**/*.rst"))) == files
+    site_map_parsed = parse_toc_yaml(tmp_path / "_toc.yml")
+    assert site_map_parsed.as_json() == site_map.as_json()
+
+    # depth and fan out limit the document count
+    assert len(generate_site_map(docs=100, depth=1, fan_out=5)) == 6
+
+    with pytest.raises(ValueError):
+        generate_site_map(file_format="bob")
+    with pytest.raises(ValueError):
+        generate_site_map(docs=0)
+    with pytest.raises(ValueError):
+        write_project(site_map, tmp_path, suffix=".txt")
+
+
+@pytest.mark.parametrize("suffix", [".rst", ".md"])
+def test_run_benchmarks(suffix, tmp_path):
+    """Every hot path timed. Results are JSON serializable and comparable."""
+    # pytest --showlocals --log-level INFO -k "test_run_benchmarks" tests
+    results = run_benchmarks(
+        tmp_path / "srcdir",
+        docs=30,
+        depth=2,
+        fan_out=5,
+        glob_ratio=0.2,
+        url_ratio=0.2,
+        ref_ratio=0.2,
+        suffix=suffix,
+        orphans=2,
+        repeat=2,
+    )
+    assert tuple(results["benchmarks"]) == BENCHMARKS
+    for summary in results["benchmarks"].values():
+        assert len(summary["runs"]) == 2
+        assert summary["min"] <= summary["median"]
+    assert results["parse_stats"]["documents"] == 30
+
+    path_results = tmp_path / "results.json"
+    path_results.write_text(json.dumps(results), encoding="utf8")
+    baseline = load_results(path_results)
+    rows = compare_results(baseline, results)
+    assert tuple(rows) == BENCHMARKS
+    assert all(ratio == 1.0 for _, _, ratio in rows.values())
+
+
+def test_benchmarks_cli(tmp_path):
+    """Saves results. Compares to earlier results."""
+    # pytest --showlocals --log-level INFO -k "test_benchmarks_cli" tests
+    runner = CliRunner()
+    path_before = tmp_path / "before.json"
+    args = ["--docs", "10", "--depth", "2", "--fan-out", "3", "--repeat", "1"]
+    result = runner.invoke(main, args + ["-o", str(path_before)])
+    assert result.exit_code == 0, result.output
+    assert "insert_toctrees" in result.output
+    assert path_before.exists()
+
+    srcdir = tmp_path / "srcdir"
+    result = runner.invoke(
+        main, args + ["--srcdir", str(srcdir), "--compare", str(path_before)]
+    )
+    assert result.exit_code == 0, result.output
+    assert "compared to" in result.output
+    assert srcdir.joinpath("_toc.yml").exists()
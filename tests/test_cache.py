@@ -0,0 +1,205 @@
+"""
+.. moduleauthor:: Dave Faulkmore <https://mastodon.social/@msftcangoblowme>
+
+Unittest of cache module
+
+Unit test -- Module
+
+.. code-block:: shell
+
+   python -m coverage run --source='sphinx_external_toc_strict.cache' -m pytest \
+   --showlocals tests/test_cache.py && coverage report \
+   --data-file=.coverage --include="**/cache.py"
+
+"""
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+from sphinx_external_toc_strict import parsing_strictyaml
+from sphinx_external_toc_strict.cache import (
+    CACHE_SUFFIX,
+    cache_entry_path,
+    dir_snapshot_key,
+    dir_snapshot_path,
+    load_dir_snapshot,
+    load_site_map,
+    store_dir_snapshot,
+    store_site_map,
+    toc_cache_key,
+)
+from sphinx_external_toc_strict.compact import CompactSiteMap
+from sphinx_external_toc_strict.parsing_strictyaml import parse_toc_yaml
+
+PATH_TOC = Path(__file__).parent.joinpath("_toc_files", "nested.yml")
+
+
+def test_cache_key():
+    """Key changes with the file contents, encoding, and loader."""
+    # pytest --showlocals --log-level INFO -k "test_cache_key" tests
+    key_0 = toc_cache_key(b"root: intro\n")
+    key_1 = toc_cache_key(b"root: intro\n", encoding="utf8", loader="strictyaml")
+    key_2 = toc_cache_key(b"root: index\n")
+    assert key_0 == key_1
+    assert key_0 != key_2
+    assert toc_cache_key(b"root: intro\n", encoding="latin-1") != key_0
+    assert toc_cache_key(b"root: intro\n", loader="events") != key_0
+
+
+def test_parse_toc_yaml_cached(tmp_path, monkeypatch):
+    """Unchanged ToC loaded from cache. Edited ToC reparsed."""
+    # pytest --showlocals --log-level INFO -k "test_parse_toc_yaml_cached" tests
+    cache_dir = tmp_path / "cache"
+    path_toc = tmp_path / "_toc.yml"
+    shutil.copyfile(PATH_TOC, path_toc)
+
+    # cache miss --> parse and store
+    site_map = parse_toc_yaml(path_toc, cache_dir=cache_dir)
+    entries = list(cache_dir.glob(f"*{CACHE_SUFFIX}"))
+    assert len(entries) == 1
+    assert site_map.as_json() == parse_toc_yaml(path_toc).as_json()
+
+    # cache hit --> parser not called
+    def _fail(data, includes=None, stats=None, compact=False, lazy=False):
+        """Parser must not be called on a cache hit."""
+        raise AssertionError("cache miss")
+
+    with monkeypatch.context() as m:
+        m.setattr(parsing_strictyaml, "parse_toc_data", _fail)
+        site_map_cached = parse_toc_yaml(path_toc, cache_dir=cache_dir)
+    assert site_map_cached.as_json() == site_map.as_json()
+
+    # edit ToC --> cache miss. Stale entry removed
+    contents = path_toc.read_text(encoding="utf8")
+    path_toc.write_text(contents.replace("doc1", "doc9"), encoding="utf8")
+    with monkeypatch.context() as m:
+        m.setattr(parsing_strictyaml, "parse_toc_data", _fail)
+        with pytest.raises(AssertionError):
+            parse_toc_yaml(path_toc, cache_dir=cache_dir)
+    site_map_edited = parse_toc_yaml(path_toc, cache_dir=cache_dir)
+    assert "folder/doc9" in site_map_edited
+    entries_after = list(cache_dir.glob(f"*{CACHE_SUFFIX}"))
+    assert len(entries_after) == 1
+    assert entries_after != entries
+
+    # cache hit. Converted to the requested site map class
+    with monkeypatch.context() as m:
+        m.setattr(parsing_strictyaml, "parse_toc_data", _fail)
+        site_map_compact = parse_toc_yaml(path_toc, cache_dir=cache_dir, compact=True)
+    assert isinstance(site_map_compact, CompactSiteMap)
+    assert site_map_compact.as_json() == site_map_edited.as_json()
+
+
+def test_load_site_map_corrupt(tmp_path):
+    """Corrupt cache entry is a cache miss and is removed."""
+    # pytest --showlocals --log-level INFO -k "test_load_site_map_corrupt" tests
+    cache_dir = tmp_path / "cache"
+    key = toc_cache_key(PATH_TOC.read_bytes())
+
+    # no entry
+    assert load_site_map(cache_dir, PATH_TOC, key) is None
+
+    # not a pickle
+    entry = cache_entry_path(cache_dir, PATH_TOC, key)
+    entry.parent.mkdir(parents=True)
+    entry.write_bytes(b"not a pickle")
+    assert load_site_map(cache_dir, PATH_TOC, key) is None
+    assert not entry.exists()
+
+    # a pickle, but not a SiteMap
+    store_site_map(cache_dir, PATH_TOC, key, {"root": "intro"})
+    assert entry.exists()
+    assert load_site_map(cache_dir, PATH_TOC, key) is None
+    assert not entry.exists()
+
+
+def test_store_site_map_unwritable(tmp_path):
+    """Failing to write a cache entry is not an error."""
+    # pytest --showlocals --log-level INFO -k "test_store_site_map_unwritable" tests
+    site_map = parse_toc_yaml(PATH_TOC)
+    key = toc_cache_key(PATH_TOC.read_bytes())
+    # cache_dir is a file
+    cache_dir = tmp_path / "cache"
+    cache_dir.write_text("", encoding="utf8")
+    assert store_site_map(cache_dir, PATH_TOC, key, site_map) is False
+
+
+def test_parse_toc_yaml_cached_include(tmp_path, monkeypatch):
+    """Edited fragment reparsed, as are the ToC files including it."""
+    # pytest --showlocals --log-level INFO -k "test_parse_toc_yaml_cached_include" tests
+    cache_dir = tmp_path / "cache"
+    tmp_path.joinpath("parts").mkdir()
+    path_toc = tmp_path / "_toc.yml"
+    path_toc.write_text(
+        "root: intro\nentries:\n- include: parts/a.yml\n- include: parts/b.yml\n",
+        encoding="utf8",
+    )
+    path_a = tmp_path.joinpath("parts", "a.yml")
+    path_a.write_text("root: a/index\nentries:\n- file: a/doc1\n", encoding="utf8")
+    path_b = tmp_path.joinpath("parts", "b.yml")
+    path_b.write_text("root: b/index\n", encoding="utf8")
+
+    parse_toc_yaml(path_toc, cache_dir=cache_dir, max_workers=1)
+    # one entry per ToC file
+    assert len(list(cache_dir.glob(f"*{CACHE_SUFFIX}"))) == 3
+
+    roots = []
+    parse_toc_data_orig = parsing_strictyaml.parse_toc_data
+
+    def _spy(data, includes=None, stats=None, compact=False, lazy=False):
+        """Record which ToC files are parsed."""
+        roots.append(data["root"])
+        return parse_toc_data_orig(
+            data, includes=includes, stats=stats, compact=compact, lazy=lazy
+        )
+
+    monkeypatch.setattr(parsing_strictyaml, "parse_toc_data", _spy)
+
+    # all cache hits
+    parse_toc_yaml(path_toc, cache_dir=cache_dir, max_workers=1)
+    assert roots == []
+
+    # edit a fragment --> fragment and including ToC file are reparsed
+    path_a.write_text("root: a/index\nentries:\n- file: a/doc9\n", encoding="utf8")
+    site_map = parse_toc_yaml(path_toc, cache_dir=cache_dir, max_workers=1)
+    assert roots == ["a/index", "intro"]
+    assert "a/doc9" in site_map
+    assert "a/doc1" not in site_map
+    assert len(list(cache_dir.glob(f"*{CACHE_SUFFIX}"))) == 3
+
+
+def test_dir_snapshot(tmp_path):
+    """Round trip. Other suffixes or exclude patterns, snapshot is stale."""
+    # pytest --showlocals --log-level INFO -k "test_dir_snapshot" tests
+    cache_dir = tmp_path / "cache"
+    srcdir = tmp_path / "srcdir"
+    srcdir.mkdir()
+    key = dir_snapshot_key([".rst", ".md"], ["_build"])
+    assert key == dir_snapshot_key([".rst", ".md"], ["_build"])
+    assert key != dir_snapshot_key([".rst"], ["_build"])
+    assert key != dir_snapshot_key([".rst", ".md"], [])
+    # boundary between suffixes and exclude patterns matters
+    assert dir_snapshot_key([".rst"], []) != dir_snapshot_key([], [".rst"])
+
+    # cache miss
+    assert load_dir_snapshot(cache_dir, srcdir, key) == {}
+
+    snapshot = {"": (1, ("index.rst",), ("sub",)), "sub/": (None, ("a.md",), ())}
+    assert store_dir_snapshot(cache_dir, srcdir, key, snapshot) is True
+    assert dir_snapshot_path(cache_dir, srcdir).exists()
+    assert load_dir_snapshot(cache_dir, srcdir, key) == snapshot
+    key_other = dir_snapshot_key([".rst"], [])
+    assert load_dir_snapshot(cache_dir, srcdir, key_other) == {}
+
+    # corrupt. Discarded
+    entry = dir_snapshot_path(cache_dir, srcdir)
+    entry.write_bytes(b"not a pickle")
+    assert load_dir_snapshot(cache_dir, srcdir, key) == {}
+    assert not entry.exists()
+
+    # cache_dir is a file. Not an error
+    cache_file = tmp_path / "cache_file"
+    cache_file.write_text("", encoding="utf8")
+    assert store_dir_snapshot(cache_file, srcdir, key, snapshot) is False
@@ -15,6 +15,7 @@ Unit test -- Module
 
 from __future__ import annotations
 
+import json
 import os
 import traceback
 from pathlib import Path
@@ -27,6 +28,7 @@ import pytest
 from click.testing import CliRunner
 
 from sphinx_external_toc_strict.cli import (
+    check_refs,
     create_site,
     create_toc,
     main,
@@ -34,6 +36,8 @@ from sphinx_external_toc_strict.cli import (
     parse_toc,
 )
 from sphinx_external_toc_strict.constants import __version_app
+from sphinx_external_toc_strict.parsing_strictyaml import parse_toc_yaml
+from tests.test_util.intersphinx_data import INVENTORY_V2
 
 if TYPE_CHECKING:
     from click.testing import Result
@@ -127,6 +131,34 @@ def test_parse_toc(path_toc, toc_root_file_stem, invoke_cli, is_ok):
     assert is_ok(result.output) is True
     assert toc_root_file_stem in result.output
 
+    # parse stats to stderr. site map yaml to stdout
+    result = invoke_cli(parse_toc, [toc_path, "--profile"])
+    assert "documents" in result.stderr
+    assert "documents" not in result.stdout
+    assert toc_root_file_stem in result.stdout
+
+    # JSON, streamed. Same as as_json
+    result = invoke_cli(parse_toc, [toc_path, "--json"])
+    assert json.loads(result.stdout) == parse_toc_yaml(path_toc).as_json()
+
+
+def test_parse_toc_include(tmp_path, invoke_cli):
+    """Include fragments resolve, with and without --profile"""
+    # pytest --showlocals --log-level INFO -k "test_parse_toc_include" tests
+    path_toc = tmp_path / "_toc.yml"
+    path_toc.write_text(
+        "root: intro\nentries:\n- file: doc1\n- include: part.yml\n",
+        encoding="utf8",
+    )
+    tmp_path.joinpath("part.yml").write_text(
+        "root: part/index\nentries:\n- file: part/doc1\n", encoding="utf8"
+    )
+    expected = parse_toc_yaml(path_toc).as_json()
+    for args in ([], ["--profile"]):
+        result = invoke_cli(parse_toc, [str(path_toc), "--json"] + args)
+        assert json.loads(result.stdout) == expected
+        assert "part/doc1" in expected["documents"]
+
 
 def test_create_toc(tmp_path, invoke_cli, file_regression):
     """create project files
@@ -177,6 +209,49 @@ def test_create_toc(tmp_path, invoke_cli, file_regression):
     file_regression.check(str_toc_yml)
 
 
+def test_create_toc_manifest(tmp_path, invoke_cli):
+    """create ToC from a manifest, file or stdin. Same as walking the folder"""
+    # pytest --showlocals --log-level INFO -k "test_create_toc_manifest" tests
+    files = [
+        "index.rst",
+        "1_a_title.rst",
+        ".hidden_file.rst",
+        "2_another_subfolder/index.rst",
+        "2_another_subfolder/other.rst",
+        "14_subfolder/subsubfolder/index.rst",
+    ]
+    site_dir = tmp_path / "docs"
+    for posix in files:
+        path = site_dir.joinpath(*posix.split("/"))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+    path_manifest = tmp_path / "manifest.txt"
+    path_manifest.write_text("\n".join(files), encoding="utf8")
+
+    result = invoke_cli(create_toc, [str(site_dir), "--guess-titles"])
+    toc_walked = result.output
+    args = [str(site_dir), "--guess-titles", "--manifest", str(path_manifest)]
+    result = invoke_cli(create_toc, args)
+    assert result.output == toc_walked
+
+    # stdin. Listed file need not exist. Folder is not walked
+    runner = CliRunner()
+    args = [str(site_dir), "--guess-titles", "--manifest", "-"]
+    manifest = "\n".join(files + ["3_not_on_disk.rst"])
+    result = runner.invoke(create_toc, args, input=manifest)
+    assert result.exit_code == 0
+    assert "3_not_on_disk" in result.output
+
+    # unusable manifest
+    for manifest in (str(tmp_path / "nonexistent.txt"), "-"):
+        result = runner.invoke(
+            create_toc,
+            [str(site_dir), "--manifest", manifest],
+            input="../outside.rst\n",
+        )
+        assert result.exit_code != 0
+
+
 testdata_create_site_cli = (
     (
         Path(__file__).parent.joinpath("_toc_files", "exclude_missing.yml"),
@@ -307,3 +382,52 @@ def test_migrate_toc(path_toc_yml, root, tmp_path, invoke_cli):
     toc_yml_1 = path_out.read_text()  # one newline
     # rstrip both cuz left side has two newlines. Right has one newline
     assert toc_yml_0.rstrip() == toc_yml_1.rstrip()
+
+
+def test_check_refs(tmp_path, invoke_cli):
+    """Every ref resolved from local inventories. Unresolved refs printed"""
+    # pytest --showlocals --log-level INFO -k "test_check_refs" tests
+    path_toc = tmp_path / "_toc.yml"
+    path_toc.write_text(
+        "root: intro\n"
+        "entries:\n"
+        "- file: doc1\n"
+        "  entries:\n"
+        "  - ref: The-Julia-Domain\n"
+        "  - ref: test:the-julia-domain\n"
+        "    title: Julia\n"
+        "- file: doc2\n"
+        "  entries:\n"
+        "  - ref: The-Julia-Domain\n",
+        encoding="utf8",
+    )
+    # no inventories
+    result = invoke_cli(check_refs, [str(path_toc)], assert_exit=False)
+    assert result.exit_code == 2
+    assert "objects*.inv" in result.output
+
+    # default. objects*.inv beside the ToC file
+    tmp_path.joinpath("objects-test.inv").write_bytes(INVENTORY_V2)
+    result = invoke_cli(check_refs, [str(path_toc)])
+    assert result.stdout == ""
+    assert "3 ref(s) checked, 0 unresolved" in result.stderr
+
+    # named inventory. test: prefix no longer resolves
+    path_inv = tmp_path / "objects-test.inv"
+    cache_dir = tmp_path / "cache"
+    args = [str(path_toc), "-i", f"other={path_inv!s}", "--cache-dir", str(cache_dir)]
+    result = invoke_cli(check_refs, args, assert_exit=False)
+    assert result.exit_code == 1
+    assert result.stdout.splitlines() == ["doc1: test:the-julia-domain"]
+    assert "3 ref(s) checked, 1 unresolved" in result.stderr
+    assert list(cache_dir.glob("inv-*.pickle"))
+
+    # inventory by path
+    result = invoke_cli(check_refs, [str(path_toc), "-i", str(path_inv)])
+    assert result.exit_code == 0
+
+    # unreadable inventory
+    args = [str(path_toc), "-i", str(tmp_path / "missing.inv")]
+    result = invoke_cli(check_refs, args, assert_exit=False)
+    assert result.exit_code == 2
+    assert "--inventory" in result.output
@@ -0,0 +1,189 @@
+"""
+.. moduleauthor:: Dave Faulkmore <https://mastodon.social/@msftcangoblowme>
+
+Unittest of compact module
+
+Unit test -- Module
+
+.. code-block:: shell
+
+   python -m coverage run --source='sphinx_external_toc_strict.compact' -m pytest \
+   --showlocals tests/test_compact.py && coverage report \
+   --data-file=.coverage --include="**/compact.py"
+
+"""
+
+import pickle
+from pathlib import Path
+
+import pytest
+
+from benchmarks.generate import generate_site_map
+from sphinx_external_toc_strict.api import (
+    Document,
+    FileItem,
+    GlobItem,
+    RefItem,
+    SiteMap,
+    TocTree,
+    UrlItem,
+)
+from sphinx_external_toc_strict.compact import (
+    CompactSiteMap,
+    DocumentColumns,
+)
+from sphinx_external_toc_strict.parsing_strictyaml import parse_toc_yaml
+
+TOC_FILES = list(Path(__file__).parent.joinpath("_toc_files").glob("*.yml"))
+
+
+def _structure(site_map):
+    """Everything observable thru the SiteMap interface."""
+    ret = {
+        "json": site_map.as_json(),
+        "order": list(site_map),
+        "globs": sorted(site_map.globs()),
+        "parents": {docname: site_map.parent_of(docname) for docname in site_map},
+        "walk": [
+            (depth, parent, doc.docname) for depth, parent, doc in site_map.walk()
+        ],
+        "fingerprints": site_map.fingerprints(),
+    }
+    return ret
+
+
+@pytest.mark.parametrize(
+    "path", TOC_FILES, ids=[path.name.rsplit(".", 1)[0] for path in TOC_FILES]
+)
+def test_compact_parse_toc_yaml(path):
+    """Parsed directly into a CompactSiteMap. Same as a SiteMap."""
+    # pytest --showlocals --log-level INFO -k "test_compact_parse_toc_yaml" tests
+    site_map = parse_toc_yaml(path)
+    site_map_compact = parse_toc_yaml(path, compact=True)
+    assert type(site_map) is SiteMap
+    assert isinstance(site_map_compact, CompactSiteMap)
+    assert _structure(site_map_compact) == _structure(site_map)
+    # documents are equal views
+    for docname, doc in site_map.items():
+        assert site_map_compact[docname] == doc
+
+
+def test_compact_equivalent():
+    """Generated site map. Every item kind. Same results as SiteMap."""
+    # pytest --showlocals --log-level INFO -k "test_compact_equivalent" tests
+    site_map = generate_site_map(
+        docs=300,
+        glob_ratio=0.2,
+        url_ratio=0.3,
+        ref_ratio=0.3,
+        file_format="default",
+    )
+    site_map_compact = CompactSiteMap.from_site_map(site_map)
+    assert _structure(site_map_compact) == _structure(site_map)
+    assert site_map_compact.get_changed(site_map) == set()
+    assert site_map.get_changed(site_map_compact) == set()
+    for posix in ("a/b", "x", "index"):
+        assert site_map_compact.match_globs(posix) is site_map.match_globs(posix)
+
+    # and back
+    site_map_back = SiteMap.from_site_map(site_map_compact)
+    assert type(site_map_back) is SiteMap
+    assert site_map_back.as_json() == site_map.as_json()
+
+
+def test_compact_set_replace_delete():
+    """Replacing keeps order; deleting appends on reinsert. Like a dict."""
+    # pytest --showlocals --log-level INFO -k "test_compact_set_replace_delete" tests
+    tree_options = {"caption": "Part", "maxdepth": 2, "numbered": 1}
+    items = [
+        FileItem("a"),
+        GlobItem("g/*"),
+        UrlItem("https://example.com", "Example"),
+        RefItem("label:x"),
+    ]
+
+    def _build(cls):
+        """Same edits to either site map class."""
+        site_map = cls(Document("index", subtrees=[TocTree(items, **tree_options)]))
+        site_map["a"] = Document("a", subtrees=[TocTree([FileItem("b")])])
+        site_map["b"] = Document("b", title="B")
+        # numbered True and 1 are distinct options
+        site_map["a"] = Document(
+            "a", subtrees=[TocTree([FileItem("b")], numbered=True)], title="A"
+        )
+        del site_map["b"]
+        site_map["c"] = Document("c")
+        site_map["b"] = Document("b")
+        return site_map
+
+    site_map = _build(SiteMap)
+    site_map_compact = _build(CompactSiteMap)
+    assert _structure(site_map_compact) == _structure(site_map)
+    assert list(site_map_compact) == ["index", "a", "c", "b"]
+    assert site_map_compact["a"].subtrees[0].numbered is True
+    assert site_map_compact["index"].subtrees[0].numbered == 1
+    assert site_map_compact["index"].subtrees[0].numbered is not True
+    assert len(site_map_compact) == 4
+    assert "b" in site_map_compact
+    assert 1 not in site_map_compact._docs
+    with pytest.raises(KeyError):
+        site_map_compact["missing"]
+    with pytest.raises(KeyError):
+        del site_map_compact._docs["missing"]
+
+    # documents are views. Set again after changing
+    doc = site_map_compact["c"]
+    doc.title = "C"
+    assert site_map_compact["c"].title is None
+    site_map_compact["c"] = doc
+    assert site_map_compact["c"].title == "C"
+
+
+def test_compact_garbage():
+    """Replaced documents' toctrees and items are rebuilt away."""
+    # pytest --showlocals --log-level INFO -k "test_compact_garbage" tests
+    docs = DocumentColumns()
+    items = [FileItem(f"child{idx}") for idx in range(10)]
+    for idx in range(20):
+        docs[f"doc{idx}"] = Document(f"doc{idx}", subtrees=[TocTree(items)])
+    expected = {docname: doc for docname, doc in docs.items()}
+    for _ in range(50):
+        for idx in range(0, 20, 2):
+            docs[f"doc{idx}"] = Document(f"doc{idx}", subtrees=[TocTree(items)])
+        # never more garbage than live entries, and a little more
+        assert len(docs._item_kind) <= 2 * docs._item_count + 256 + 11
+    del docs["doc3"]
+    del expected["doc3"]
+    assert docs._garbage() != 0
+    docs._compact()
+    assert docs._garbage() == 0
+    assert dict(docs.items()) == expected
+    assert len(docs._item_kind) == docs._item_count == 190
+
+
+def test_compact_pickle():
+    """Pickles to a smaller blob. Same site map once unpickled."""
+    # pytest --showlocals --log-level INFO -k "test_compact_pickle" tests
+    site_map = generate_site_map(
+        docs=1000,
+        glob_ratio=0.1,
+        url_ratio=0.2,
+        ref_ratio=0.2,
+        file_format="default",
+    )
+    site_map_compact = CompactSiteMap.from_site_map(site_map)
+    # garbage is not pickled
+    docname = list(site_map)[1]
+    site_map_compact[docname] = site_map[docname]
+    blob = pickle.dumps(site_map_compact)
+    assert len(blob) < len(pickle.dumps(site_map))
+
+    site_map_unpickled = pickle.loads(blob)
+    assert isinstance(site_map_unpickled, CompactSiteMap)
+    assert _structure(site_map_unpickled) == _structure(site_map)
+    assert site_map_unpickled.get_changed(site_map_compact) == set()
+
+    # still editable
+    site_map_unpickled["new"] = Document("new")
+    assert site_map_unpickled["new"] == Document("new")
+    assert site_map_unpickled.get_changed(site_map_compact) == {"new"}
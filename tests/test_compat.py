@@ -0,0 +1,139 @@
+"""
+.. moduleauthor:: Dave Faulkmore <https://mastodon.social/@msftcangoblowme>
+
+Unittest of _compat module. Compiled field validation
+
+Unit test -- Module
+
+.. code-block:: shell
+
+   python -m coverage run --source='sphinx_external_toc_strict._compat' -m pytest \
+   --showlocals tests/test_compat.py && coverage report \
+   --data-file=.coverage --include="**/_compat.py"
+
+"""
+
+import dataclasses as dc
+from contextlib import nullcontext as does_not_raise
+
+import pytest
+
+from sphinx_external_toc_strict import _compat
+from sphinx_external_toc_strict._compat import (
+    DC_SLOTS,
+    field,
+    instance_of,
+    trusted_construction,
+    validate_fields,
+)
+from sphinx_external_toc_strict.api import (
+    Document,
+    FileItem,
+    GlobItem,
+    RefItem,
+    TocTree,
+    UrlItem,
+)
+
+testdata_compiled_check = (
+    (UrlItem, ("https://example.com",), {"title": "Example"}),
+    (UrlItem, ("https://example.com",), {"title": None}),
+    (UrlItem, ("example.com",), {}),
+    (UrlItem, (1,), {}),
+    (UrlItem, ("https://example.com",), {"title": 1}),
+    (RefItem, ("The-Julia-Domain",), {}),
+    (RefItem, (0.2345,), {}),
+    (TocTree, ([FileItem("a"), GlobItem("b*"), UrlItem("https://c")],), {}),
+    (TocTree, ([FileItem("a")],), {"caption": "c", "numbered": 2}),
+    (TocTree, ([],), {}),
+    (TocTree, ([FileItem("a"), "b"],), {}),
+    (TocTree, ((FileItem("a"),),), {}),
+    (TocTree, ([FileItem("a")],), {"maxdepth": "1"}),
+    (TocTree, ([FileItem("a")],), {"caption": 1}),
+    (Document, ("intro",), {}),
+    (Document, ("intro", [TocTree([FileItem("a")])]), {"title": "Intro"}),
+    (Document, ("intro", [None]), {}),
+    (Document, ("intro", "not a list"), {}),
+    (Document, (None,), {}),
+)
+
+
+@pytest.mark.parametrize("cls, args, kwargs", testdata_compiled_check)
+def test_compiled_check(cls, args, kwargs, monkeypatch):
+    """Compiled check accepts and rejects the same as each validator."""
+    # pytest --showlocals --log-level INFO -k "test_compiled_check" tests
+    # debug switch --> validators run one by one
+    with monkeypatch.context() as m:
+        m.setattr(_compat, "_debug_validate", True)
+        try:
+            expected = cls(*args, **kwargs)
+        except Exception as exc:
+            expected = exc
+
+    if isinstance(expected, Exception):
+        with pytest.raises(type(expected)) as exc_info:
+            cls(*args, **kwargs)
+        assert str(exc_info.value) == str(expected)
+    else:
+        assert cls(*args, **kwargs) == expected
+
+    assert _compat._compiled_checks[cls] is not None
+
+
+def test_trusted_construction(monkeypatch):
+    """Within context, validation skipped. Debug switch re-enables validation."""
+    # pytest --showlocals --log-level INFO -k "test_trusted_construction" tests
+    with trusted_construction():
+        doc = Document(None)
+    assert doc.docname is None
+
+    # context exited --> validation
+    with pytest.raises(TypeError):
+        Document(None)
+
+    # exception within context --> context reset
+    with pytest.raises(RuntimeError):
+        with trusted_construction():
+            raise RuntimeError("abort")
+    with pytest.raises(TypeError):
+        Document(None)
+
+    # debug switch
+    monkeypatch.setattr(_compat, "_debug_validate", True)
+    with pytest.raises(TypeError):
+        with trusted_construction():
+            Document(None)
+
+
+def _no_source(inst, attr, value):
+    """Validator without source. Cannot be compiled."""
+    if value < 0:
+        raise ValueError(f"'{attr.name}' must not be negative")
+
+
+@dc.dataclass(**DC_SLOTS)
+class Custom:
+    """Dataclass with a validator which cannot be compiled."""
+
+    name: str = field(validator=instance_of(str))
+    count: int = field(default=0, validator=[instance_of(int), _no_source])
+
+    def __post_init__(self):
+        """Run field validation after class instantiation."""
+        validate_fields(self)
+
+
+@pytest.mark.parametrize(
+    "kwargs, expectation",
+    (
+        ({"name": "a", "count": 1}, does_not_raise()),
+        ({"name": "a", "count": -1}, pytest.raises(ValueError)),
+        ({"name": 1}, pytest.raises(TypeError)),
+    ),
+)
+def test_validator_not_compilable(kwargs, expectation):
+    """Validator without source. Validators run one by one."""
+    # pytest --showlocals --log-level INFO -k "test_validator_not_compilable" tests
+    with expectation:
+        Custom(**kwargs)
+    assert _compat._compiled_checks[Custom] is None
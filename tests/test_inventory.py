@@ -0,0 +1,215 @@
+"""
+.. moduleauthor:: Dave Faulkmore <https://mastodon.social/@msftcangoblowme>
+
+Unittest of inventory module
+
+Unit test -- Module
+
+.. code-block:: shell
+
+   python -m coverage run --source='sphinx_external_toc_strict.inventory' -m pytest \
+   --showlocals tests/test_inventory.py && coverage report \
+   --data-file=.coverage --include="**/inventory.py"
+
+"""
+
+import os
+import pickle
+from pathlib import Path
+
+import pytest
+from sphinx.util.inventory import InventoryFile
+
+from sphinx_external_toc_strict import inventory as inventory_mod
+from sphinx_external_toc_strict.inventory import (
+    Inventory,
+    inventory_cache_key,
+    inventory_name,
+    load_inventory,
+    read_inventory,
+    resolve_ref,
+)
+from tests.test_util.intersphinx_data import (
+    INVENTORY_V1,
+    INVENTORY_V2,
+)
+
+INV_FILES = list(Path(__file__).parents[1].joinpath("docs").glob("objects-*.inv"))
+
+
+def _sphinx_entries(path):
+    """Entries as read by Sphinx. (objtype, name) --> (uri, display name)."""
+    inv = InventoryFile.loads(Path(path).read_bytes(), uri="")
+    ret = {
+        (objtype, name): (item.uri, item.display_name)
+        for objtype, names in inv.data.items()
+        for name, item in names.items()
+    }
+    return ret
+
+
+def _entries(inv):
+    """Entries of an Inventory. (objtype, name) --> (uri, display name)."""
+    ret = {
+        (objtype, name): t_entry
+        for objtype, names in inv.objects.items()
+        for name, t_entry in names.items()
+    }
+    return ret
+
+
+@pytest.mark.parametrize(
+    "path", INV_FILES, ids=[path.name.rsplit(".", 1)[0] for path in INV_FILES]
+)
+def test_read_inventory_equivalent(path, monkeypatch):
+    """Same entries as Sphinx. Whatever the chunk size."""
+    # pytest --showlocals --log-level INFO -k "test_read_inventory_equivalent" tests
+    expected = _sphinx_entries(path)
+    inv = read_inventory(path)
+    assert _entries(inv) == expected
+    assert len(inv) == len(expected)
+    assert inv.name == inventory_name(path)
+
+    # lines split across chunks
+    monkeypatch.setattr(inventory_mod, "BUFSIZE", 7)
+    assert _entries(read_inventory(path)) == expected
+
+
+def test_read_inventory(tmp_path):
+    """Header, entries, and errors."""
+    # pytest --showlocals --log-level INFO -k "test_read_inventory" tests
+    path = tmp_path / "objects-foo.inv"
+    path.write_bytes(INVENTORY_V2)
+    inv = read_inventory(path)
+    assert inv.name == "foo"
+    assert inv.project == "foo"
+    assert inv.version == "2.0"
+    assert _entries(inv) == _sphinx_entries(path)
+    # location ending in $ ends with the name. First py:module kept
+    assert inv.get("py:module", "module2") == ("foo.html#module-module2", "-")
+    assert inv.get("py:module", "missing") is None
+    assert inv.get("no:such", "module2") is None
+    assert read_inventory(path, name="bar").name == "bar"
+
+    # version 1 not supported
+    path_v1 = tmp_path / "objects-v1.inv"
+    path_v1.write_bytes(INVENTORY_V1)
+    with pytest.raises(ValueError, match="version 2"):
+        read_inventory(path_v1)
+
+    # not compressed
+    path_plain = tmp_path / "objects-plain.inv"
+    path_plain.write_bytes(INVENTORY_V2.split(b"\n", 3)[0] + b"\n# a\n# b\n# c\n")
+    with pytest.raises(ValueError, match="not compressed"):
+        read_inventory(path_plain)
+
+    # corrupt stream
+    path_bad = tmp_path / "objects-bad.inv"
+    header = b"".join(line + b"\n" for line in INVENTORY_V2.split(b"\n")[:4])
+    path_bad.write_bytes(header + b"not zlib data")
+    with pytest.raises(ValueError, match="corrupt"):
+        read_inventory(path_bad)
+
+    with pytest.raises(OSError):
+        read_inventory(tmp_path / "missing.inv")
+
+
+def test_inventory_name():
+    """objects-NAME.inv --> NAME."""
+    # pytest --showlocals --log-level INFO -k "test_inventory_name" tests
+    assert inventory_name("docs/objects-python.inv") == "python"
+    assert inventory_name("objects-strictyaml-docs.inv") == "strictyaml-docs"
+    assert inventory_name("docs/objects.inv") == "objects"
+    assert inventory_name("objects-.inv") == "objects-"
+
+
+def test_load_inventory_cache(tmp_path, monkeypatch):
+    """Unchanged inventory not decoded again. Changed or corrupt, decoded."""
+    # pytest --showlocals --log-level INFO -k "test_load_inventory_cache" tests
+    path = tmp_path / "objects-foo.inv"
+    path.write_bytes(INVENTORY_V2)
+    cache_dir = tmp_path / "cache"
+    inv = load_inventory(path, cache_dir=cache_dir)
+    entries = list(cache_dir.glob("inv-*.pickle"))
+    assert len(entries) == 1
+    key, inv_cached = pickle.loads(entries[0].read_bytes())
+    assert key == inventory_cache_key(path)
+    assert _entries(inv_cached) == _entries(inv)
+
+    calls = []
+    read_inventory_orig = inventory_mod.read_inventory
+
+    def _spy(path, name=None):
+        """Count decodes."""
+        calls.append(path)
+        return read_inventory_orig(path, name=name)
+
+    monkeypatch.setattr(inventory_mod, "read_inventory", _spy)
+    inv_2 = load_inventory(path, name="bar", cache_dir=cache_dir)
+    assert calls == []
+    assert inv_2.name == "bar"
+    assert _entries(inv_2) == _entries(inv)
+
+    # changed inventory
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    load_inventory(path, cache_dir=cache_dir)
+    assert len(calls) == 1
+
+    # corrupt cache entry
+    entries[0].write_bytes(b"not a pickle")
+    load_inventory(path, cache_dir=cache_dir)
+    assert len(calls) == 2
+    assert isinstance(pickle.loads(entries[0].read_bytes())[1], Inventory)
+
+    # no cache
+    load_inventory(path)
+    assert len(calls) == 3
+
+
+def _inventory(name, labels):
+    """Inventory of std:label entries. label --> uri, display name."""
+    return Inventory(name, name, "1.0", {"std:label": dict(labels)})
+
+
+def test_resolve_ref():
+    """Same order as intersphinx. Exact, case insensitive, then named."""
+    # pytest --showlocals --log-level INFO -k "test_resolve_ref" tests
+    inv_a = _inventory(
+        "a",
+        {"Intro": ("a.html#intro", "A Intro"), "shared": ("a.html#shared", "-")},
+    )
+    inv_b = _inventory(
+        "b",
+        {"intro": ("b.html#intro", "B Intro"), "shared": ("b.html#shared", "-")},
+    )
+    inventories = [inv_a, inv_b]
+    # case sensitive match, any inventory, before case insensitive
+    assert resolve_ref(inventories, "Intro") == ("a", "a.html#intro", "A Intro")
+    assert resolve_ref(inventories, "intro") == ("b", "b.html#intro", "B Intro")
+    assert resolve_ref(inventories, "INTRO") == ("b", "b.html#intro", "B Intro")
+    # later inventory name wins
+    assert resolve_ref(inventories, "shared") == ("b", "b.html#shared", "-")
+    # named inventory
+    assert resolve_ref(inventories, "a:shared") == ("a", "a.html#shared", "-")
+    assert resolve_ref(inventories, "a:INTRO") == ("a", "a.html#intro", "A Intro")
+    assert resolve_ref(inventories, "c:intro") is None
+    assert resolve_ref(inventories, "missing") is None
+    assert resolve_ref([], "intro") is None
+
+    # case insensitive tables are not pickled
+    assert inv_a._lower != {}
+    inv_unpickled = pickle.loads(pickle.dumps(inv_a))
+    assert inv_unpickled._lower == {}
+    assert inv_unpickled.get("std:label", "intro") == ("a.html#intro", "A Intro")
+
+
+def test_resolve_ref_python():
+    """Resolves the same labels as Sphinx, docs python inventory."""
+    # pytest --showlocals --log-level INFO -k "test_resolve_ref_python" tests
+    path = Path(__file__).parents[1].joinpath("docs", "objects-python.inv")
+    inv = read_inventory(path)
+    assert resolve_ref([inv], "tut-intro")[1] == "tutorial/appetite.html#tut-intro"
+    assert resolve_ref([inv], "python:TUT-INTRO")[0] == "python"
+    # not a label
+    assert resolve_ref([inv], "os.path") is None
@@ -0,0 +1,188 @@
+"""
+.. moduleauthor:: Dave Faulkmore <https://mastodon.social/@msftcangoblowme>
+
+Unittest of lazy module
+
+Unit test -- Module
+
+.. code-block:: shell
+
+   python -m coverage run --source='sphinx_external_toc_strict.lazy' -m pytest \
+   --showlocals tests/test_lazy.py && coverage report \
+   --data-file=.coverage --include="**/lazy.py"
+
+"""
+
+import pickle
+from pathlib import Path
+
+import pytest
+
+from sphinx_external_toc_strict.api import (
+    Document,
+    SiteMap,
+)
+from sphinx_external_toc_strict.exceptions import MalformedError
+from sphinx_external_toc_strict.lazy import LazySiteMap
+from sphinx_external_toc_strict.parsing_strictyaml import (
+    parse_toc_data,
+    parse_toc_yaml,
+)
+from sphinx_external_toc_strict.stats import ParseStats
+
+TOC_FILES = list(Path(__file__).parent.joinpath("_toc_files").glob("*.yml"))
+
+
+def _toc_data_deep(depth):
+    """Each doc has one child. Nested depth docs deep."""
+    root = {"root": "doc0"}
+    node = root
+    for idx in range(1, depth):
+        child = {"file": f"doc{idx}"}
+        node["entries"] = [child]
+        node = child
+    return root
+
+
+@pytest.mark.parametrize(
+    "path", TOC_FILES, ids=[path.name.rsplit(".", 1)[0] for path in TOC_FILES]
+)
+def test_lazy_parse_toc_yaml(path):
+    """Documents parsed on first access. Same site map once materialized."""
+    # pytest --showlocals --log-level INFO -k "test_lazy_parse_toc_yaml" tests
+    site_map = parse_toc_yaml(path)
+    site_map_lazy = parse_toc_yaml(path, lazy=True)
+    assert isinstance(site_map_lazy, LazySiteMap)
+
+    # docnames, in ToC order, without parsing
+    assert list(site_map_lazy) == list(site_map)
+    assert len(site_map_lazy) == len(site_map)
+    pending = site_map_lazy.pending()
+    root_docname = site_map.root.docname
+    assert pending == [docname for docname in site_map if docname != root_docname]
+    for docname in site_map:
+        assert docname in site_map_lazy
+    site_map_lazy.docname_index([".rst", ".md"])
+    assert site_map_lazy.docnames_under("") == tuple(sorted(site_map))
+    assert site_map_lazy.pending() == pending
+
+    # one document parsed
+    if pending:
+        assert site_map_lazy[pending[-1]] == site_map[pending[-1]]
+        assert site_map_lazy.pending() == pending[:-1]
+    else:  # pragma: no cover
+        pass
+
+    site_map_lazy.materialize()
+    assert site_map_lazy.pending() == []
+    assert site_map_lazy.as_json() == site_map.as_json()
+    assert site_map_lazy.globs() == site_map.globs()
+    for docname in site_map:
+        assert site_map_lazy.parent_of(docname) == site_map.parent_of(docname)
+    assert site_map_lazy.fingerprints() == site_map.fingerprints()
+
+
+def test_lazy_index_methods():
+    """Methods needing the parent and glob index parse every document."""
+    # pytest --showlocals --log-level INFO -k "test_lazy_index_methods" tests
+    data = {
+        "root": "index",
+        "entries": [
+            {"file": "a", "entries": [{"file": "a/1"}, {"glob": "a/g*"}]},
+            {"url": "https://example.com"},
+        ],
+    }
+    site_map = parse_toc_data(data)
+
+    site_map_lazy = parse_toc_data(data, lazy=True)
+    assert site_map_lazy.ancestors_of("a/1") == ["a", "index"]
+    assert site_map_lazy.pending() == []
+
+    site_map_lazy = parse_toc_data(data, lazy=True)
+    assert site_map_lazy.match_globs("a/g1") is True
+    assert site_map_lazy.pending() == []
+
+    # walk and get_changed parse as they go
+    site_map_lazy = parse_toc_data(data, lazy=True)
+    walked = [doc.docname for _, _, doc in site_map_lazy.walk()]
+    assert walked == ["index", "a", "a/1"]
+    assert site_map_lazy.get_changed(site_map) == set()
+
+    # set and delete pending documents
+    site_map_lazy = parse_toc_data(data, lazy=True)
+    site_map_lazy["a"] = Document("a", title="A")
+    assert site_map_lazy.parent_of("a/1") is None
+    del site_map_lazy["a/1"]
+    assert list(site_map_lazy) == ["index", "a"]
+    assert site_map_lazy.pending() == []
+
+    # pickled fully parsed
+    site_map_lazy = parse_toc_data(data, lazy=True)
+    site_map_unpickled = pickle.loads(pickle.dumps(site_map_lazy))
+    assert site_map_unpickled.pending() == []
+    assert site_map_unpickled.as_json() == site_map.as_json()
+    site_map_unpickled["b"] = Document("b")
+    assert site_map_unpickled.from_site_map(site_map_unpickled)["b"] == Document("b")
+
+
+def test_lazy_validation():
+    """Duplicates caught up front. Invalid documents when first reached."""
+    # pytest --showlocals --log-level INFO -k "test_lazy_validation" tests
+    data_dup = _toc_data_deep(3)
+    data_dup["entries"][0]["entries"][0]["file"] = "doc0"
+    with pytest.raises(
+        MalformedError, match="document file used multiple times: 'doc0'"
+    ):
+        parse_toc_data(data_dup, lazy=True)
+
+    # invalid document. Same error as eager parsing, once reached
+    data_bad = _toc_data_deep(4)
+    data_bad["entries"][0]["entries"][0]["unknown"] = "1"
+    site_map_lazy = parse_toc_data(data_bad, lazy=True)
+    assert site_map_lazy["doc1"].child_files() == ["doc2"]
+    assert site_map_lazy["doc3"].subtrees == []
+    with pytest.raises(MalformedError, match="@ '//entries/0//entries/0/'"):
+        site_map_lazy["doc2"]
+    with pytest.raises(MalformedError, match="@ '//entries/0//entries/0/'"):
+        site_map_lazy.materialize()
+    assert site_map_lazy.pending() == ["doc2"]
+
+    # include without fragment site map
+    data_include = {"root": "index", "entries": [{"include": "part.yml"}]}
+    with pytest.raises(MalformedError, match="include file not loaded"):
+        parse_toc_data(data_include, lazy=True)
+
+    with pytest.raises(ValueError):
+        parse_toc_data(data_bad, compact=True, lazy=True)
+    with pytest.raises(ValueError):
+        parse_toc_yaml(TOC_FILES[0], compact=True, lazy=True)
+
+
+def test_lazy_include_and_stats(tmp_path):
+    """Fragments are merged, already parsed. Stats count parsed documents."""
+    # pytest --showlocals --log-level INFO -k "test_lazy_include_and_stats" tests
+    path_toc = tmp_path / "_toc.yml"
+    path_toc.write_text(
+        "root: intro\nentries:\n- file: doc1\n- include: part.yml\n",
+        encoding="utf8",
+    )
+    tmp_path.joinpath("part.yml").write_text(
+        "root: part/index\nentries:\n- file: part/doc1\n", encoding="utf8"
+    )
+    site_map = parse_toc_yaml(path_toc, max_workers=1)
+    stats = ParseStats()
+    site_map_lazy = parse_toc_yaml(path_toc, max_workers=1, lazy=True, stats=stats)
+    assert site_map_lazy.pending() == ["doc1"]
+    assert stats.documents == 3
+    assert list(site_map_lazy) == list(site_map)
+    site_map_lazy.materialize()
+    assert site_map_lazy.as_json() == site_map.as_json()
+
+    # cache hit is already parsed
+    cache_dir = tmp_path / "cache"
+    parse_toc_yaml(path_toc, max_workers=1, cache_dir=cache_dir, lazy=True)
+    site_map_cached = parse_toc_yaml(
+        path_toc, max_workers=1, cache_dir=cache_dir, lazy=True
+    )
+    assert isinstance(site_map_cached, SiteMap)
+    assert site_map_cached.as_json() == site_map.as_json()
@@ -0,0 +1,124 @@
+"""
+.. moduleauthor:: Dave Faulkmore <https://mastodon.social/@msftcangoblowme>
+
+Unittest of manifest module
+
+Unit test -- Module
+
+.. code-block:: shell
+
+   python -m coverage run --source='sphinx_external_toc_strict.manifest' -m pytest \
+   --showlocals tests/test_manifest.py && coverage report \
+   --data-file=.coverage --include="**/manifest.py"
+
+"""
+
+import io
+import time
+
+import pytest
+
+from sphinx_external_toc_strict.api import _walk_source_files
+from sphinx_external_toc_strict.manifest import (
+    manifest_source_files,
+    manifest_tree,
+    read_manifest,
+)
+from sphinx_external_toc_strict.matching import PrefixMatcher
+
+FILES = (
+    "index.rst",
+    "doc1.rst",
+    "doc2.md",
+    ".hidden.rst",
+    ".hid/x.rst",
+    "_build/html/x.rst",
+    "sub/a.rst",
+    "sub/b.txt",
+    "sub/.d/h.rst",
+    "sub/deep/d.md",
+    "sub/deep/e.rst",
+    "weird.rst/f.rst",
+)
+
+
+def test_read_manifest(tmp_path, monkeypatch):
+    """Normalized, deduplicated relative posix paths. From file or stdin."""
+    # pytest --showlocals --log-level INFO -k "test_read_manifest" tests
+    contents = (
+        "# comment\n"
+        "index.rst\n"
+        "\n"
+        "  ./sub//a.rst  \n"
+        "sub\\deep\\d.md\n"
+        "index.rst\n"
+    )
+    expected = ("index.rst", "sub/a.rst", "sub/deep/d.md")
+    path_manifest = tmp_path / "manifest.txt"
+    path_manifest.write_text(contents, encoding="utf8")
+    assert read_manifest(path_manifest) == expected
+    assert read_manifest(str(path_manifest)) == expected
+
+    monkeypatch.setattr("sys.stdin", io.StringIO(contents))
+    assert read_manifest("-") == expected
+
+    for invalid in ("/abs/index.rst", "C:/index.rst", "sub/../../index.rst"):
+        path_manifest.write_text(invalid, encoding="utf8")
+        with pytest.raises(ValueError):
+            read_manifest(path_manifest)
+
+    with pytest.raises(OSError):
+        read_manifest(tmp_path / "nonexistent.txt")
+
+
+def test_manifest_tree():
+    """Folders implied by file paths. Root always present."""
+    # pytest --showlocals --log-level INFO -k "test_manifest_tree" tests
+    assert manifest_tree([]) == {"": ([], [])}
+    tree = manifest_tree(["a/b/c.rst", "index.rst", "a/d.rst", "a/b/c.rst", "e/f.md"])
+    assert tree == {
+        "": (["index.rst"], ["a", "e"]),
+        "a": (["d.rst"], ["b"]),
+        "a/b": (["c.rst"], []),
+        "e": (["f.md"], []),
+    }
+
+
+def test_manifest_tree_scaling():
+    """One large folder. Linear, not a scan of the folder per file."""
+    # pytest --showlocals --log-level INFO -k "test_manifest_tree_scaling" tests
+    count = 40_000
+    paths = [f"big/doc{idx}.rst" for idx in range(count)]
+    start = time.perf_counter()
+    tree = manifest_tree(paths + paths[:100])
+    elapsed = time.perf_counter() - start
+    assert len(tree["big"][0]) == count
+    assert tree["big"][0][-1] == f"doc{count - 1}.rst"
+    # quadratic took 16s. Linear, a few hundredths of a second
+    assert elapsed < 2.0
+
+
+@pytest.mark.parametrize(
+    "suffixes, exclude_patterns",
+    (
+        ([".rst", ".md"], []),
+        ([".md", ".rst"], ["_build", "**/deep/e.rst"]),
+        ([".rst"], ["sub", "weird.rst"]),
+    ),
+)
+def test_manifest_source_files(suffixes, exclude_patterns, tmp_path):
+    """Same files as walking the source folder."""
+    # pytest --showlocals --log-level INFO -k "test_manifest_source_files" tests
+    for posix in FILES:
+        path = tmp_path.joinpath(posix)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+    matcher = PrefixMatcher(exclude_patterns)
+
+    expected = _walk_source_files(tmp_path, suffixes, matcher)
+    actual = manifest_source_files(FILES, suffixes, matcher.match_prefix)
+    assert sorted(actual) == sorted(expected)
+    # grouped by suffix, in suffixes order
+    assert [suffix for _, suffix in actual] == sorted(
+        (suffix for _, suffix in actual), key=suffixes.index
+    )
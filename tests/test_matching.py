@@ -0,0 +1,209 @@
+"""
+.. moduleauthor:: Dave Faulkmore <https://mastodon.social/@msftcangoblowme>
+
+Unittest of matching module
+
+Unit test -- Module
+
+.. code-block:: shell
+
+   python -m coverage run --source='sphinx_external_toc_strict.matching' -m pytest \
+   --showlocals tests/test_matching.py && coverage report \
+   --data-file=.coverage --include="**/matching.py"
+
+"""
+
+import random
+
+import pytest
+from sphinx.util.matching import (
+    Matcher,
+    patfilter,
+)
+
+from sphinx_external_toc_strict.matching import (
+    PrefixMatcher,
+    SortedDocnames,
+    expand_globs,
+)
+
+PATTERNS = (
+    "_build",
+    "Thumbs.db",
+    ".DS_Store",
+    "**/.ipynb_checkpoints",
+    "sub/c*",
+    "**/deep/e.rst",
+    "a?c",
+    "[ab]x",
+    "[!ab]y",
+    "docs/**",
+    "x/",
+    "lit/eral/path",
+    "[unclosed",
+    "*.txt",
+)
+
+PATHS = (
+    "_build",
+    "_build/html/index.rst",
+    "_builds/index.rst",
+    "Thumbs.db",
+    "folder/Thumbs.db",
+    ".ipynb_checkpoints/a.md",
+    "nb/.ipynb_checkpoints/a.md",
+    "sub/c",
+    "sub/cx/y.rst",
+    "sub/d/c.rst",
+    "deep/e.rst",
+    "x/deep/e.rst",
+    "x/deep/e.rst/f.rst",
+    "abc",
+    "abc/d.rst",
+    "a/c",
+    "ax",
+    "bx/y",
+    "cx",
+    "cy",
+    "ay",
+    "docs",
+    "docs/a/b",
+    "x",
+    "x/y",
+    "lit",
+    "lit/eral",
+    "lit/eral/path",
+    "lit/eral/path/more.rst",
+    "[unclosed",
+    "[unclosed/a.rst",
+    "notes.txt",
+    "a/notes.txt",
+    "index.rst",
+)
+
+
+def _match_prefix_reference(matcher, path):
+    """Matcher called on every path prefix. As new_excluded used to
+
+    :param matcher: sphinx matcher
+    :type matcher: sphinx.util.matching.Matcher
+    :param path: relative posix path
+    :type path: str
+    :returns: True if path or a folder containing it matches
+    :rtype: bool
+    """
+    components = path.split("/")
+    return any(
+        matcher("/".join(components[: idx + 1])) for idx in range(len(components))
+    )
+
+
+@pytest.mark.parametrize("path", PATHS)
+def test_prefix_matcher_equivalent(path):
+    """Same results as sphinx Matcher."""
+    # pytest --showlocals --log-level INFO -k "test_prefix_matcher_equivalent" tests
+    matcher = Matcher(PATTERNS)
+    prefix_matcher = PrefixMatcher(PATTERNS)
+    assert prefix_matcher.match(path) is matcher(path)
+    assert prefix_matcher(path) is matcher(path)
+    assert prefix_matcher.match_prefix(path) is _match_prefix_reference(matcher, path)
+
+
+def test_prefix_matcher_random():
+    """Random patterns and paths. Same results as sphinx Matcher."""
+    # pytest --showlocals --log-level INFO -k "test_prefix_matcher_random" tests
+    rng = random.Random(0)
+
+    def _random_str(alphabet, length_max):
+        """Random string from alphabet."""
+        length = rng.randint(1, length_max)
+        return "".join(rng.choice(alphabet) for _ in range(length))
+
+    for _ in range(200):
+        patterns = [_random_str("ab/*?", 6) for _ in range(rng.randint(0, 5))]
+        patterns.extend(f"**/{_random_str('ab', 2)}" for _ in range(rng.randint(0, 2)))
+        matcher = Matcher(patterns)
+        prefix_matcher = PrefixMatcher(patterns)
+        for _ in range(50):
+            path = _random_str("ab/", 8)
+            assert prefix_matcher.match(path) is matcher(path), (patterns, path)
+            expected = _match_prefix_reference(matcher, path)
+            assert prefix_matcher.match_prefix(path) is expected, (patterns, path)
+
+
+def test_prefix_matcher_empty():
+    """No patterns. Nothing matches."""
+    # pytest --showlocals --log-level INFO -k "test_prefix_matcher_empty" tests
+    prefix_matcher = PrefixMatcher([])
+    assert prefix_matcher.match("a/b") is False
+    assert prefix_matcher.match_prefix("a/b") is False
+
+    # literal patterns only
+    prefix_matcher = PrefixMatcher(["a/b"])
+    assert prefix_matcher.match("a/b") is True
+    assert prefix_matcher.match("a") is False
+    assert prefix_matcher.match_prefix("a/b/c") is True
+    assert prefix_matcher.match_prefix("a/c") is False
+
+
+def test_expand_globs():
+    """Same matches, and order, as filtering per glob."""
+    # pytest --showlocals --log-level INFO -k "test_expand_globs" tests
+    docnames = {path.removesuffix(".rst") for path in PATHS}
+    patterns = [*PATTERNS, "x/deep/e", "missing", "sub/*", "**"]
+    table = expand_globs(patterns, docnames)
+    assert list(table) == patterns
+    for pat in patterns:
+        assert table[pat] == tuple(sorted(patfilter(docnames, pat))), pat
+    assert table["x/deep/e"] == ("x/deep/e",)
+    assert table["missing"] == ()
+
+    # duplicates expanded once
+    assert expand_globs(["sub/*", "sub/*"], docnames) == {"sub/*": table["sub/*"]}
+    assert expand_globs([], docnames) == {}
+
+
+def test_sorted_docnames():
+    """Prefix narrowed globs. Same matches as patfilter."""
+    # pytest --showlocals --log-level INFO -k "test_sorted_docnames" tests
+    docnames = {path.removesuffix(".rst") for path in PATHS}
+    sorted_docnames = SortedDocnames(docnames)
+    assert list(sorted_docnames) == sorted(docnames)
+    assert len(sorted_docnames) == len(docnames)
+    assert "lit/eral" in sorted_docnames
+    assert "lit/era" not in sorted_docnames
+    assert "zzz" not in sorted_docnames
+    assert 1 not in sorted_docnames
+
+    # folder and prefix queries
+    expected = ("lit/eral", "lit/eral/path", "lit/eral/path/more")
+    assert sorted_docnames.under("lit") == expected
+    assert sorted_docnames.under("lit/") == sorted_docnames.under("lit")
+    assert sorted_docnames.under("li") == ()
+    assert sorted_docnames.under("") == tuple(sorted(docnames))
+    assert sorted_docnames.with_prefix("x/deep") == ("x/deep/e", "x/deep/e.rst/f")
+    for docname in docnames:
+        expected = tuple(sorted(name for name in docnames if name.startswith(docname)))
+        assert sorted_docnames.with_prefix(docname) == expected
+
+    for pat in (*PATTERNS, "x/deep/e", "lit/*", "lit/**", "sub/c?", "[!ab]*"):
+        assert sorted_docnames.glob(pat) == tuple(sorted(patfilter(docnames, pat))), pat
+
+
+def test_sorted_docnames_random():
+    """Random globs and docnames. Same matches as patfilter."""
+    # pytest --showlocals --log-level INFO -k "test_sorted_docnames_random" tests
+    rng = random.Random(0)
+
+    def _random_str(alphabet, length_max):
+        """Random string from alphabet."""
+        length = rng.randint(1, length_max)
+        return "".join(rng.choice(alphabet) for _ in range(length))
+
+    for _ in range(200):
+        docnames = {_random_str("ab/", 8) for _ in range(50)}
+        sorted_docnames = SortedDocnames(docnames)
+        for _ in range(10):
+            pat = _random_str("ab/*?", 6)
+            expected = tuple(sorted(patfilter(docnames, pat)))
+            assert sorted_docnames.glob(pat) == expected, (pat, docnames)
@@ -11,11 +11,19 @@ Unit test -- Module
 
 """
 
+import gc
+import logging
 import os
+import sys
+import time
+import tracemalloc
 from pathlib import Path
 
 import pytest
+import strictyaml as s
 
+from sphinx_external_toc_strict import parsing_strictyaml
+from sphinx_external_toc_strict.api import FileItem
 from sphinx_external_toc_strict.constants import use_cases
 from sphinx_external_toc_strict.exceptions import MalformedError
 from sphinx_external_toc_strict.parsing_shared import (
@@ -25,11 +33,13 @@ from sphinx_external_toc_strict.parsing_shared import (
 )
 from sphinx_external_toc_strict.parsing_strictyaml import (
     _scalar_affinity_map,
+    _scalar_coercion_map,
     affinity_val,
     dump_yaml,
     parse_toc_data,
     parse_toc_yaml,
 )
+from sphinx_external_toc_strict.tools_strictyaml import create_site_map_from_path
 
 TOC_FILES = list(Path(__file__).parent.joinpath("_toc_files").glob("*.yml"))
 
@@ -197,6 +207,59 @@ def test_affinity_val(key, val, mapping, expected):
     assert val_out == expected
 
 
+testdata_affinity_val_native = (
+    "true",
+    "True",
+    "yes",
+    "Y",
+    "off",
+    "0",
+    "1",
+    "-3",
+    "+4",
+    "1_000",
+    "_",
+    "1.12345",
+    "abc",
+    "Part 1: Intro",
+    "a #b",
+    " 5",
+    "",
+    "- a",
+    "[a, b]",
+    True,
+    False,
+    3,
+    None,
+    1.12345,
+    ["doc1", "it's"],
+    ["doc1", 1],
+    [],
+    ("doc1",),
+    {"a": "b"},
+)
+
+
+@pytest.mark.parametrize("val", testdata_affinity_val_native)
+@pytest.mark.parametrize("key", list(_scalar_affinity_map.keys()))
+def test_affinity_val_native(key, val):
+    """Native coercion accepts and rejects the same as strictyaml reload."""
+    # pytest --showlocals --log-level INFO -k "test_affinity_val_native" tests
+    assert _scalar_coercion_map[key] is not None
+    str_yaml = f"{val}"
+    try:
+        yml = s.dirty_load(str_yaml, _scalar_affinity_map[key], allow_flow_style=True)
+    except Exception as exc:
+        with pytest.raises(type(exc)) as exc_info:
+            affinity_val(key, val)
+        assert str(exc_info.value) == str(exc)
+    else:
+        expected = yml.data
+        actual = affinity_val(key, val)
+        assert actual == expected
+        assert type(actual) is type(expected)
+
+
 testdata_parse_toc_data = [
     (
         {"defaults": {"caption": 1.12345}},
@@ -249,3 +312,275 @@ def test_dump_yaml(invalid):
     """unsupported type --> ValueError"""
     with pytest.raises(ValueError):
         dump_yaml(invalid)
+
+
+def _toc_data_deep(depth):
+    """Synthetic ToC data. Each document contains the next document
+
+    :param depth: document count
+    :type depth: int
+    :returns: ToC data
+    :rtype: dict[str, typing.Any]
+    """
+    data = {"root": "doc0"}
+    current = data
+    for idx in range(1, depth):
+        child = {"file": f"doc{idx}"}
+        current["entries"] = [child]
+        current = child
+    return data
+
+
+def _toc_data_wide(width):
+    """Synthetic ToC data. Root document contains all other documents
+
+    :param width: root document child count
+    :type width: int
+    :returns: ToC data
+    :rtype: dict[str, typing.Any]
+    """
+    entries = [{"file": f"doc{idx}"} for idx in range(width)]
+    return {"root": "index", "entries": entries}
+
+
+def test_parse_toc_data_deep():
+    """Nesting deeper than the recursion limit. Peak memory linear in depth."""
+    # pytest --showlocals --log-level INFO -k "test_parse_toc_data_deep" tests
+    depth = 10_000
+    assert depth > sys.getrecursionlimit()
+    data = _toc_data_deep(depth)
+
+    tracemalloc.start()
+    try:
+        time_start = time.perf_counter()
+        site_map = parse_toc_data(data)
+        elapsed = time.perf_counter() - time_start
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert len(site_map) == depth
+    assert site_map["doc9999"].subtrees == []
+    assert site_map["doc9998"].child_files() == ["doc9999"]
+    # tracemalloc slows down allocation. Bounds are generous
+    assert elapsed < 60
+    assert peak < 64 * 1024 * 1024
+
+    # error paths unchanged
+    data_dup = _toc_data_deep(3)
+    data_dup["entries"][0]["entries"][0]["file"] = "doc0"
+    with pytest.raises(
+        MalformedError, match="document file used multiple times: 'doc0'"
+    ):
+        parse_toc_data(data_dup)
+    data_bad = _toc_data_deep(3)
+    data_bad["entries"][0]["entries"][0]["unknown"] = "1"
+    with pytest.raises(MalformedError, match="@ '//entries/0//entries/0/'"):
+        parse_toc_data(data_bad)
+
+
+def test_parse_toc_data_wide():
+    """Half a million documents in one toctree. Memory per document is bounded."""
+    # pytest --showlocals --log-level INFO -k "test_parse_toc_data_wide" tests
+    width = 500_000
+    data = _toc_data_wide(width)
+
+    gc.collect()
+    blocks_before = sys.getallocatedblocks()
+    time_start = time.perf_counter()
+    site_map = parse_toc_data(data)
+    elapsed = time.perf_counter() - time_start
+    gc.collect()
+    blocks_after = sys.getallocatedblocks()
+
+    assert len(site_map) == width + 1
+    assert len(site_map.root.child_files()) == width
+    assert list(site_map)[-1] == f"doc{width - 1}"
+    assert elapsed < 120
+    # Document, its empty subtrees list, and map slot. No parser leftovers
+    assert (blocks_after - blocks_before) / width < 8
+
+
+def _retained_site_map(width):
+    """Parse wide ToC data, which is then released. Site map memory remains
+
+    :param width: root document child count
+    :type width: int
+    :returns: site map and its traced memory in bytes
+    :rtype: tuple[sphinx_external_toc_strict.api.SiteMap, int]
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        site_map = parse_toc_data(_toc_data_wide(width))
+        gc.collect()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return site_map, current
+
+
+def test_parse_toc_data_shared_docnames(monkeypatch, caplog):
+    """FileItem, Document docname, and map key are one object. Memory report."""
+    # pytest --showlocals --log-level INFO -k "test_parse_toc_data_shared_docnames" tests
+    caplog.set_level(logging.INFO)
+    width = 5_000
+    site_map, shared = _retained_site_map(width)
+    for item in site_map.root.subtrees[0].items[:100]:
+        doc = site_map[item]
+        assert doc.docname is item
+        assert next(key for key in site_map if key == item) is item
+    # dump and json unchanged. Plain str
+    assert type(create_toc_dict(site_map)["entries"][0]["file"]) is str
+    assert all(type(key) is str for key in site_map.as_json()["documents"])
+
+    # captions are interned
+    data = {
+        "root": "index",
+        "subtrees": [
+            {"caption": "".join(["Cap", "tion"]), "entries": [{"file": "doc1"}]},
+            {"caption": "".join(["Capt", "ion"]), "entries": [{"file": "doc2"}]},
+        ],
+    }
+    toctrees = parse_toc_data(data).root.subtrees
+    assert toctrees[0].caption is toctrees[1].caption
+
+    # docnames not shared. Each Document keeps the ToC data str
+    with monkeypatch.context() as m:
+        m.setattr(
+            parsing_strictyaml,
+            "intern_docname",
+            lambda docnames, docname: FileItem(docname),
+        )
+        site_map_copies, copies = _retained_site_map(width)
+    doc = site_map_copies["doc0"]
+    assert doc.docname is not site_map_copies.root.subtrees[0].items[0]
+    assert site_map_copies.as_json() == site_map.as_json()
+
+    msg_info = (
+        f"{width} documents. docnames shared {shared / width:.0f} B/doc, "
+        f"copies {copies / width:.0f} B/doc"
+    )
+    logging.getLogger(__name__).info(msg_info)
+    # one str per document less
+    assert copies - shared > width * 32
+
+
+def test_create_site_map_from_path_shared_docnames(tmp_path):
+    """From a folder tree, docnames are shared too."""
+    # pytest --showlocals --log-level INFO -k "test_create_site_map_from_path_shared_docnames" tests
+    tmp_path.joinpath("index.rst").touch()
+    tmp_path.joinpath("doc1.rst").touch()
+    tmp_path.joinpath("sub").mkdir()
+    tmp_path.joinpath("sub", "index.rst").touch()
+    tmp_path.joinpath("sub", "doc2.rst").touch()
+    site_map = create_site_map_from_path(tmp_path)
+    items = [
+        item
+        for doc in site_map.values()
+        for toctree in doc.subtrees
+        for item in toctree.items
+    ]
+    assert sorted(items) == ["doc1", "sub/doc2", "sub/index"]
+    for item in items:
+        assert site_map[item].docname is item
+
+
+def _write_fragments(folder):
+    """ToC file including two fragments. One fragment includes another.
+
+    :param folder: folder to write ToC files into
+    :type folder: pathlib.Path
+    :returns: ToC file path
+    :rtype: pathlib.Path
+    """
+    folder.joinpath("parts", "deep").mkdir(parents=True)
+    folder.joinpath("_toc.yml").write_text(
+        "root: intro\n"
+        "entries:\n"
+        "- file: doc1\n"
+        "- include: parts/a.yml\n"
+        "- include: parts/b.yml\n"
+        "- file: doc2\n",
+        encoding="utf8",
+    )
+    folder.joinpath("parts", "a.yml").write_text(
+        "root: a/index\n"
+        "defaults:\n"
+        "  maxdepth: 3\n"
+        "entries:\n"
+        "- file: a/doc1\n"
+        "- include: deep/c.yml\n",
+        encoding="utf8",
+    )
+    folder.joinpath("parts", "b.yml").write_text(
+        "root: b/index\nentries:\n- file: b/doc1\n",
+        encoding="utf8",
+    )
+    folder.joinpath("parts", "deep", "c.yml").write_text(
+        "root: c/index\n",
+        encoding="utf8",
+    )
+    return folder.joinpath("_toc.yml")
+
+
+@pytest.mark.parametrize("max_workers", (1, 2))
+def test_include(max_workers, tmp_path):
+    """Fragments merged in document order. Same result in process pool."""
+    # pytest --showlocals --log-level INFO -k "test_include" tests
+    path_toc = _write_fragments(tmp_path)
+    site_map = parse_toc_yaml(path_toc, max_workers=max_workers)
+    assert list(site_map) == [
+        "intro",
+        "doc1",
+        "a/index",
+        "a/doc1",
+        "c/index",
+        "b/index",
+        "b/doc1",
+        "doc2",
+    ]
+    items = site_map.root.subtrees[0].items
+    assert items[1] == FileItem("a/index")
+    assert items[2] == FileItem("b/index")
+    # fragment keeps its own defaults
+    assert site_map["a/index"].subtrees[0].maxdepth == 3
+    assert site_map["intro"].subtrees[0].maxdepth == -1
+    assert site_map["a/index"].child_files() == ["a/doc1", "c/index"]
+
+    # same docname in a fragment and the including file
+    path_b = tmp_path.joinpath("parts", "b.yml")
+    path_b.write_text("root: b/index\nentries:\n- file: doc2\n", encoding="utf8")
+    msg_match = "document file used multiple times: 'doc2'"
+    with pytest.raises(MalformedError, match=msg_match):
+        parse_toc_yaml(path_toc, max_workers=max_workers)
+
+    # fragment included twice
+    path_b.write_text(
+        "root: b/index\nentries:\n- include: ../parts/a.yml\n",
+        encoding="utf8",
+    )
+    msg_match = "document file used multiple times: 'a/index'"
+    with pytest.raises(MalformedError, match=msg_match):
+        parse_toc_yaml(path_toc, max_workers=max_workers)
+
+    # fragment includes itself
+    path_b.write_text("root: b/index\nentries:\n- include: b.yml\n", encoding="utf8")
+    with pytest.raises(MalformedError, match="include cycle"):
+        parse_toc_yaml(path_toc, max_workers=max_workers)
+
+    # no such fragment
+    path_b.unlink()
+    with pytest.raises(MalformedError, match="include file not found: 'parts/b.yml'"):
+        parse_toc_yaml(path_toc, max_workers=max_workers)
+
+
+def test_include_no_file():
+    """Without a ToC file, fragments cannot be loaded."""
+    # pytest --showlocals --log-level INFO -k "test_include_no_file" tests
+    data = {"root": "intro", "entries": [{"include": "part.yml"}]}
+    with pytest.raises(MalformedError, match="include file not loaded: 'part.yml'"):
+        parse_toc_data(data)
+    data = {"root": "intro", "entries": [{"include": "part.yml", "entries": []}]}
+    with pytest.raises(MalformedError, match="incompatible keys"):
+        parse_toc_data(data)
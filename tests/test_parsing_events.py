@@ -0,0 +1,133 @@
+"""
+.. moduleauthor:: Dave Faulkmore <https://mastodon.social/@msftcangoblowme>
+
+Unittest of parsing_events module
+
+Unit test -- Module
+
+.. code-block:: shell
+
+   python -m coverage run --source='sphinx_external_toc_strict.parsing_events' -m pytest \
+   --showlocals tests/test_parsing_events.py && coverage report \
+   --data-file=.coverage --include="**/parsing_events.py"
+
+"""
+
+import re
+from contextlib import nullcontext as does_not_raise
+from pathlib import Path
+
+import pytest
+import strictyaml as s
+
+from sphinx_external_toc_strict.exceptions import MalformedError
+from sphinx_external_toc_strict.parsing_events import (
+    load_yaml_events,
+    loads_yaml_events,
+)
+from sphinx_external_toc_strict.parsing_strictyaml import parse_toc_yaml
+
+TOC_FILES = list(Path(__file__).parent.joinpath("_toc_files").glob("*.yml"))
+TOC_FILES_BAD = list(Path(__file__).parent.joinpath("_bad_toc_files").glob("*.yml"))
+
+
+@pytest.mark.parametrize(
+    "path",
+    TOC_FILES + TOC_FILES_BAD,
+    ids=[path.name.rsplit(".", 1)[0] for path in TOC_FILES + TOC_FILES_BAD],
+)
+def test_load_yaml_events(path):
+    """Same plain data as strictyaml dirty load."""
+    # pytest --showlocals --log-level INFO -k "test_load_yaml_events" tests
+    str_yaml = path.read_text(encoding="utf8")
+    expected = s.dirty_load(str_yaml, allow_flow_style=True).data
+    actual = load_yaml_events(path)
+    if expected == "":
+        # strictyaml, no document --> empty str
+        assert actual is None
+    else:
+        assert actual == expected
+
+
+testdata_loads_yaml_events = (
+    ("", does_not_raise(), None),
+    ("a:", does_not_raise(), {"a": ""}),
+    (
+        "a: ~\nb: null\nc: 1\nd: true",
+        does_not_raise(),
+        {"a": "~", "b": "null", "c": "1", "d": "true"},
+    ),
+    ("a: [1, {b: 2}]", does_not_raise(), {"a": ["1", {"b": "2"}]}),
+    ("a: |\n  x\n  y\n", does_not_raise(), {"a": "x\ny\n"}),
+    ("a: []\nb: {}", does_not_raise(), {"a": [], "b": {}}),
+    ("- a\n- b", does_not_raise(), ["a", "b"]),
+    ("a: 1\na: 2", pytest.raises(MalformedError, match="Duplicate key 'a'"), None),
+    ("a: &x 1\nb: *x", pytest.raises(MalformedError, match="anchor"), None),
+    ("a: [*x]", pytest.raises(MalformedError, match="alias"), None),
+    ("a: !!str 1", pytest.raises(MalformedError, match="tag"), None),
+    ("[a]: 1", pytest.raises(MalformedError, match="non-scalar key"), None),
+    ("a: 1\n---\nb: 2", pytest.raises(MalformedError, match="single document"), None),
+)
+ids_loads_yaml_events = (
+    "empty stream",
+    "empty value",
+    "no implicit typing",
+    "flow style",
+    "block scalar",
+    "empty collections",
+    "sequence",
+    "duplicate key",
+    "anchor",
+    "alias",
+    "tag",
+    "mapping key",
+    "two documents",
+)
+
+
+@pytest.mark.parametrize(
+    "str_yaml, expectation, expected",
+    testdata_loads_yaml_events,
+    ids=ids_loads_yaml_events,
+)
+def test_loads_yaml_events(str_yaml, expectation, expected):
+    """strictyaml semantics. Every scalar a str. YAML shenanigans rejected."""
+    # pytest --showlocals --log-level INFO -k "test_loads_yaml_events" tests
+    with expectation:
+        actual = loads_yaml_events(str_yaml)
+    if isinstance(expectation, does_not_raise):
+        assert actual == expected
+
+
+def test_loads_yaml_events_deep():
+    """Nesting depth not limited by the recursion limit."""
+    # pytest --showlocals --log-level INFO -k "test_loads_yaml_events_deep" tests
+    # ruamel flow style scanning is quadratic. Keep depth modest
+    depth = 1_500
+    str_yaml = "a: " + "[" * depth + "x" + "]" * depth
+    data = loads_yaml_events(str_yaml)
+    node = data["a"]
+    for _ in range(depth - 1):
+        node = node[0]
+    assert node == ["x"]
+
+
+@pytest.mark.parametrize(
+    "path", TOC_FILES, ids=[path.name.rsplit(".", 1)[0] for path in TOC_FILES]
+)
+def test_parse_toc_yaml_loader(path, tmp_path):
+    """Both loaders produce the same site map."""
+    # pytest --showlocals --log-level INFO -k "test_parse_toc_yaml_loader" tests
+    expected = parse_toc_yaml(path).as_json()
+    assert parse_toc_yaml(path, loader="events").as_json() == expected
+    assert parse_toc_yaml(str(path), loader="events").as_json() == expected
+    # cache miss
+    site_map = parse_toc_yaml(path, cache_dir=tmp_path, loader="events")
+    assert site_map.as_json() == expected
+
+
+def test_parse_toc_yaml_loader_unsupported():
+    """Unsupported loader name."""
+    # pytest --showlocals --log-level INFO -k "test_parse_toc_yaml_loader_unsupported" tests
+    with pytest.raises(ValueError, match=re.escape("'pyyaml'")):
+        parse_toc_yaml(TOC_FILES[0], loader="pyyaml")
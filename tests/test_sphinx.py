@@ -15,18 +15,37 @@ Unit test -- Module
 
 import logging
 import os
+import pickle
 import shutil
 from pathlib import Path
 
 import pytest
 from sphinx import version_info as sphinx_version_info
+from sphinx.addnodes import toctree as toctree_node
+from sphinx.errors import ExtensionError
 from sphinx.ext.intersphinx import load_mappings
 from sphinx.ext.intersphinx import setup as intersphinx_setup
 from sphinx.ext.intersphinx import validate_intersphinx_mapping
 from sphinx.testing.util import SphinxTestApp
 
+from sphinx_external_toc_strict import events
+from sphinx_external_toc_strict.api import (
+    Document,
+    FileItem,
+    GlobItem,
+    RefItem,
+    SiteMap,
+    TocTree,
+    UrlItem,
+)
 from sphinx_external_toc_strict.constants import g_app_name
+from sphinx_external_toc_strict.events import (
+    ToctreeTemplate,
+    toctree_templates,
+)
+from sphinx_external_toc_strict.sphinx_node import inventory_key
 from sphinx_external_toc_strict.tools_strictyaml import create_site_from_toc
+from tests.test_util.intersphinx_data import INVENTORY_V2
 
 TOC_FILES = list(Path(__file__).parent.joinpath("_toc_files").glob("*.yml"))
 TOC_FILES_WARN = list(
@@ -304,3 +323,306 @@ external_toc_path = {Path(os.path.abspath(toc_path)).as_posix()!r}
     # run sphinx
     builder = sphinx_build_factory(src_dir)
     builder.build()
+
+
+def test_cache_dir(tmp_path: Path, sphinx_build_factory):
+    """Test ``external_toc_cache_dir`` stores the parsed site map."""
+    src_dir = tmp_path / "srcdir"
+    # write document files
+    toc_path = Path(__file__).parent.joinpath("_toc_files", "basic.yml")
+    create_site_from_toc(toc_path, root_path=src_dir)
+    # write conf.py
+    content = f"""
+extensions = ["{g_app_name}"]
+external_toc_path = "_toc.yml"
+external_toc_cache_dir = "_cache"
+
+"""
+    src_dir.joinpath("conf.py").write_text(content, encoding="utf8")
+    # run sphinx
+    builder = sphinx_build_factory(src_dir)
+    builder.build()
+    assert len(list(src_dir.joinpath("_cache").glob("*.pickle"))) == 1
+
+
+def test_cache_dir_exclude_missing(tmp_path: Path, sphinx_build_factory):
+    """Test ``external_toc_cache_dir`` also stores source folder listings."""
+    # pytest --showlocals --log-level INFO -k "test_cache_dir_exclude_missing" tests
+    src_dir = tmp_path / "srcdir"
+    # write document files
+    toc_path = Path(__file__).parent.joinpath("_toc_files", "basic.yml")
+    create_site_from_toc(toc_path, root_path=src_dir)
+    src_dir.joinpath("extra.rst").write_text("Extra\n=====\n", encoding="utf8")
+    # write conf.py
+    content = f"""
+extensions = ["{g_app_name}"]
+external_toc_path = "_toc.yml"
+external_toc_cache_dir = "_cache"
+external_toc_exclude_missing = True
+
+"""
+    src_dir.joinpath("conf.py").write_text(content, encoding="utf8")
+    # run sphinx
+    builder = sphinx_build_factory(src_dir)
+    builder.build()
+    assert "extra.rst" in builder.app.config.exclude_patterns
+    assert len(list(src_dir.joinpath("_cache").glob("toc-*.pickle"))) == 1
+    snapshots = list(src_dir.joinpath("_cache").glob("dirs-*.pickle"))
+    assert len(snapshots) == 1
+    # cache folder within the source folder is not walked
+    _, snapshot = pickle.loads(snapshots[0].read_bytes())
+    assert "" in snapshot
+    assert "_cache/" not in snapshot
+
+
+def test_manifest(tmp_path: Path, sphinx_build_factory):
+    """Test ``external_toc_manifest`` replaces the source folder walk."""
+    # pytest --showlocals --log-level INFO -k "test_manifest" tests
+    src_dir = tmp_path / "srcdir"
+    # write document files
+    toc_path = Path(__file__).parent.joinpath("_toc_files", "basic.yml")
+    create_site_from_toc(toc_path, root_path=src_dir)
+    for name in ("extra.rst", "unlisted.rst"):
+        src_dir.joinpath(name).write_text("Extra\n=====\n", encoding="utf8")
+    # manifest does not list unlisted.rst. So it is not excluded
+    files = [
+        path.relative_to(src_dir).as_posix()
+        for path in src_dir.glob("**/*.rst")
+        if path.name != "unlisted.rst"
+    ]
+    src_dir.joinpath("_manifest.txt").write_text("\n".join(files), encoding="utf8")
+    # write conf.py
+    content = f"""
+extensions = ["{g_app_name}"]
+external_toc_path = "_toc.yml"
+external_toc_exclude_missing = True
+external_toc_manifest = "_manifest.txt"
+exclude_patterns = ["unlisted.rst"]
+
+"""
+    src_dir.joinpath("conf.py").write_text(content, encoding="utf8")
+    # run sphinx
+    builder = sphinx_build_factory(src_dir)
+    builder.build()
+    exclude_patterns = builder.app.config.exclude_patterns
+    assert "extra.rst" in exclude_patterns
+    assert exclude_patterns.count("unlisted.rst") == 1
+
+
+def test_manifest_missing(tmp_path: Path, sphinx_build_factory):
+    """Test ``external_toc_manifest`` file not found is an error."""
+    # pytest --showlocals --log-level INFO -k "test_manifest_missing" tests
+    src_dir = tmp_path / "srcdir"
+    toc_path = Path(__file__).parent.joinpath("_toc_files", "basic.yml")
+    create_site_from_toc(toc_path, root_path=src_dir)
+    content = f"""
+extensions = ["{g_app_name}"]
+external_toc_path = "_toc.yml"
+external_toc_exclude_missing = True
+external_toc_manifest = "_manifest.txt"
+
+"""
+    src_dir.joinpath("conf.py").write_text(content, encoding="utf8")
+    with pytest.raises(ExtensionError, match="external_toc_manifest"):
+        sphinx_build_factory(src_dir)
+
+
+def test_loader_events(tmp_path: Path, sphinx_build_factory):
+    """Test ``external_toc_loader`` events loader builds."""
+    src_dir = tmp_path / "srcdir"
+    # write document files
+    toc_path = Path(__file__).parent.joinpath("_toc_files", "basic.yml")
+    create_site_from_toc(toc_path, root_path=src_dir)
+    # write conf.py
+    content = f"""
+extensions = ["{g_app_name}"]
+external_toc_path = "_toc.yml"
+external_toc_loader = "events"
+
+"""
+    src_dir.joinpath("conf.py").write_text(content, encoding="utf8")
+    # run sphinx
+    builder = sphinx_build_factory(src_dir)
+    builder.build()
+
+
+def test_profile(tmp_path: Path, sphinx_build_factory):
+    """Test ``external_toc_profile`` logs parse stats."""
+    src_dir = tmp_path / "srcdir"
+    # write document files
+    toc_path = Path(__file__).parent.joinpath("_toc_files", "basic.yml")
+    create_site_from_toc(toc_path, root_path=src_dir)
+    # write conf.py
+    content = f"""
+extensions = ["{g_app_name}"]
+external_toc_path = "_toc.yml"
+external_toc_exclude_missing = True
+external_toc_profile = True
+
+"""
+    src_dir.joinpath("conf.py").write_text(content, encoding="utf8")
+    # run sphinx
+    builder = sphinx_build_factory(src_dir)
+    builder.build()
+    assert "[etoc] ToC parse stats" in builder.status
+    assert "new_excluded" in builder.status
+
+
+def test_toctree_templates():
+    """Toctree options and items translated once. Immutable."""
+    # pytest --showlocals --log-level INFO -k "test_toctree_templates" tests
+    items = [
+        FileItem("a"),
+        GlobItem("g/*"),
+        UrlItem("https://example.com", "Example"),
+    ]
+    root = Document(
+        "index",
+        subtrees=[
+            TocTree(items, caption="Part", numbered=True, reversed=True),
+            TocTree([FileItem("b")], hidden=False, numbered=2),
+        ],
+    )
+    site_map = SiteMap(root)
+    site_map["a"] = Document("a", title="A")
+    site_map["b"] = Document("b")
+    # app is only needed by RefItem
+    templates = toctree_templates(None, site_map, root)
+    assert len(templates) == 2
+    template = templates[0]
+    assert isinstance(template, ToctreeTemplate)
+    attributes = dict(template.attributes)
+    assert attributes["numbered"] == 999
+    assert attributes["caption"] == attributes["rawcaption"] == "Part"
+    assert attributes["glob"] is True
+    assert [entry for _, entry in template.entries] == [
+        ("A", "a"),
+        "g/*",
+        ("Example", "https://example.com"),
+    ]
+    assert template.hidden is True
+    assert template.reversed is True
+    attributes = dict(templates[1].attributes)
+    assert attributes["numbered"] == 2
+    assert attributes["rawcaption"] == ""
+    assert attributes["glob"] is False
+    assert templates[1].hidden is False
+    with pytest.raises(AttributeError):
+        template.hidden = False
+
+
+def test_glob_table(tmp_path: Path, sphinx_build_factory):
+    """Globs expanded once per build. Table not pickled with the env."""
+    # pytest --showlocals --log-level INFO -k "test_glob_table" tests
+    src_dir = tmp_path / "srcdir"
+    # write document files
+    toc_path = Path(__file__).parent.joinpath("_toc_files", "glob.yml")
+    create_site_from_toc(toc_path, root_path=src_dir)
+    # write conf.py
+    content = f"""
+extensions = ["{g_app_name}"]
+external_toc_path = "_toc.yml"
+
+"""
+    src_dir.joinpath("conf.py").write_text(content, encoding="utf8")
+    # run sphinx
+    builder = sphinx_build_factory(src_dir)
+    tables = []
+
+    def _spy(app, env, docnames):
+        """Runs after build_glob_table and build_toctree_templates."""
+        tables.append(dict(env.external_toc_glob_table))
+        tables.append(dict(env.external_toc_templates))
+
+    builder.app.connect("env-before-read-docs", _spy, priority=900)
+    builder.build()
+    assert tables[0] == {"doc*": ("doc1", "doc2", "doc3")}
+    # only documents with toctrees
+    assert list(tables[1]) == ["intro"]
+    env = builder.app.env
+    assert env.external_toc_glob_table is None
+    assert env.external_toc_templates is None
+    doctree = env.get_doctree("intro")
+    toctrees = list(doctree.findall(toctree_node))
+    assert toctrees[0]["includefiles"] == ["doc1", "doc2", "doc3"]
+
+
+def test_ref_table(tmp_path: Path, sphinx_build_factory, monkeypatch):
+    """RefItem resolved once, hits and misses. Reused until an inventory changes."""
+    # pytest --showlocals --log-level INFO -k "test_ref_table" tests
+    src_dir = tmp_path / "srcdir"
+    # write document files
+    toc_path = Path(__file__).parent.joinpath("_toc_files", "basic_titles.yml")
+    create_site_from_toc(toc_path, root_path=src_dir)
+    # and a ref missing from the inventory
+    toc_text = src_dir.joinpath("_toc.yml").read_text(encoding="utf8")
+    toc_text = toc_text.replace(
+        "title: Source code\n", "title: Source code\n        - ref: not-a-ref\n"
+    )
+    src_dir.joinpath("_toc.yml").write_text(toc_text, encoding="utf8")
+    src_dir.joinpath("objects-test.inv").write_bytes(INVENTORY_V2)
+    # write conf.py
+    content = f"""
+extensions = ["{g_app_name}", "sphinx.ext.intersphinx"]
+external_toc_path = "_toc.yml"
+intersphinx_mapping = {{"test": ("https://docs.python.org/3", "objects-test.inv")}}
+
+"""
+    src_dir.joinpath("conf.py").write_text(content, encoding="utf8")
+    url = "https://docs.python.org/3/write_inventory/#The-Julia-Domain"
+    expected = {
+        ("The-Julia-Domain", "Source code"): ("Source code", url),
+        ("not-a-ref", None): ("", ""),
+    }
+    # run sphinx
+    builder = sphinx_build_factory(src_dir)
+    builder.build(assert_pass=False)
+    env = builder.app.env
+    inv_key, resolved = env.external_toc_ref_table
+    assert resolved == expected
+    doctree = env.get_doctree("doc3")
+    toctrees = list(doctree.findall(toctree_node))
+    assert ("Source code", url) in toctrees[0]["entries"]
+
+    # next build. Same inventory, refs not resolved again
+    def _fail(self, app):
+        """Ref table must be used."""
+        raise AssertionError("ref resolved again")
+
+    monkeypatch.setattr(RefItem, "render", _fail)
+    doc3_text = "Doc 3\n=====\n\nChanged\n"
+    src_dir.joinpath("doc3.rst").write_text(doc3_text, encoding="utf8")
+    builder = sphinx_build_factory(src_dir)
+    builder.build(assert_pass=False)
+    env = builder.app.env
+    assert env.external_toc_ref_table == (inv_key, expected)
+    doctree = env.get_doctree("doc3")
+    toctrees = list(doctree.findall(toctree_node))
+    assert ("Source code", url) in toctrees[0]["entries"]
+    monkeypatch.undo()
+
+    # inventory changed. Resolved again
+    env.external_toc_ref_table = (("changed",), {})
+    events.build_ref_table(builder.app, env, [])
+    assert env.external_toc_ref_table == (inv_key, expected)
+
+    # local inventory read again every build. Fetch time not in the key
+    cache = env.intersphinx_cache
+    for uri, (name, fetched, data) in list(cache.items()):
+        cache[uri] = (name, fetched + 86400, data)
+    assert inventory_key(builder.app) == inv_key
+    # local inventory file changed
+    path_inv = src_dir / "objects-test.inv"
+    st = path_inv.stat()
+    os.utime(path_inv, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert inventory_key(builder.app) != inv_key
+
+    # remote inventory. Key changes once fetched again
+    builder.app.config.intersphinx_mapping = {
+        "test": ("test", ("https://docs.python.org/3", (None,)))
+    }
+    inv_key_remote = inventory_key(builder.app)
+    assert inventory_key(builder.app) == inv_key_remote
+    for uri, (name, fetched, data) in list(cache.items()):
+        cache[uri] = (name, fetched + 86400, data)
+    assert inventory_key(builder.app) != inv_key_remote
@@ -0,0 +1,70 @@
+"""
+.. moduleauthor:: Dave Faulkmore <https://mastodon.social/@msftcangoblowme>
+
+Unittest of stats module
+
+Unit test -- Module
+
+.. code-block:: shell
+
+   python -m coverage run --source='sphinx_external_toc_strict.stats' -m pytest \
+   --showlocals tests/test_stats.py && coverage report \
+   --data-file=.coverage --include="**/stats.py"
+
+"""
+
+import json
+import shutil
+from pathlib import Path
+
+from sphinx_external_toc_strict.parsing_strictyaml import parse_toc_yaml
+from sphinx_external_toc_strict.stats import ParseStats
+
+PATH_TOC = Path(__file__).parent.joinpath("_toc_files", "basic.yml")
+
+
+def test_parse_stats_phase():
+    """Phase time accumulates."""
+    # pytest --showlocals --log-level INFO -k "test_parse_stats_phase" tests
+    stats = ParseStats()
+    with stats.phase("load"):
+        pass
+    elapsed = stats.times["load"]
+    with stats.phase("load"):
+        pass
+    assert stats.times["load"] >= elapsed
+    assert list(stats.times) == ["load"]
+
+
+def test_parse_toc_yaml_stats(tmp_path):
+    """Counts match the site map. Phases recorded."""
+    # pytest --showlocals --log-level INFO -k "test_parse_toc_yaml_stats" tests
+    stats = ParseStats()
+    site_map = parse_toc_yaml(PATH_TOC, stats=stats)
+
+    assert stats.documents == len(site_map)
+    toctrees = [toctree for doc in site_map.values() for toctree in doc.subtrees]
+    assert stats.toctrees == len(toctrees)
+    assert sum(stats.items.values()) == sum(len(tree.items) for tree in toctrees)
+    assert stats.items["FileItem"] == len(site_map) - 1
+    # basic.yml has toctree options, e.g. caption and numbered
+    assert stats.scalars_coerced > 0
+    assert {"load", "include", "parse", "coerce", "construct"} <= set(stats.times)
+
+    d_stats = stats.as_json()
+    assert json.loads(json.dumps(d_stats)) == d_stats
+    str_stats = stats.format()
+    assert "documents" in str_stats
+    assert "FileItem" in str_stats
+
+    # cache hit. Counts still available. Not parsed
+    path_toc = tmp_path / "_toc.yml"
+    shutil.copyfile(PATH_TOC, path_toc)
+    cache_dir = tmp_path / "cache"
+    parse_toc_yaml(path_toc, cache_dir=cache_dir)
+    stats_cached = ParseStats()
+    parse_toc_yaml(path_toc, cache_dir=cache_dir, stats=stats_cached)
+    assert stats_cached.documents == stats.documents
+    assert stats_cached.items == stats.items
+    assert stats_cached.scalars_coerced == 0
+    assert list(stats_cached.times) == ["cache"]
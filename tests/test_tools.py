@@ -22,6 +22,7 @@ from pathlib import Path
 
 import pytest
 
+from sphinx_external_toc_strict.compact import CompactSiteMap
 from sphinx_external_toc_strict.parsing_strictyaml import parse_toc_data
 from sphinx_external_toc_strict.tools_strictyaml import (
     _assess_folder,
@@ -153,6 +154,16 @@ def test_create_site_map_from_path(
 
     # act
     site_map = create_site_map_from_path(tmp_path)
+    #    manifest rather than folder walk. Same site map
+    site_map_manifest = create_site_map_from_path(tmp_path, manifest=files)
+    assert site_map_manifest.as_json() == site_map.as_json()
+    #    compact site map. Same site map
+    site_map_compact = create_site_map_from_path(tmp_path, compact=True)
+    assert isinstance(site_map_compact, CompactSiteMap)
+    assert site_map_compact.as_json() == site_map.as_json()
+    #    titles from file names. Documents are views, set again
+    site_map_guess_titles(site_map_compact, "index", is_guess=True)
+    assert site_map_compact["subfolder2/other"].title == "Other"
 
     # verify doc count
     docs = site_map._docs.values()